@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+"""
+Author:
+    lprtk
+
+Description:
+    Benchmark suite of the pyTCTK library. Synthetic corpora of a given size,
+    language and kind are generated, every public method of the TextNet,
+    WordNet and Tokenize classes is timed on them, and the throughput (rows/s
+    and MB/s) and the peak memory of each method are stored in a JSON file.
+    A previous JSON file can be given to compare two versions: the run fails
+    if a method is slower than the threshold.
+
+    Example of use:
+        $ python benchmark.py --rows 100000 --language french --kind tweets
+        $ python benchmark.py --output new.json --baseline old.json --threshold 0.2
+
+License:
+    MIT License
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "codefile")
+)
+
+import pyTCTK
+
+
+#------------------------------------------------------------------------------
+
+
+_WORDS = {
+    "english": [
+        "the", "a", "was", "were", "been", "running", "dogs", "houses", "people",
+        "bought", "children", "data", "science", "is", "about", "cleaning",
+        "text", "with", "python", "and", "some", "very", "long", "sentences",
+        "I'm", "don't", "it's", "better", "than", "nothing", "today", "ponies"
+    ],
+    "french": [
+        "le", "la", "les", "était", "été", "sommes", "suis", "allé", "école",
+        "garçon", "élèves", "où", "ça", "données", "nettoyage", "du", "texte",
+        "avec", "python", "et", "des", "phrases", "très", "longues", "aujourd'hui",
+        "l'été", "c'est", "mieux", "que", "rien", "chevaux", "Œuvre"
+    ]
+}
+_NOISE = {
+    "tweets": [
+        "@user", "#hashtag", "😂", "🤔", "http://t.co/abc123", "www.site.com",
+        "!!", "?", "...", "123", "me@mail.com", "  "
+    ],
+    "html": [
+        "<p>", "</p>", "<b>", "</b>", "<a href='http://x.com'>", "</a>",
+        "<br/>", "&nbsp;", "©", "™"
+    ],
+    "long": [
+        ",", ".", ";", "(", ")", "-", "’", "…", "\n", "\t", "42", "1999"
+    ]
+}
+_LENGTHS = {
+    "tweets": (5, 25),
+    "html": (20, 80),
+    "long": (150, 400)
+}
+
+
+def generate_corpus(rows: int=10000, language: str="english", kind: str="tweets",
+                    seed: int=0) -> pd.core.frame.DataFrame:
+    """
+    Function that allows to generate a synthetic corpus.
+
+    Parameters
+    ----------
+    rows : int, optional, default=10000
+        Number of sentences. Default is 10000.
+
+    language : {"english", "french"}, str, optional, default="english"
+        Language of the words. Default is "english".
+
+    kind : {"tweets", "html", "long"}, str, optional, default="tweets"
+        - If "tweets", short sentences with mentions, hashtags, emojis and urls.
+        - If "html", sentences with HTML tags and entities.
+        - If "long", long documents with punctuation.
+        Default is "tweets".
+
+    seed : int, optional, default=0
+        Seed of the random generator, the same seed gives the same corpus.
+        Default is 0.
+
+    Raises
+    ------
+    ValueError
+        - To use this function, the 'language' parameter must be {"english", "french"}.
+        - To use this function, the 'kind' parameter must be {"tweets", "html", "long"}.
+
+    Returns
+    -------
+    dataframe_corpus : pandas.core.frame.DataFrame
+        Corpus with a single "Text" column.
+
+    """
+    if language not in _WORDS:
+        raise ValueError(
+            "'language' parameter must be in {'english', 'french'}: default='english'"
+        )
+
+    if kind not in _NOISE:
+        raise ValueError(
+            "'kind' parameter must be in {'tweets', 'html', 'long'}: default='tweets'"
+        )
+
+    generator = random.Random(seed)
+    words = _WORDS[language]
+    noise = _NOISE[kind]
+    (min_length, max_length) = _LENGTHS[kind]
+    list_texts = []
+
+    for i in range(0, rows):
+        list_texts.append(
+            " ".join(
+                [
+                    generator.choice(noise) if generator.random() < 0.2 else generator.choice(words)
+                    for j in range(0, generator.randint(min_length, max_length))
+                ]
+            )
+        )
+
+    dataframe_corpus = pd.DataFrame(
+        {
+            "Text": list_texts
+        }
+    )
+
+    return dataframe_corpus
+
+
+def list_cases(language: str="english") -> list:
+    """
+    Function that allows to list the methods to benchmark: every public method
+    of the TextNet, WordNet and Tokenize classes, with the arguments used.
+
+    Parameters
+    ----------
+    language : {"english", "french"}, str, optional, default="english"
+        Language given to the WordNet methods. Default is "english".
+
+    Returns
+    -------
+    list_cases : list
+        List of (name, class, method, parameters) tuples.
+
+    """
+    list_cases = []
+
+    for cls in [pyTCTK.TextNet, pyTCTK.WordNet, pyTCTK.Tokenize]:
+        for method, function in inspect.getmembers(cls, inspect.isfunction):
+            if method.startswith("_") or method in ["lazy", "memory_info"]:
+                continue
+            else:
+                pass
+
+            if "language" in inspect.signature(function).parameters:
+                parameters = {"language": language}
+            else:
+                parameters = {}
+
+            list_cases.append(
+                (f"{cls.__name__}.{method}", cls, method, parameters)
+            )
+
+    return list_cases
+
+
+def run_case(corpus: pd.core.frame.DataFrame, cls, method: str, parameters: dict,
+             repeat: int=3) -> dict:
+    """
+    Function that allows to time a method on a corpus.
+
+    Parameters
+    ----------
+    corpus : pandas.core.frame.DataFrame
+        Corpus to clean, it is copied before each run.
+
+    cls : type
+        TextNet, WordNet or Tokenize class.
+
+    method : str
+        Name of the method.
+
+    parameters : dict
+        Arguments of the method.
+
+    repeat : int, optional, default=3
+        Number of runs, the best time is kept. Default is 3.
+
+    Returns
+    -------
+    dict_result : dict
+        Best time in seconds, rows/s, MB/s and peak memory in MB.
+
+    """
+    rows = corpus.shape[0]
+    size = sum(len(text.encode("utf-8")) for text in corpus["Text"].tolist()) / 1e6
+
+    if method == "word_detokenize":
+        corpus = pyTCTK.Tokenize(data=corpus.copy(), column="Text").word_tokenize()
+    else:
+        pass
+
+    # a first run loads the lexicons, so they are not part of the timings
+    getattr(cls(data=corpus.copy(), column="Text"), method)(**parameters)
+    best = float("inf")
+
+    for i in range(0, repeat):
+        data = corpus.copy()
+        start = time.perf_counter()
+        getattr(cls(data=data, column="Text"), method)(**parameters)
+        best = min(best, time.perf_counter() - start)
+
+    data = corpus.copy()
+    tracemalloc.start()
+    getattr(cls(data=data, column="Text"), method)(**parameters)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+
+    dict_result = {
+        "seconds": best,
+        "rows_per_second": rows / best if best > 0 else None,
+        "mb_per_second": size / best if best > 0 else None,
+        "peak_memory_mb": peak
+    }
+
+    return dict_result
+
+
+def run_benchmark(rows: int=10000, languages: list=None, kinds: list=None,
+                  repeat: int=3, methods: list=None) -> dict:
+    """
+    Function that allows to run the benchmark suite.
+
+    Parameters
+    ----------
+    rows : int, optional, default=10000
+        Number of sentences of each corpus. Default is 10000.
+
+    languages : list, optional, default=None
+        Languages of the corpora. If None, ["english", "french"].
+        Default is None.
+
+    kinds : list, optional, default=None
+        Kinds of the corpora. If None, ["tweets", "html", "long"].
+        Default is None.
+
+    repeat : int, optional, default=3
+        Number of runs of each method. Default is 3.
+
+    methods : list, optional, default=None
+        If not None, only the methods whose name contains one of these
+        strings are run (e.g. ["lemmatize", "TextNet.remove_url"]).
+        Default is None.
+
+    Returns
+    -------
+    dict_results : dict
+        Description of the run and results {corpus: {method: result}}.
+
+    """
+    dict_results = {
+        "pyTCTK": pyTCTK.__file__,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "rows": rows,
+        "repeat": repeat,
+        "results": {}
+    }
+
+    for language in languages or ["english", "french"]:
+        for kind in kinds or ["tweets", "html", "long"]:
+            corpus = generate_corpus(rows=rows, language=language, kind=kind)
+            key = f"{language}-{kind}"
+            dict_results["results"][key] = {}
+
+            for (name, cls, method, parameters) in list_cases(language=language):
+                if methods and not any(pattern in name for pattern in methods):
+                    continue
+                else:
+                    pass
+
+                dict_results["results"][key][name] = run_case(
+                    corpus=corpus,
+                    cls=cls,
+                    method=method,
+                    parameters=parameters,
+                    repeat=repeat
+                )
+                print(
+                    f"{key:<16} {name:<34} "
+                    f"{dict_results['results'][key][name]['rows_per_second']:>12.0f} rows/s"
+                )
+
+    return dict_results
+
+
+def compare(results: dict, baseline: dict, threshold: float=0.2) -> list:
+    """
+    Function that allows to compare the results of two runs.
+
+    Parameters
+    ----------
+    results : dict
+        Results of the new run.
+
+    baseline : dict
+        Results of the previous run.
+
+    threshold : float, optional, default=0.2
+        Maximal slowdown allowed, as a share of the previous throughput.
+        Default is 0.2 (20% slower).
+
+    Returns
+    -------
+    list_regressions : list
+        List of (corpus, method, previous rows/s, new rows/s) tuples of the
+        methods slower than the threshold.
+
+    """
+    list_regressions = []
+
+    for key, dict_methods in results["results"].items():
+        for name, dict_result in dict_methods.items():
+            previous = baseline.get("results", {}).get(key, {}).get(name)
+
+            if previous == None or not previous["rows_per_second"]:
+                continue
+            else:
+                pass
+
+            if dict_result["rows_per_second"] < (1 - threshold) * previous["rows_per_second"]:
+                list_regressions.append(
+                    (key, name, previous["rows_per_second"], dict_result["rows_per_second"])
+                )
+            else:
+                pass
+
+    return list_regressions
+
+
+def main(argv: list=None) -> int:
+    """
+    Function that allows to run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional, default=None
+        Arguments of the command line. If None, sys.argv is used.
+        Default is None.
+
+    Returns
+    -------
+    code : int
+        0 if there is no regression, 1 otherwise.
+
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite of pyTCTK.")
+    parser.add_argument("--rows", type=int, default=10000,
+                        help="number of sentences of each corpus")
+    parser.add_argument("--language", action="append", choices=["english", "french"],
+                        help="language of the corpora (repeatable)")
+    parser.add_argument("--kind", action="append", choices=["tweets", "html", "long"],
+                        help="kind of the corpora (repeatable)")
+    parser.add_argument("--method", action="append",
+                        help="only run the methods containing this string (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of runs of each method")
+    parser.add_argument("--output", default="benchmark.json",
+                        help="JSON file where the results are stored")
+    parser.add_argument("--baseline",
+                        help="JSON file of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="maximal slowdown allowed compared to the baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        rows=args.rows,
+        languages=args.language,
+        kinds=args.kind,
+        repeat=args.repeat,
+        methods=args.method
+    )
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        list_regressions = compare(
+            results=results,
+            baseline=baseline,
+            threshold=args.threshold
+        )
+
+        for (key, name, previous, new) in list_regressions:
+            print(f"REGRESSION {key} {name}: {previous:.0f} -> {new:.0f} rows/s")
+
+        return 1 if list_regressions else 0
+    else:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
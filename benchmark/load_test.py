@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Author:
+    lprtk
+
+Description:
+    Load test of the AsyncCleaner class of the pyTCTK library. A local stand-in
+    for an async web service sends the sentences of a synthetic corpus one by
+    one, at a given rate (Poisson arrivals), and measures the latency of each
+    request: from the moment it is sent to the moment its cleaned sentence is
+    received. The same load is sent to an AsyncCleaner (micro-batches) and to
+    a direct mode (one executor call per request), and the p50, p90, p99 and
+    maximal latencies and the throughput of both are printed.
+
+    Example of use:
+        $ python load_test.py --requests 20000 --rate 5000
+        $ python load_test.py --max-batch 128 --max-delay 0.005 --language french
+
+License:
+    MIT License
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "codefile")
+)
+
+import pyTCTK
+from benchmark import generate_corpus
+
+
+#------------------------------------------------------------------------------
+
+
+_STEPS = [
+    "lowercase",
+    "remove_url",
+    "remove_mention",
+    "remove_hastag",
+    "remove_emoji",
+    "remove_punctuation",
+    "remove_whitespace",
+    "remove_stopword"
+]
+
+
+#------------------------------------------------------------------------------
+
+
+async def send_load(clean, texts: list, rate: float, seed: int=0) -> tuple:
+    """
+    Function that allows to send the requests of a load test. The requests
+    are sent at the times of a Poisson process of the given rate, without
+    waiting for the previous answers (open loop), as the clients of a web
+    service do.
+
+    Parameters
+    ----------
+    clean : callable
+        Coroutine function called with a sentence, returning it cleaned.
+
+    texts : list
+        Sentences to send, one per request.
+
+    rate : float
+        Mean number of requests sent per second.
+
+    seed : int, optional, default=0
+        Seed of the random generator of the arrival times. Default is 0.
+
+    Returns
+    -------
+    (latencies, seconds) : tuple
+        Latency of each request in seconds, and duration of the test.
+
+    """
+    generator = random.Random(seed)
+    latencies = [0.0] * len(texts)
+
+    async def request(i: int, text: str) -> None:
+        start = time.perf_counter()
+        await clean(text)
+        latencies[i] = time.perf_counter() - start
+
+    list_tasks = []
+    start = time.perf_counter()
+    arrival = 0.0
+
+    for (i, text) in enumerate(texts):
+        arrival += generator.expovariate(rate)
+        delay = start + arrival - time.perf_counter()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            pass
+
+        list_tasks.append(asyncio.ensure_future(request(i, text)))
+
+    await asyncio.gather(*list_tasks)
+
+    return (latencies, time.perf_counter() - start)
+
+
+def summarize(latencies: list, seconds: float) -> dict:
+    """
+    Function that allows to summarize the latencies of a load test.
+
+    Parameters
+    ----------
+    latencies : list
+        Latency of each request in seconds.
+
+    seconds : float
+        Duration of the test.
+
+    Returns
+    -------
+    dict_summary : dict
+        p50, p90, p99 and maximal latencies in milliseconds, and number of
+        requests answered per second.
+
+    """
+    array = np.array(latencies) * 1000
+
+    return {
+        "p50_ms": round(float(np.percentile(array, 50)), 3),
+        "p90_ms": round(float(np.percentile(array, 90)), 3),
+        "p99_ms": round(float(np.percentile(array, 99)), 3),
+        "max_ms": round(float(array.max()), 3),
+        "requests_per_s": round(len(latencies) / seconds, 1)
+    }
+
+
+async def run_load_test(requests: int=10000, rate: float=2000.0, max_batch: int=64,
+                        max_delay: float=0.002, n_jobs: int=1, language: str="english",
+                        kind: str="tweets") -> dict:
+    """
+    Function that allows to run the same load on an AsyncCleaner and in the
+    direct mode.
+
+    Parameters
+    ----------
+    requests : int, optional, default=10000
+        Number of requests sent. Default is 10000.
+
+    rate : float, optional, default=2000.0
+        Mean number of requests sent per second. Default is 2000.0.
+
+    max_batch : int, optional, default=64
+        See AsyncCleaner. Default is 64.
+
+    max_delay : float, optional, default=0.002
+        See AsyncCleaner. Default is 0.002.
+
+    n_jobs : int, optional, default=1
+        See AsyncCleaner. Default is 1.
+
+    language : {"english", "french"}, str, optional, default="english"
+        Language of the corpus. Default is "english".
+
+    kind : {"tweets", "html", "long"}, str, optional, default="tweets"
+        Kind of the corpus, see generate_corpus. Default is "tweets".
+
+    Returns
+    -------
+    dict_results : dict
+        Summary of each mode, see summarize.
+
+    """
+    texts = generate_corpus(rows=requests, language=language, kind=kind)["Text"].tolist()
+    steps = [
+        (step, {"language": language}) if step == "remove_stopword" else step for step in _STEPS
+    ]
+    dict_results = {}
+
+    # direct mode: one executor call per request, as without AsyncCleaner
+    function = pyTCTK.Pipeline(steps=steps).transform_iter
+    loop = asyncio.get_running_loop()
+
+    async def clean_direct(text: str):
+        return await loop.run_in_executor(None, lambda: next(function([text])))
+
+    (latencies, seconds) = await send_load(clean=clean_direct, texts=texts, rate=rate)
+    dict_results["direct"] = summarize(latencies=latencies, seconds=seconds)
+
+    async with pyTCTK.AsyncCleaner(steps=steps, max_batch=max_batch, max_delay=max_delay,
+                                   n_jobs=n_jobs) as cleaner:
+        (latencies, seconds) = await send_load(clean=cleaner.clean, texts=texts, rate=rate)
+        dict_results["batched"] = summarize(latencies=latencies, seconds=seconds)
+        dict_results["batched"].update(cleaner.info())
+
+    return dict_results
+
+
+def main(argv: list=None) -> int:
+    """
+    Function that allows to run the load test from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional, default=None
+        Arguments of the command line. If None, sys.argv is used.
+        Default is None.
+
+    Returns
+    -------
+    code : int
+        0.
+
+    """
+    parser = argparse.ArgumentParser(description="Load test of the pyTCTK AsyncCleaner.")
+    parser.add_argument("--requests", type=int, default=10000,
+                        help="number of requests sent")
+    parser.add_argument("--rate", type=float, default=2000.0,
+                        help="mean number of requests sent per second")
+    parser.add_argument("--max-batch", type=int, default=64,
+                        help="maximal size of a batch")
+    parser.add_argument("--max-delay", type=float, default=0.002,
+                        help="maximal wait of a request for its batch, in seconds")
+    parser.add_argument("--n-jobs", type=int, default=1,
+                        help="number of processes cleaning the batches")
+    parser.add_argument("--language", choices=["english", "french"], default="english",
+                        help="language of the corpus")
+    parser.add_argument("--kind", choices=["tweets", "html", "long"], default="tweets",
+                        help="kind of the corpus")
+    args = parser.parse_args(argv)
+
+    dict_results = asyncio.run(
+        run_load_test(
+            requests=args.requests,
+            rate=args.rate,
+            max_batch=args.max_batch,
+            max_delay=args.max_delay,
+            n_jobs=args.n_jobs,
+            language=args.language,
+            kind=args.kind
+        )
+    )
+
+    print(json.dumps(dict_results, indent=4))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
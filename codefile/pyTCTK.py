@@ -7,47 +7,73 @@ Description:
     It is a Python library to perform text cleaning. The purpose of this library
     is to give tools to prepare your text data without having to install anything.
     Some text cleaning libraries can't be used on professional computers because
-    they need to download files from servers. With pyTCTK, you just need Python
-    and access to GitHub.
+    they need to download files from servers. With pyTCTK, you just need Python:
+    the vocabulary files are read from the 'ressources' folder shipped with the
+    library (GitHub is only used if this folder is missing).
 
 License:
     MIT License
 """
 
+import argparse
+import asyncio
+import codecs
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import functools
+import hashlib
+import inspect
+import io
+import json
+import mmap
 import numpy as np
 import os
 import pandas as pd
+import pickle
 import re
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import unicodedata
 from urllib import request
+import zlib
 
 
 #------------------------------------------------------------------------------
 
 
-class TextNet:
-    def __init__(self, data, column: str) -> None:
+class Profiler:
+    def __init__(self, callbacks: list=None, memory: bool=False) -> None:
         """
-        Function that allows to build the TextNet class and initialise the
-        parameters.
+        Function that allows to build the Profiler class and initialise the
+        parameters. While a profiler is active, each call to a method of the
+        TextNet, WordNet and Tokenize classes is measured: wall time, rows
+        and characters before and after the cleaning, and memory. When no
+        profiler is active, the methods are not slowed down.
+        
+        Example of use: >>> with Profiler() as profiler:
+                        ...     TextNet(data, "Text").remove_url()
+                        >>> profiler.report()
 
         Parameters
         ----------
-        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
-            Dataset to be cleaned.
-        
-        column : str
-            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
-            parameter should be the 
-            name assigned to the column to clean.
-            - If 'data' parameter is a pandas.core.series.Series, 'column'
-            parameter will be its output name.
+        callbacks : list, optional, default=None
+            Functions called with the record (dict) of each call, as soon as
+            the call ends. Default is None.
         
+        memory : bool, optional, default=False
+            If true, the memory allocated by each call is measured with
+            tracemalloc (this slows down the cleaning). Default is False.
+
         Raises
         ------
         TypeError
-            - To use this class, the 'data' parameter must be a
-            pandas.core.frame.DataFrame or pandas.cores.series.Series.
-            - To use this class, the 'column' parameter must be a string.
+            - To use this class, the 'callbacks' parameter must be None or a list.
+            - To use this class, the 'memory' parameter must be a boolean.
 
         Returns
         -------
@@ -55,431 +81,501 @@ class TextNet:
             NoneType.
 
         """
-        if isinstance(data, pd.core.frame.DataFrame):
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
-        elif isinstance(data, pd.core.series.Series):
-            data.to_frame(
-                name=column
-            )
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
+        if isinstance(callbacks, list):
+            self.callbacks = list(callbacks)
+        elif callbacks == None:
+            self.callbacks = []
         else:
             raise TypeError(
-                f"'data' parameter must be a pandas.core.frame.DataFrame or pandas.cores.series.Series: got {type(data)}"
+                f"'callbacks' parameter must be None or a list: got {type(callbacks)}"
             )
         
-        if isinstance(column, str):
-            self.column = column
+        if isinstance(memory, bool):
+            self.memory = memory
         else:
             raise TypeError(
-                f"'column' parameter must be a str: got {type(column)}"
+                f"'memory' parameter must be a bool: got {type(memory)}"
             )
+        
+        self.records = []
+        self._tracemalloc = False
+    
+    
+    def __enter__(self):
+        self.start()
+        
+        return self
     
     
-    def downcast(self, category: bool=False) -> pd.core.frame.DataFrame:
+    def __exit__(self, *args) -> None:
+        self.stop()
+    
+    
+    def start(self) -> None:
         """
-        Function that allows to cast the format of each column of a
-        pandas.core.frame.DataFrame to optimize the RAM storage space.
-
-        Parameters
-        ----------
-        category : bool, optional, default=False
-            With Pandas, you can choose category or object to cast the type of
-            a text. If category=False, then the text will be considered as an
-            object otherwise as a category. Default is False.
-
-        Raises
-        ------
-        TypeError
-            To use this function, the 'category' parameter must be a boolean.
+        Function that allows to activate the profiler.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset optimized.
+        None
+            NoneType.
 
         """
-        if isinstance(category, bool):
-            pass
-        else:
-            raise TypeError(
-                f"'category' parameter must be a bool: got {type(category)}"
-            )
-        
-        columns = self.data.dtypes.index.tolist()
-        types = self.data.dtypes.values.tolist()
-        
-        for i, t in enumerate(types):
-            # interger format
-            if "int" in str(t):
-                if self.data[columns[i]].min() > np.iinfo(np.int8).min and\
-                    self.data[columns[i]].max() < np.iinfo(np.int8).max:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.int8)
-                elif self.data[columns[i]].min() > np.iinfo(np.int16).min and\
-                    self.data[columns[i]].max() < np.iinfo(np.int16).max:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.int16)
-                elif self.data[columns[i]].min() > np.iinfo(np.int32).min and\
-                    self.data[columns[i]].max() < np.iinfo(np.int32).max:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.int32)
-                else:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.int64)
-            # float format
-            elif "float" in str(t):
-                if self.data[columns[i]].min() > np.finfo(np.float16).min and\
-                    self.data[columns[i]].max() < np.finfo(np.float16).max:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.float16)
-                elif self.data[columns[i]].min() > np.finfo(np.float32).min and\
-                    self.data[columns[i]].max() < np.finfo(np.float32).max:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.float32)
-                else:
-                    self.data[columns[i]] = self.data[columns[i]].astype(np.float64)
-            # object format
-            elif "object" in str(t):
-                # timestamp format
-                if columns[i] in ["date", "Date", "DATE", "dates", "Dates", "DATES"]:
-                    self.data[columns[i]] = pd.to_datetime(
-                        self.data[columns[i]],
-                        format="%Y-%m-%d"
-                    )
-                else:
-                    if category == False:
-                        self.data[columns[i]] = self.data[columns[i]].astype("object")
-                    else:
-                        self.data[columns[i]] = self.data[columns[i]].astype("category")
+        with _PROFILERS_LOCK:
+            if self not in _PROFILERS:
+                _PROFILERS.append(self)
+            else:
+                pass
         
-        return self.data
+        if self.memory == True and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracemalloc = True
+        else:
+            pass
     
     
-    def lowercase(self) -> pd.core.frame.DataFrame:
+    def stop(self) -> None:
         """
-        Function that allows to transform to lowercase each word from a sentence
-        in a dataset.
+        Function that allows to deactivate the profiler. Its records are kept.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        None
+            NoneType.
 
         """
-        self.data[self.column] = self.data[self.column].str.lower()
+        with _PROFILERS_LOCK:
+            if self in _PROFILERS:
+                _PROFILERS.remove(self)
+            else:
+                pass
         
-        return self.data
+        if self._tracemalloc == True:
+            tracemalloc.stop()
+            self._tracemalloc = False
+        else:
+            pass
     
     
-    def word_count_filter(self, min_words: int=2) -> pd.core.frame.DataFrame:
+    def add_callback(self, callback) -> None:
         """
-        Function that allows to filter the number of words for each sentence in
-        a dataset.
+        Function that allows to add a function called with the record of
+        each call.
 
         Parameters
         ----------
-        min_words : int, optional, default=2
-            Number of words at least the length of the sentence should make.
-            Default is 2.
-
-        Raises
-        ------
-        TypeError
-            To use this function, the 'min_words' parameter must be a integer.
+        callback : callable
+            Function called with a dict with the keys "method", "seconds",
+            "rows_in", "rows_out", "chars_in", "chars_out", "memory_delta"
+            and "memory_peak" (bytes, None if memory is not measured).
 
         Returns
         -------
-        dataframe_filter : pandas.core.frame.DataFrame
-            Dataset filtered.
+        None
+            NoneType.
 
         """
-        if isinstance(min_words, int):
-            pass
-        else:
-            raise TypeError(
-                f"'min_words' parameter must be an int: got {type(min_words)}"
-            )
-        
-        list_wc = []
-        
-        for i in range(0, self.data[self.column].shape[0]):
-            list_wc.append(
-                len(
-                    self.data[self.column][i].split(" ")
-                )
-            )
-        
-        dataframe_wc = pd.DataFrame(
-            {
-                "Word count": list_wc
-            }
-        )
-        dataframe_filter = pd.concat(
-            [
-                self.data, dataframe_wc["Word count"]
-            ],
-            axis=1
-        )
-        dataframe_filter = dataframe_filter[
-            dataframe_filter["Word count"] > min_words
-        ]
-        dataframe_filter.drop("Word count", axis=1, inplace=True)
-        dataframe_filter.reset_index(drop=True, inplace=True)
-        
-        return dataframe_filter
+        self.callbacks.append(callback)
     
     
-    def remove_punctuation(self) -> pd.core.frame.DataFrame:
+    def record(self, dict_record: dict) -> None:
         """
-        Function that allows to remove all punctuation marks (./,;?!#~\@) from
-        each sentence in a dataset.
+        Function that allows to store the record of a call and to give it to
+        the callbacks.
+
+        Parameters
+        ----------
+        dict_record : dict
+            Record of the call.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        None
+            NoneType.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"[^\w\s\-–'‘’]",
-                "",
-                self.data[self.column][i]
-            )
-            
-            self.data[self.column][i] = re.sub(
-                r"[-–'‘’]",
-                " ",
-                self.data[self.column][i]
-            )
+        self.records.append(dict_record)
         
-        return self.data
+        for callback in self.callbacks:
+            callback(dict_record)
     
     
-    def remove_url(self) -> pd.core.frame.DataFrame:
+    def report(self) -> pd.core.frame.DataFrame:
         """
-        Function that allows to remove all Uniform Resource Locators (URLs) from
-        each sentence in a dataset.
+        Function that allows to summarise the records by method.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        dataframe_report : pandas.core.frame.DataFrame
+            One row per method with its number of calls, its total time, its
+            rows, its characters before and after the cleaning, its memory
+            (NaN if it is not measured), and its throughput in rows per
+            second. Sorted by time.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"https?://\S+|www\.\S+",
-                "",
-                self.data[self.column][i],
-                flags=re.IGNORECASE
-            )
+        columns = [
+            "method", "seconds", "rows_in", "rows_out", "chars_in", "chars_out",
+            "memory_delta", "memory_peak"
+        ]
+        dataframe_records = pd.DataFrame(self.records, columns=columns)
         
-        return self.data
-    
-    
-    def remove_html(self) -> pd.core.frame.DataFrame:
-        """
-        Function that allows to remove all HTML tags (<...> or </...>) from each
-        sentence in a dataset.
+        # the memory not measured (None) stays NaN, unlike a sum of 0 bytes
+        for column in ["memory_delta", "memory_peak"]:
+            dataframe_records[column] = dataframe_records[column].astype(float)
+        
+        dataframe_report = dataframe_records.groupby("method").agg(
+            calls=("seconds", "size"),
+            seconds=("seconds", "sum"),
+            rows_in=("rows_in", "sum"),
+            rows_out=("rows_out", "sum"),
+            chars_in=("chars_in", "sum"),
+            chars_out=("chars_out", "sum"),
+            memory_delta=("memory_delta", functools.partial(pd.Series.sum, min_count=1)),
+            memory_peak=("memory_peak", "max")
+        )
+        dataframe_report["rows_per_second"] = (
+            dataframe_report["rows_in"] / dataframe_report["seconds"]
+        )
+        dataframe_report = dataframe_report.sort_values(
+            "seconds",
+            ascending=False
+        ).reset_index()
+        
+        return dataframe_report
 
-        Returns
-        -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
 
-        """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"<.*?>",
-                "",
-                self.data[self.column][i],
-                flags=re.IGNORECASE
-            )
+def _instrument(function):
+    """
+    Hidden decorator that allows the active profilers to measure the calls
+    to a cleaning method. Without an active profiler, the method is called
+    directly.
+
+    Parameters
+    ----------
+    function : callable
+        Cleaning method of the TextNet, WordNet or Tokenize class.
+
+    Returns
+    -------
+    wrapper : callable
+        Cleaning method measured.
+
+    """
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if not _PROFILERS:
+            return function(self, *args, **kwargs)
+        else:
+            pass
         
-        return self.data
-    
+        values = self.data[self.column].tolist()
+        rows_in = len(values)
+        chars_in = _count_characters(values=values)
+        
+        if tracemalloc.is_tracing():
+            memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        else:
+            memory_start = None
+        
+        start = time.perf_counter()
+        result = function(self, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        
+        if memory_start != None:
+            (memory_end, memory_peak) = tracemalloc.get_traced_memory()
+            memory_delta = memory_end - memory_start
+            memory_peak = memory_peak - memory_start
+        else:
+            (memory_delta, memory_peak) = (None, None)
+        
+        if isinstance(result, pd.core.frame.DataFrame) and self.column in result:
+            values = result[self.column].tolist()
+        else:
+            values = self.data[self.column].tolist()
+        
+        dict_record = {
+            "method": f"{type(self).__name__}.{function.__name__}",
+            "seconds": seconds,
+            "rows_in": rows_in,
+            "rows_out": len(values),
+            "chars_in": chars_in,
+            "chars_out": _count_characters(values=values),
+            "memory_delta": memory_delta,
+            "memory_peak": memory_peak
+        }
+        
+        for profiler in list(_PROFILERS):
+            profiler.record(dict_record=dict_record)
+        
+        return result
     
-    def remove_email(self) -> pd.core.frame.DataFrame:
-        """
-        Function that allows to remove all email adresses (...@...) from each
-        sentence in a dataset.
+    return wrapper
 
-        Returns
-        -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
 
-        """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
-                "",
-                self.data[self.column][i],
-                flags=re.IGNORECASE
-            )
-        
-        return self.data
+def _count_characters(values: list) -> int:
+    """
+    Hidden function that allows to count the characters of a column, the
+    characters of the tokens for a tokenized column.
+
+    Parameters
+    ----------
+    values : list
+        Rows of the column.
+
+    Returns
+    -------
+    characters : int
+        Number of characters.
+
+    """
+    characters = 0
     
+    for value in values:
+        if isinstance(value, str):
+            characters += len(value)
+        elif isinstance(value, list):
+            characters += sum(len(token) for token in value if isinstance(token, str))
+        else:
+            pass
     
-    def remove_digit(self) -> pd.core.frame.DataFrame:
-        """
-        Function that allows to remove all digits ([0-9]) from each sentence in
-        a dataset.
+    return characters
+
+
+_PROFILERS = []
+_PROFILERS_LOCK = threading.Lock()
+
+
+#------------------------------------------------------------------------------
 
-        Returns
-        -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
 
+class _BaseNet:
+    def _set_data(self, data, column: str, inplace: bool=True) -> None:
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"\d+",
-                "",
-                self.data[self.column][i]
-            )
+        Hidden function that allows to check and initialise the dataset shared
+        by the TextNet, WordNet and Tokenize classes. The index of the dataset
+        is kept: the cleaned column is written back by position.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
+            Dataset to be cleaned.
         
-        return self.data
-    
-    
-    def remove_space(self) -> pd.core.frame.DataFrame:
-        """
-        Function that allows to remove the spaces at the beginning and end of
-        each sentence in a dataset.
+        column : str
+            Name of the column to clean, or output name of a Series.
+        
+        inplace : bool, optional, default=True
+            If false, a DataFrame is not modified: a shallow copy is cleaned
+            instead, only the cleaned column is replaced in it.
+            Default is True.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'data' parameter must be a
+            pandas.core.frame.DataFrame or pandas.cores.series.Series.
+            - To use this function, the 'column' parameter must be a string.
+            - To use this function, the 'inplace' parameter must be a boolean.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        None
+            NoneType.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = self.data[self.column][i].strip()
-        
-        return self.data
+        if isinstance(inplace, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'inplace' parameter must be a bool: got {type(inplace)}"
+            )
+        
+        if isinstance(data, pd.core.frame.DataFrame):
+            if inplace == True:
+                self.data = data
+            else:
+                self.data = data.copy(deep=False)
+        elif isinstance(data, pd.core.series.Series):
+            self.data = data.to_frame(
+                name=column
+            )
+        else:
+            raise TypeError(
+                f"'data' parameter must be a pandas.core.frame.DataFrame or pandas.cores.series.Series: got {type(data)}"
+            )
+        
+        if isinstance(column, str):
+            self.column = column
+        else:
+            raise TypeError(
+                f"'column' parameter must be a str: got {type(column)}"
+            )
     
     
-    def remove_whitespace(self) -> pd.core.frame.DataFrame:
+    def _set_options(self, n_jobs: int=1, dedup: bool=False, cache=None,
+                     max_memory: int=None) -> None:
         """
-        Function that allows to replace all extra spaces between two words with
-        a single space in each sentence of a dataset.
+        Hidden function that allows to check and initialise the execution
+        options shared by the TextNet, WordNet and Tokenize classes.
 
-        Returns
-        -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        Parameters
+        ----------
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset. Default is 1.
+        
+        dedup : bool, optional, default=False
+            If true, only the distinct sentences are cleaned. Default is False.
 
-        """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"\s+",
-                " ",
-                self.data[self.column][i]
-            )
+        cache : ResultCache, optional, default=None
+            If not None, on-disk cache of the cleaned sentences.
+            Default is None.
         
-        return self.data
-    
-    
-    def remove_mention(self) -> pd.core.frame.DataFrame:
-        """
-        Function that allows to remove all mentions (@...) from each sentence in
-        a dataset.
+        max_memory : int, optional, default=None
+            If not None, number of bytes the cleaning of a chunk of rows must
+            stay under. Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'n_jobs' parameter must be an integer.
+            - To use this function, the 'dedup' parameter must be a boolean.
+            - To use this function, the 'cache' parameter must be a ResultCache.
+            - To use this function, the 'max_memory' parameter must be an integer.
+        
+        ValueError
+            - To use this function, the 'n_jobs' parameter must be -1 or >= 1.
+            - To use this function, the 'max_memory' parameter must be >= 1.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        None
+            NoneType.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"@\w+",
-                "",
-                self.data[self.column][i]
+        if isinstance(n_jobs, int) and not isinstance(n_jobs, bool):
+            if n_jobs == -1:
+                self.n_jobs = os.cpu_count() or 1
+            elif n_jobs >= 1:
+                self.n_jobs = n_jobs
+            else:
+                raise ValueError(
+                    f"'n_jobs' parameter must be -1 or >= 1: got {n_jobs}"
+                )
+        else:
+            raise TypeError(
+                f"'n_jobs' parameter must be an int: got {type(n_jobs)}"
             )
         
-        return self.data
+        if isinstance(dedup, bool):
+            self.dedup = dedup
+        else:
+            raise TypeError(
+                f"'dedup' parameter must be a bool: got {type(dedup)}"
+            )
+        
+        if cache is None or isinstance(cache, ResultCache):
+            self.cache = cache
+        else:
+            raise TypeError(
+                f"'cache' parameter must be a ResultCache: got {type(cache)}"
+            )
+        
+        self.max_memory = _check_max_memory(max_memory=max_memory)
+        self.memory = None
     
     
-    def remove_hastag(self) -> pd.core.frame.DataFrame:
+    def memory_info(self) -> dict:
         """
-        Function that allows to remove all hastags (#...) from each sentence in
-        a dataset.
+        Function that allows to get the memory used by the last cleaning method
+        run with the 'max_memory' option.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        dict_info : dict
+            - max_memory: budget in bytes;
+            - row_bytes: memory used per row, estimated on a sample;
+            - chunk_rows: number of rows of a chunk;
+            - chunks: number of chunks cleaned;
+            - peak_bytes: peak memory used by the cleaning, the cleaned rows
+            included, if tracemalloc was already tracing (e.g. with
+            Profiler(memory=True)), otherwise the estimate for one chunk;
+            - measured: true if 'peak_bytes' was measured.
+            None if no method was run with the 'max_memory' option.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                r"#\w+",
-                "",
-                self.data[self.column][i]
-            )
-        
-        return self.data
+        return None if self.memory is None else dict(self.memory)
     
     
-    def remove_emoji(self) -> pd.core.frame.DataFrame:
+    def _apply(self, steps: list, timings: list=None) -> pd.core.frame.DataFrame:
         """
-        Function that allows to remove all emojis (😂, 🤔, 🙈, 😌, 💕, 👭, 👙)
-        from each sentence in a dataset.
+        Hidden function that allows to apply cleaning steps to the column to
+        clean. The column is extracted once, each row goes through all the
+        steps and the cleaned column is written back once. An Arrow string
+        column (e.g. string[pyarrow]) is cleaned with the Arrow compute
+        functions when they give the same result, and stays an Arrow column.
+
+        Parameters
+        ----------
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+            See _compile_steps.
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
+            See _compile_steps. Default is None.
 
         Returns
         -------
         self.data : pandas.core.frame.DataFrame
             Dataset cleaned.
 
-        """        
-        regex_emojis = re.compile(
-            r"["
-            u"\U0001F600-\U0001F64F"
-            u"\U0001F300-\U0001F5FF"
-            u"\U0001F680-\U0001F6FF"
-            u"\U0001F1E0-\U0001F1FF"
-            u"\U00002500-\U00002BEF"
-            u"\U00002702-\U000027B0"
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            u"\U0001f926-\U0001f937"
-            u"\U00010000-\U0010ffff"
-            u"\u2640-\u2642" 
-            u"\u2600-\u2B55"
-            u"\u200d"
-            u"\u23cf"
-            u"\u23e9"
-            u"\u231a"
-            u"\ufe0f"
-            "]+",
-            re.UNICODE
-        )
+        """
+        if getattr(self, "max_memory", None) is not None:
+            return self._apply_budget(steps=steps, timings=timings)
+        else:
+            pass
+        
+        array = _arrow_array(series=self.data[self.column])
         
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = re.sub(
-                regex_emojis,
-                "",
-                self.data[self.column][i]
+        if getattr(self, "cache", None) is not None:
+            cleaned = self._apply_cached(steps=steps, timings=timings)
+        elif array is not None:
+            cleaned = self._apply_arrow(steps=steps, array=array, timings=timings)
+        elif getattr(self, "dedup", False) == True:
+            cleaned = self._apply_unique(steps=steps, timings=timings)
+        else:
+            cleaned = None
+        
+        if cleaned is None:
+            cleaned = self._apply_values(
+                steps=steps,
+                values=self.data[self.column].tolist(),
+                notna=self.data[self.column].notna().tolist(),
+                timings=timings
             )
+        else:
+            pass
+        
+        self.data[self.column] = cleaned
         
         return self.data
     
     
-    def additional_cleaning(self, add_regexs: list=None) -> pd.core.frame.DataFrame:
+    def _apply_budget(self, steps: list, timings: list=None) -> pd.core.frame.DataFrame:
         """
-        Function that allows to remove other non-textual characters (¤¶‰™©®▶➤¿
-        ∎≤≥⋅﹣°☒) from each sentence in a dataset. You can add regexs to delete
-        characters that are unique to your text with 'add_regexs' parameter.
+        Hidden function that allows to apply cleaning steps by chunks of rows,
+        so that the memory used to clean a chunk stays under the 'max_memory'
+        option. Each chunk is cleaned as a whole column would be (see _apply),
+        only its cleaned rows are kept until the column is written back.
 
         Parameters
         ----------
-        add_regexs : list, optional, default=None
-            You can add regex to delete characters that are unique to your text.
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
             Default is None.
-            Exemple of use: add_regexs = [r"a-zA-Z", r"0-9", r"\d+"]
-
-        Raises
-        ------
-        TypeError
-            To use this function, the 'add_regexs' parameter must be None or a list.
 
         Returns
         -------
@@ -487,650 +583,6686 @@ class TextNet:
             Dataset cleaned.
 
         """
-        list_regexs = [
-            r"\n",
-            r"\t",
-            r"\r",
-            r"[‘’„“„”“”「」『』…]",
-            r"[¤¶‰™©®]",
-            r"[▶➤¿∎≤≥⋅﹣°☒]"
-        ]
+        series = self.data[self.column]
+        row_bytes = self._estimate_row_bytes(steps=steps)
+        chunk_rows = max(1, self.max_memory // row_bytes)
         
-        if isinstance(add_regexs, list):
-            for regex in add_regexs:
-                list_regexs.append(regex)
-        elif add_regexs == None:
-            pass
+        net = copy.copy(self)
+        net.max_memory = None
+        
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
         else:
-            raise TypeError(
-                f"'add_regexs' parameter must be None or a list: got {type(add_regexs)}"
-            )
+            memory_start = None
         
-        for i in range(0, self.data[self.column].shape[0]):
-            for regex in list_regexs:
-                self.data[self.column][i] = re.sub(
-                    regex,
-                    "",
-                    self.data[self.column][i],
-                    flags=re.IGNORECASE
-                )
+        if series.shape[0] <= chunk_rows:
+            net.data = self.data
+            net._apply(steps=steps, timings=timings)
+            chunks = 1
+        else:
+            list_chunks = []
+            
+            for start in range(0, series.shape[0], chunk_rows):
+                net.data = series.iloc[start:start + chunk_rows].to_frame(name=self.column)
+                list_chunks.append(net._apply(steps=steps, timings=timings)[self.column])
+            
+            chunks = len(list_chunks)
+            self.data[self.column] = pd.concat(list_chunks, ignore_index=True).values
+        
+        if memory_start != None:
+            peak_bytes = tracemalloc.get_traced_memory()[1] - memory_start
+        else:
+            peak_bytes = min(chunk_rows, series.shape[0]) * row_bytes
+        
+        self.memory = {
+            "max_memory": self.max_memory,
+            "row_bytes": row_bytes,
+            "chunk_rows": chunk_rows,
+            "chunks": chunks,
+            "peak_bytes": peak_bytes,
+            "measured": memory_start != None
+        }
         
         return self.data
     
     
-    def remove_accent(self, lowercase: bool=True) -> pd.core.frame.DataFrame:
+    def _estimate_row_bytes(self, steps: list) -> int:
         """
-        Function that allows to remove all accents (with encoding or not) from
-        each sentence in a dataset.
+        Hidden function that allows to estimate the memory used to clean a row,
+        by cleaning a sample of rows spread over the column with tracemalloc.
+        The lexicons are loaded before, they are not part of the estimate.
 
         Parameters
         ----------
-        lowercase : bool, optional, default=True
-            If true, the text will be transform to lowercase before cleaning.
-            Otherwise the cleaning is applied to the text as in input.
-            Default is True.
-
-        Raises
-        ------
-        TypeError
-            To use this function, the 'lowercase' parameter must be a boolean.
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        row_bytes : int
+            Number of bytes used per row.
 
         """
-        if isinstance(lowercase, bool):
-            if lowercase == True:
-                self.data = TextNet(data=self.data, column=self.column).lowercase()
-            else:
-                pass
+        series = self.data[self.column]
+        
+        if series.shape[0] == 0:
+            return 1
         else:
-            raise TypeError(
-                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
-            )
+            pass
         
-        url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/accents/accents.txt"
-        path = os.getcwd()
-        filename = "\\accents.txt"
+        positions = np.unique(
+            np.linspace(0, series.shape[0] - 1, min(series.shape[0], _MEMORY_SAMPLE_ROWS)).astype(np.int64)
+        )
         
-        _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
+        net = copy.copy(self)
+        (net.max_memory, net.cache, net.n_jobs) = (None, None, 1)
+        net.data = series.take(positions).to_frame(name=self.column)
+        _compile_steps(steps=steps)
         
-        dict_regexs = {}
+        tracing = tracemalloc.is_tracing()
         
-        with open(path+filename, "r") as file:
-            for line in file:
-                (key, value) = line.split()
-                dict_regexs[str(key)] = str(value)
-        
-        _DownloadDeleteFile(path=path, filename=filename)._remove_file()
-        
-        for i in range(0, self.data[self.column].shape[0]):
-            for regex in dict_regexs:
-                self.data[self.column][i] = re.sub(
-                    regex,
-                    dict_regexs[regex],
-                    self.data[self.column][i],
-                    flags=re.IGNORECASE
-                )
+        if tracing == False:
+            tracemalloc.start()
+        else:
+            pass
         
-        return self.data
+        tracemalloc.reset_peak()
+        memory_start = tracemalloc.get_traced_memory()[0]
+        net._apply(steps=steps)
+        row_bytes = (tracemalloc.get_traced_memory()[1] - memory_start) / len(positions)
+        
+        if tracing == False:
+            tracemalloc.stop()
+        else:
+            pass
+        
+        # the buffers of an Arrow column are not traced: the column and its
+        # cleaned copy are counted instead
+        array = _arrow_array(series=series)
+        
+        if array is not None:
+            row_bytes += 2 * array.nbytes / series.shape[0]
+        else:
+            pass
+        
+        return max(1, int(row_bytes))
     
     
-    def remove_single_character(self) -> pd.core.frame.DataFrame:
+    def _apply_values(self, steps: list, values: list, notna: list,
+                      timings: list=None) -> list:
         """
-        Function that allows to remove the unique characters from each sentence
-        in a dataset.
+        Hidden function that allows to apply cleaning steps to a list of
+        values, in parallel if the 'n_jobs' option allows it.
+
+        Parameters
+        ----------
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+        
+        values : list
+            Values to clean.
+        
+        notna : list
+            For each value, False if it is missing (it is kept unchanged).
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
+            Default is None.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        list_values : list
+            Values cleaned.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = " ".join(
-                [
-                    word for word in self.data[self.column][i].split(" ") if len(word) > 1
-                ]
+        if getattr(self, "n_jobs", 1) > 1 and len(values) >= _PARALLEL_MIN_ROWS:
+            return _apply_parallel(
+                steps=steps,
+                values=values,
+                notna=notna,
+                n_jobs=self.n_jobs,
+                timings=timings
+            )
+        else:
+            return _apply_rows(
+                function=_compile_steps(steps=steps, timings=timings),
+                values=values,
+                notna=notna
             )
-        
-        return self.data
     
     
-    def remove_plural(self, word_length: int=5) -> pd.core.frame.DataFrame:
+    def _apply_unique(self, steps: list, timings: list=None):
         """
-        Function that allows to remove all the s character from words in the plural
-        from each sentence in a dataset.
+        Hidden function that allows to apply cleaning steps to the distinct
+        values of the column only. The column is factorized (or its categories
+        are used if it is a category), each distinct value is cleaned once and
+        the column is rebuilt from the integer codes.
 
         Parameters
         ----------
-        word_length : int, optional, default=5
-            Length of the words to which the s must be deleted. Default is 5.
-
-        Raises
-        ------
-        TypeError
-            To use this function, the 'word_length' parameter must be an integer.
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
+            Default is None.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        array_values : numpy.ndarray or None
+            Column cleaned, or None if its values can not be factorized
+            (e.g. lists of words).
 
         """
-        if isinstance(word_length, int):
-            pass
-        else:
-            raise TypeError(
-                f"'word_length' parameter must be an int: got {type(word_length)}"
-            )
+        series = self.data[self.column]
         
-        for i in range(0, self.data[self.column].shape[0]):
-            list_words = []
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            uniques = series.cat.categories.tolist()
+        else:
+            try:
+                (codes, uniques) = pd.factorize(series)
+            except TypeError:
+                return None
             
-            for word in self.data[self.column][i].split(" "):
-                if len(word) > word_length:
-                    word = re.sub(
-                        r"s\b",
-                        "",
-                        word,
-                        flags=re.IGNORECASE
-                    )
+            uniques = list(uniques)
+        
+        list_cleaned = self._apply_values(
+            steps=steps,
+            values=uniques,
+            notna=[True] * len(uniques),
+            timings=timings
+        )
+        # the missing values have the code -1: a last slot keeps them aside
+        cleaned = np.empty(len(list_cleaned) + 1, dtype=object)
+        
+        for i, value in enumerate(list_cleaned):
+            cleaned[i] = value
+        
+        array_values = cleaned.take(codes)
+        missing = codes == -1
+        
+        if missing.any():
+            array_values[missing] = series.to_numpy(dtype=object)[missing]
+        else:
+            pass
+        
+        # the rows sharing a value must not share the same list of words
+        if len(list_cleaned) > 0 and isinstance(list_cleaned[0], list):
+            for i, value in enumerate(array_values):
+                if isinstance(value, list):
+                    array_values[i] = list(value)
                 else:
                     pass
-                
-                list_words.append(word)
-        
-            self.data[self.column][i] = " ".join(list_words)
+        else:
+            pass
         
-        return self.data
-
+        return array_values
+    
+    
+    def _apply_cached(self, steps: list, timings: list=None):
+        """
+        Hidden function that allows to apply cleaning steps with the on-disk
+        cache of the 'cache' option. The rows found in the cache are not
+        cleaned again, the others are cleaned (each distinct sentence once)
+        and added to the cache.
 
-#------------------------------------------------------------------------------
+        Parameters
+        ----------
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
+            Default is None.
 
+        Returns
+        -------
+        list_values : list or pandas.api.extensions.ExtensionArray
+            Column cleaned, an Arrow string column stays an Arrow column.
 
-class WordNet:
-    def __init__(self, data, column: str) -> None:
         """
-        Function that allows to build the WordNet class and initialise the parameters.
+        series = self.data[self.column]
+        values = series.tolist()
+        notna = series.notna().tolist()
+        config = _steps_digest(steps=steps)
+        
+        # only the sentences are cached, not the lists of words
+        list_keys = [
+            ResultCache.key(text=value, config=config) if keep and isinstance(value, str) else None
+            for (value, keep) in zip(values, notna)
+        ]
+        dict_found = self.cache.get_many(
+            keys=[key for key in list_keys if key is not None]
+        )
+        
+        dict_todo = {}
+        list_others = []
+        
+        for i, (key, keep) in enumerate(zip(list_keys, notna)):
+            if key is None:
+                if keep:
+                    list_others.append(i)
+                else:
+                    pass
+            elif key not in dict_found:
+                dict_todo.setdefault(key, i)
+            else:
+                pass
+        
+        list_todo = list(dict_todo.values()) + list_others
+        cleaned = self._apply_values(
+            steps=steps,
+            values=[values[i] for i in list_todo],
+            notna=[True] * len(list_todo),
+            timings=timings
+        )
+        
+        for (i, value) in zip(list_todo, cleaned):
+            if list_keys[i] is not None:
+                dict_found[list_keys[i]] = value
+            else:
+                values[i] = value
+        
+        self.cache.put_many(
+            items=[
+                (list_keys[i], value) for (i, value) in zip(list_todo, cleaned)
+                if list_keys[i] is not None and isinstance(value, str)
+            ]
+        )
+        
+        # the rows sharing a value must not share the same list of words
+        for (i, key) in enumerate(list_keys):
+            if key is not None and isinstance(dict_found[key], list):
+                values[i] = list(dict_found[key])
+            elif key is not None:
+                values[i] = dict_found[key]
+            else:
+                pass
+        
+        if _arrow_array(series=series) is not None and\
+            all([isinstance(value, str) or not keep for (value, keep) in zip(values, notna)]):
+            return pd.array(values, dtype=series.dtype)
+        else:
+            return values
+    
+    
+    def _apply_arrow(self, steps: list, array, timings: list=None):
+        """
+        Hidden function that allows to apply cleaning steps to an Arrow string
+        column. The steps with an Arrow compute function run on the whole
+        array, without creating a Python string per row. The other steps run
+        together in Python (only on the distinct values if the 'dedup' option
+        is true) and their result is converted back to Arrow.
 
         Parameters
         ----------
-        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
-            Dataset to be cleaned.
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
         
-        column : str
-            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
-            parameter should be the 
-            name assigned to the column to clean.
-            - If 'data' parameter is a pandas.core.series.Series, 'column'
-            parameter will be its output name.
+        array : pyarrow.Array
+            Column to clean.
         
-        Raises
-        ------
-        TypeError
-            - To use this class, the 'data' parameter must be a 
-            pandas.core.frame.DataFrame or pandas.cores.series.Series.
-            - To use this class, the 'column' parameter must be a string.
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
+            Default is None.
 
         Returns
         -------
-        None
-            NoneType.
+        array_values : pandas.api.extensions.ExtensionArray or list
+            Column cleaned, with the dtype of the column, or a list if the
+            steps return lists of words.
 
         """
-        if isinstance(data, pd.core.frame.DataFrame):
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
-        elif isinstance(data, pd.core.series.Series):
-            data.to_frame(
-                name=column
-            )
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
-        else:
-            raise TypeError(
-                f"'data' parameter must be a pandas.core.frame.DataFrame or pandas.cores.series.Series: got {type(data)}"
+        dtype = self.data[self.column].dtype
+        values = array
+        i = 0
+        
+        while i < len(steps):
+            if isinstance(values, list):
+                function = None
+            else:
+                function = _compile_arrow_step(steps[i][0], **steps[i][1])
+            
+            if function is not None:
+                start = time.perf_counter()
+                values = function(values)
+                
+                if timings != None:
+                    timings[i] += time.perf_counter() - start
+                else:
+                    pass
+                
+                i += 1
+                continue
+            else:
+                pass
+            
+            # the next steps without Arrow function run together, and the
+            # lists of words of word_tokenize stay in Python
+            j = i
+            tokens = isinstance(values, list)
+            
+            while j < len(steps) and (tokens or _compile_arrow_step(steps[j][0], **steps[j][1]) is None):
+                tokens = (tokens or steps[j][0] == "word_tokenize") and\
+                    steps[j][0] != "word_detokenize"
+                j += 1
+            
+            run_timings = [0.0] * (j - i) if timings != None else None
+            values = self._apply_python(
+                steps=steps[i:j],
+                values=values,
+                timings=run_timings
             )
+            
+            if timings != None:
+                for k, timing in enumerate(run_timings):
+                    timings[i+k] += timing
+            else:
+                pass
+            
+            i = j
         
-        if isinstance(column, str):
-            self.column = column
+        if isinstance(values, list):
+            return [dtype.na_value if value is None else value for value in values]
         else:
-            raise TypeError(
-                f"'column' parameter must be a str: got {type(column)}"
-            )
+            return dtype.__from_arrow__(values)
     
     
-    def remove_stopword(self, language: str="english", lowercase: bool=True,
-                        remove_accents: bool=False, remove_stopwords: list=None,
-                        add_stopwords: list=None) -> pd.core.frame.DataFrame:
+    def _apply_python(self, steps: list, values, timings: list=None):
         """
-        Function that allows to remove all stopwords from each sentence in a dataset.
+        Hidden function that allows to apply cleaning steps in Python to an
+        Arrow string column.
 
         Parameters
         ----------
-        language : {"english", "french"}, str, optional, default="english"
-            Language of stopwords to be removed. Default is "english".
-            
-        lowercase : bool, optional, default=True
-            If true, the text will be transform to lowercase before cleaning.
-            Otherwise the cleaning is applied to the text as in input.
-            Default is True.
-            
-        remove_accents : bool, optional, default=False
-            If false, the accents on words will not be removed before cleaning.
-            Otherwise, the cleaning is applied on the words without accents.
-            Default is False.
-
-        remove_stopwords : list, optional, default=None
-            You can specify a list of stopwords that you do not want to delete
-            from your textual corpus in order to keep them.
-            Default is None.
-
-        add_stopwords : list, optional, default=None
-            You can specify a list of stopwords that you want to remove from your
-            text corpus in addition to the basic stopwords.
+        steps : list
+            List of (name, parameters) tuples of the steps to apply, in order.
+        
+        values : pyarrow.Array or list
+            Column to clean.
+        
+        timings : list, optional, default=None
+            If not None, the time spent in each step is added to it.
             Default is None.
 
-        Raises
-        ------
-        TypeError
-            - To use this function, the 'language' parameter must be a string.
-            - To use this function, the 'lowercase' parameter must be a boolean.
-            - To use this function, the 'remove_accents' parameter must be a boolean.
-            - To use this function, the 'remove_stopwords' parameter must be a list.
-            - To use this function, the 'add_stopwords' parameter must be a list.
-
-        ValueError
-            To use this function, the 'language' parameter must be {"english", "french"}
-
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        values : pyarrow.Array or list
+            Column cleaned, a list if the steps return lists of words.
 
         """
-        if isinstance(language, str):
-            pass
-        else:
-            raise TypeError(
-                f"'language' parameter must be a str: got {type(language)}"
+        if isinstance(values, list):
+            return self._apply_values(
+                steps=steps,
+                values=values,
+                notna=[value is not None for value in values],
+                timings=timings
             )
-        
-        if isinstance(lowercase, bool):
-            if lowercase == True:
-                self.data = TextNet(data=self.data, column=self.column).lowercase()
-            else:
-                pass
         else:
-            raise TypeError(
-                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
-            )
+            pass
         
-        if language == "english":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/stopwords/english.txt"
-            path = os.getcwd()
-            filename = "\\english.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            with open(path+filename, "r") as file:
-                list_stopwords = file.read().split()
-            
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
-        elif language == "french":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/stopwords/french.txt"
-            path = os.getcwd()
-            filename = "\\french.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            with open(path+filename, "r") as file:
-                list_stopwords = file.read().split()
-            
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
-        else:
-            raise ValueError(
-                "'language' parameter must be in {'english', 'french'}: default='english'"
-            )
+        pyarrow = _import_pyarrow()[0]
         
-        if isinstance(remove_stopwords, list):
-            for stopword in remove_stopwords:
-                if stopword in list_stopwords:
-                    list_stopwords.remove(stopword)
-                else:
-                    pass
-        elif remove_stopwords == None:
-            pass
+        if self.dedup == True:
+            encoded = pyarrow.compute.dictionary_encode(values)
+            uniques = encoded.dictionary.to_pylist()
         else:
-            raise TypeError(
-                f"'remove_stopwords' parameter must be None or a list: got {type(remove_stopwords)}"
-            )
+            uniques = values.to_pylist()
         
-        if isinstance(add_stopwords, list):
-            for stopword in add_stopwords:
-                list_stopwords.append(stopword)
-        elif add_stopwords == None:
-            pass
-        else:
-            raise TypeError(
-                f"'add_stopwords' parameter must be None or a list: got {type(add_stopwords)}"
-            )
+        cleaned = self._apply_values(
+            steps=steps,
+            values=uniques,
+            notna=[value is not None for value in uniques],
+            timings=timings
+        )
         
-        list_stopwords_len = len(list_stopwords)
+        try:
+            array = pyarrow.array(cleaned, type=values.type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            array = None
         
-        if isinstance(remove_accents, bool):
-            if remove_accents == True:
-                self.data = TextNet(
-                    data=self.data,
-                    column=self.column
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                df_stopwords = pd.DataFrame(list_stopwords, columns=["Stopwords"])
-                df_stopwords = TextNet(
-                    data=df_stopwords,
-                    column="Stopwords"
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                list_stopwords = df_stopwords["Stopwords"].tolist()
-                
-                assert len(list_stopwords) == list_stopwords_len, "list_stopwords' shape must remain the same as before deletion"
-            else:
-                pass
+        if self.dedup == False:
+            return cleaned if array is None else array
+        elif array is not None:
+            return array.take(encoded.indices)
         else:
-            raise TypeError(
-                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
-            )
+            # the rows sharing a value must not share the same list of words
+            return [
+                None if k is None else list(cleaned[k]) for k in encoded.indices.to_pylist()
+            ]
+    
+    
+    def lazy(self):
+        """
+        Function that allows to get a LazyNet on the dataset, with the same
+        options. The cleaning methods called on the LazyNet are not run: they
+        build a plan, which is optimized and run by its 'collect' function.
+        
+        Example of use: >>> net = TextNet(data, "text").lazy()
+                        >>> net.lowercase().remove_url().remove_accent().collect()
+
+        Returns
+        -------
+        lazy : LazyNet
+            LazyNet with an empty plan.
+
+        """
+        # self.data is already the DataFrame to write into
+        return LazyNet(
+            data=self.data,
+            column=self.column,
+            n_jobs=self.n_jobs,
+            dedup=self.dedup,
+            cache=self.cache,
+            inplace=True,
+            max_memory=self.max_memory
+        )
+
+
+#------------------------------------------------------------------------------
+
+
+class TextNet(_BaseNet):
+    def __init__(self, data, column: str, n_jobs: int=1, dedup: bool=False, cache=None,
+                 inplace: bool=True, max_memory: int=None) -> None:
+        """
+        Function that allows to build the TextNet class and initialise the
+        parameters.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
+            Dataset to be cleaned.
         
-        list_stopwords = list(set(list_stopwords))
+        column : str
+            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
+            parameter should be the 
+            name assigned to the column to clean.
+            - If 'data' parameter is a pandas.core.series.Series, 'column'
+            parameter will be its output name.
         
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = " ".join(
-                [
-                    word for word in self.data[self.column][i].split(" ") if word not in list_stopwords
-                ]
-            )
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset. If n_jobs > 1, the
+            column is split into chunks cleaned in parallel by a pool of
+            processes. If n_jobs=-1, all the processors are used. Default is 1.
         
-        return self.data
+        dedup : bool, optional, default=False
+            If true, each distinct sentence of the column is cleaned only once
+            and the cleaned sentences are mapped back to the rows. It is
+            faster when the column has many duplicates. If the column is a
+            category, its categories are cleaned. Default is False.
+        
+        cache : ResultCache, optional, default=None
+            If not None, the sentences already cleaned with the same method,
+            parameters and lexicons are read from this on-disk cache instead
+            of being cleaned again, and the new ones are added to it.
+            Default is None.
+        
+        inplace : bool, optional, default=True
+            - If true, the cleaned column is written into 'data', whose other
+            columns and index are not modified.
+            - If false, 'data' is not modified: the methods return a new
+            DataFrame which shares the other columns of 'data' (they are not
+            copied), only the cleaned column is new.
+            A Series is always cleaned in a new DataFrame. Default is True.
+        
+        max_memory : int, optional, default=None
+            If not None, maximal number of bytes used to clean the column, in
+            addition to the dataset and to the cleaned column. The memory used
+            per row is estimated on a sample of the column (with tracemalloc)
+            and the column is cleaned by chunks of rows which stay under this
+            budget, see 'memory_info'. Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'data' parameter must be a
+            pandas.core.frame.DataFrame or pandas.cores.series.Series.
+            - To use this class, the 'column' parameter must be a string.
+            - To use this class, the 'n_jobs' parameter must be an integer.
+            - To use this class, the 'dedup' parameter must be a boolean.
+            - To use this class, the 'cache' parameter must be a ResultCache.
+            - To use this class, the 'inplace' parameter must be a boolean.
+            - To use this class, the 'max_memory' parameter must be an integer.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._set_data(data=data, column=column, inplace=inplace)
+        self._set_options(n_jobs=n_jobs, dedup=dedup, cache=cache, max_memory=max_memory)
     
     
-    def lemmatize(self, language: str="english", lowercase: bool=True,
-                  remove_accents: bool=False) -> pd.core.frame.DataFrame:
+    @_instrument
+    def downcast(self, category: bool=False, arrow: bool=False) -> pd.core.frame.DataFrame:
         """
-        Function that allows each sentence of a dataset to be lemmatized.
-        In other words, for each sentence, nouns are replaced by their radical
-        and verbs by their infinitive.
-        
-        Example of use: saw > see, mice > mouse, took > take, recommended > recommend
+        Function that allows to cast the format of each column of a
+        pandas.core.frame.DataFrame to optimize the RAM storage space.
 
         Parameters
         ----------
-        language : {"english", "french"}, str, optional, default="english"
-            Language of stopwords to be removed. Default is "english".
-            
-        lowercase : bool, optional, default=True
-            If true, the text will be transform to lowercase before cleaning.
-            Otherwise the cleaning is applied to the text as in input.
-            Default is True.
-            
-        remove_accents : bool, optional, default=False
-            If false, the accents on words will not be removed before cleaning.
-            Otherwise, the cleaning is applied on the words without accents.
-            Default is False.
+        category : bool, optional, default=False
+            With Pandas, you can choose category or object to cast the type of
+            a text. If category=False, then the text will be considered as an
+            object otherwise as a category. Default is False.
+        
+        arrow : bool, optional, default=False
+            If true, the text is cast to an Arrow string (string[pyarrow]),
+            whatever the 'category' parameter: it takes less memory than an
+            object and is cleaned with the Arrow compute functions when they
+            exist. It needs the pyarrow library. Default is False.
 
         Raises
         ------
         TypeError
-            - To use this function, the 'language' parameter must be a string.
-            - To use this function, the 'lowercase' parameter must be a boolean.
-            - To use this function, the 'remove_accents' parameter must be a boolean.
+            - To use this function, the 'category' parameter must be a boolean.
+            - To use this function, the 'arrow' parameter must be a boolean.
 
         Returns
         -------
         self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+            Dataset optimized.
 
         """
-        if isinstance(language, str):
+        if isinstance(category, bool):
             pass
         else:
             raise TypeError(
-                f"'language' parameter must be a str: got {type(language)}"
+                f"'category' parameter must be a bool: got {type(category)}"
             )
         
-        if isinstance(lowercase, bool):
-            if lowercase == True:
-                self.data = TextNet(data=self.data, column=self.column).lowercase()
-            else:
-                pass
+        if isinstance(arrow, bool):
+            pass
         else:
             raise TypeError(
-                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
+                f"'arrow' parameter must be a bool: got {type(arrow)}"
             )
         
-        if language == "english":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/lemme/english.txt"
-            path = os.getcwd()
-            filename = "\\english.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            dict_regexs = {}
-
-            with open(path+filename, "r") as file:
-                for line in file:
-                    (key, value) = line.split()
-                    dict_regexs[str(key)] = str(value)
+        columns = self.data.dtypes.index.tolist()
+        types = self.data.dtypes.values.tolist()
         
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
-        elif language == "french":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/lemme/french.txt"
-            path = os.getcwd()
-            filename = "\\french.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            dict_regexs = {}
-
-            with open(path+filename, "r") as file:
-                for line in file:
-                    (key, value) = line.split()
-                    dict_regexs[str(key)] = str(value)
+        for i, t in enumerate(types):
+            # interger format
+            if "int" in str(t):
+                if self.data[columns[i]].min() > np.iinfo(np.int8).min and\
+                    self.data[columns[i]].max() < np.iinfo(np.int8).max:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.int8)
+                elif self.data[columns[i]].min() > np.iinfo(np.int16).min and\
+                    self.data[columns[i]].max() < np.iinfo(np.int16).max:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.int16)
+                elif self.data[columns[i]].min() > np.iinfo(np.int32).min and\
+                    self.data[columns[i]].max() < np.iinfo(np.int32).max:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.int32)
+                else:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.int64)
+            # float format
+            elif "float" in str(t):
+                if self.data[columns[i]].min() > np.finfo(np.float16).min and\
+                    self.data[columns[i]].max() < np.finfo(np.float16).max:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.float16)
+                elif self.data[columns[i]].min() > np.finfo(np.float32).min and\
+                    self.data[columns[i]].max() < np.finfo(np.float32).max:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.float32)
+                else:
+                    self.data[columns[i]] = self.data[columns[i]].astype(np.float64)
+            # object format
+            elif "object" in str(t) or str(t) in ["string", "str"]:
+                # timestamp format
+                if columns[i] in ["date", "Date", "DATE", "dates", "Dates", "DATES"]:
+                    self.data[columns[i]] = pd.to_datetime(
+                        self.data[columns[i]],
+                        format="%Y-%m-%d"
+                    )
+                else:
+                    if arrow == True:
+                        _import_pyarrow()
+                        self.data[columns[i]] = self.data[columns[i]].astype("string[pyarrow]")
+                    elif category == False:
+                        self.data[columns[i]] = self.data[columns[i]].astype("object")
+                    else:
+                        self.data[columns[i]] = self.data[columns[i]].astype("category")
         
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
+        return self.data
+    
+    
+    @_instrument
+    def lowercase(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to transform to lowercase each word from a sentence
+        in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if self.dedup == True or self.cache is not None or self.max_memory is not None or\
+            _arrow_array(series=self.data[self.column]) is not None:
+            return self._apply(steps=[("lowercase", {})])
+        else:
+            self.data[self.column] = self.data[self.column].str.lower()
+        
+        return self.data
+    
+    
+    @_instrument
+    def word_count_filter(self, min_words: int=2) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to filter the number of words for each sentence in
+        a dataset. With the 'max_memory' option, the words are counted by
+        chunks of rows, so that the counts of the whole column are never held
+        at once.
+
+        Parameters
+        ----------
+        min_words : int, optional, default=2
+            Number of words at least the length of the sentence should make.
+            Default is 2.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'min_words' parameter must be a integer.
+
+        Returns
+        -------
+        dataframe_filter : pandas.core.frame.DataFrame
+            Dataset filtered.
+
+        """
+        if isinstance(min_words, int):
+            pass
+        else:
+            raise TypeError(
+                f"'min_words' parameter must be an int: got {type(min_words)}"
+            )
+        
+        series = self.data[self.column]
+        array = _arrow_array(series=series)
+        
+        if getattr(self, "max_memory", None) is not None:
+            chunk_rows = max(1, self.max_memory // _WORD_COUNT_ROW_BYTES)
+            self.memory = {
+                "max_memory": self.max_memory,
+                "row_bytes": _WORD_COUNT_ROW_BYTES,
+                "chunk_rows": chunk_rows,
+                "chunks": -(-series.shape[0] // chunk_rows),
+                "peak_bytes": min(chunk_rows, series.shape[0]) * _WORD_COUNT_ROW_BYTES,
+                "measured": False
+            }
+        else:
+            chunk_rows = max(1, series.shape[0])
+        
+        mask = np.empty(series.shape[0], dtype=bool)
+        
+        for start in range(0, series.shape[0], chunk_rows):
+            stop = min(start + chunk_rows, series.shape[0])
+            
+            if array is not None:
+                pyarrow = _import_pyarrow()[0]
+                array_wc = pyarrow.compute.count_substring(
+                    array.slice(start, stop - start),
+                    pattern=" "
+                )
+                mask_chunk = pyarrow.compute.greater(array_wc, min_words - 1)
+                mask[start:stop] = pyarrow.compute.fill_null(mask_chunk, False).to_numpy(
+                    zero_copy_only=False
+                )
+            else:
+                mask[start:stop] = np.fromiter(
+                    (text.count(" ") + 1 > min_words for text in series.iloc[start:stop]),
+                    dtype=bool,
+                    count=stop - start
+                )
+        
+        # the filtered DataFrame is new (and not a view): its index is reset
+        # without a copy
+        dataframe_filter = self.data.take(np.flatnonzero(mask))
+        dataframe_filter.reset_index(drop=True, inplace=True)
+        
+        return dataframe_filter
+    
+    
+    @_instrument
+    def remove_punctuation(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all punctuation marks (./,;?!#~\@) from
+        each sentence in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_punctuation", {})])
+    
+    
+    @_instrument
+    def remove_url(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all Uniform Resource Locators (URLs) from
+        each sentence in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_url", {})])
+    
+    
+    @_instrument
+    def remove_html(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all HTML tags (<...> or </...>) from each
+        sentence in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_html", {})])
+    
+    
+    @_instrument
+    def remove_email(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all email adresses (...@...) from each
+        sentence in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_email", {})])
+    
+    
+    @_instrument
+    def remove_digit(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all digits ([0-9]) from each sentence in
+        a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_digit", {})])
+    
+    
+    @_instrument
+    def remove_space(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove the spaces at the beginning and end of
+        each sentence in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_space", {})])
+    
+    
+    @_instrument
+    def remove_whitespace(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to replace all extra spaces between two words with
+        a single space in each sentence of a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_whitespace", {})])
+    
+    
+    @_instrument
+    def remove_mention(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all mentions (@...) from each sentence in
+        a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_mention", {})])
+    
+    
+    @_instrument
+    def remove_hastag(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all hastags (#...) from each sentence in
+        a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_hastag", {})])
+    
+    
+    @_instrument
+    def remove_emoji(self, ranges: list=None) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all emojis (😂, 🤔, 🙈, 😌, 💕, 👭, 👙)
+        from each sentence in a dataset.
+
+        Parameters
+        ----------
+        ranges : list, optional, default=None
+            List of (first, last) code points of the characters to remove,
+            included. If None, the EMOJI_RANGES of the module are used.
+            Default is None.
+            Exemple of use: ranges = [(0x1F600, 0x1F64F), (0x2600, 0x26FF)]
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'ranges' parameter must be None or a list.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(ranges, list):
+            pass
+        elif ranges == None:
+            pass
+        else:
+            raise TypeError(
+                f"'ranges' parameter must be None or a list: got {type(ranges)}"
+            )
+        
+        return self._apply(steps=[("remove_emoji", {"ranges": ranges})])
+    
+    
+    @_instrument
+    def additional_cleaning(self, add_regexs: list=None) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove other non-textual characters (¤¶‰™©®▶➤¿
+        ∎≤≥⋅﹣°☒) from each sentence in a dataset. You can add regexs to delete
+        characters that are unique to your text with 'add_regexs' parameter.
+
+        Parameters
+        ----------
+        add_regexs : list, optional, default=None
+            You can add regex to delete characters that are unique to your text.
+            Default is None.
+            Exemple of use: add_regexs = [r"a-zA-Z", r"0-9", r"\d+"]
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'add_regexs' parameter must be None or a list.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(add_regexs, list):
+            pass
+        elif add_regexs == None:
+            pass
+        else:
+            raise TypeError(
+                f"'add_regexs' parameter must be None or a list: got {type(add_regexs)}"
+            )
+        
+        return self._apply(steps=[("additional_cleaning", {"add_regexs": add_regexs})])
+    
+    
+    @_instrument
+    def remove_accent(self, lowercase: bool=True,
+                      method: str="translate") -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all accents (with encoding or not) from
+        each sentence in a dataset.
+
+        Parameters
+        ----------
+        lowercase : bool, optional, default=True
+            If true, the text will be transform to lowercase before cleaning.
+            Otherwise the cleaning is applied to the text as in input.
+            Default is True.
+        
+        method : {"translate", "unicode", "regex"}, str, optional, default="translate"
+            - If "translate", the accented characters of the accents lexicon
+            are replaced with a translation table in one pass, after the badly
+            encoded sequences (e.g. Ã©) of the lexicon.
+            - If "unicode", the "translate" method is completed by the Unicode
+            canonical decomposition (NFD) of the characters, so that the
+            accents missing from the lexicon (e.g. ō, ș) are removed too. The
+            other characters (e.g. ™, ½, ﬁ) are kept as they are.
+            - If "regex", each entry of the lexicon is applied as a regex, one
+            after the other (slowest, kept for compatibility).
+            Default is "translate".
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'lowercase' parameter must be a boolean.
+            - To use this function, the 'method' parameter must be a string.
+        
+        ValueError
+            To use this function, the 'method' parameter must be {"translate",
+            "unicode", "regex"}.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(lowercase, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
+            )
+        
+        if isinstance(method, str):
+            if method in ["translate", "unicode", "regex"]:
+                pass
+            else:
+                raise ValueError(
+                    "'method' parameter must be in {'translate', 'unicode', 'regex'}: default='translate'"
+                )
+        else:
+            raise TypeError(
+                f"'method' parameter must be a str: got {type(method)}"
+            )
+        
+        return self._apply(
+            steps=[
+                ("remove_accent", {"lowercase": lowercase, "method": method})
+            ]
+        )
+    
+    
+    @_instrument
+    def remove_single_character(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove the unique characters from each sentence
+        in a dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        return self._apply(steps=[("remove_single_character", {})])
+    
+    
+    @_instrument
+    def remove_plural(self, word_length: int=5) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all the s character from words in the plural
+        from each sentence in a dataset.
+
+        Parameters
+        ----------
+        word_length : int, optional, default=5
+            Length of the words to which the s must be deleted. Default is 5.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'word_length' parameter must be an integer.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(word_length, int):
+            pass
+        else:
+            raise TypeError(
+                f"'word_length' parameter must be an int: got {type(word_length)}"
+            )
+        
+        return self._apply(steps=[("remove_plural", {"word_length": word_length})])
+
+
+#------------------------------------------------------------------------------
+
+
+class WordNet(_BaseNet):
+    def __init__(self, data, column: str, n_jobs: int=1, dedup: bool=False, cache=None,
+                 inplace: bool=True, max_memory: int=None) -> None:
+        """
+        Function that allows to build the WordNet class and initialise the parameters.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
+            Dataset to be cleaned.
+        
+        column : str
+            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
+            parameter should be the 
+            name assigned to the column to clean.
+            - If 'data' parameter is a pandas.core.series.Series, 'column'
+            parameter will be its output name.
+        
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset. If n_jobs > 1, the
+            column is split into chunks cleaned in parallel by a pool of
+            processes. If n_jobs=-1, all the processors are used. Default is 1.
+        
+        dedup : bool, optional, default=False
+            If true, each distinct sentence of the column is cleaned only once
+            and the cleaned sentences are mapped back to the rows. It is
+            faster when the column has many duplicates. If the column is a
+            category, its categories are cleaned. Default is False.
+        
+        cache : ResultCache, optional, default=None
+            If not None, the sentences already cleaned with the same method,
+            parameters and lexicons are read from this on-disk cache instead
+            of being cleaned again, and the new ones are added to it.
+            Default is None.
+        
+        inplace : bool, optional, default=True
+            - If true, the cleaned column is written into 'data', whose other
+            columns and index are not modified.
+            - If false, 'data' is not modified: the methods return a new
+            DataFrame which shares the other columns of 'data' (they are not
+            copied), only the cleaned column is new.
+            A Series is always cleaned in a new DataFrame. Default is True.
+        
+        max_memory : int, optional, default=None
+            If not None, maximal number of bytes used to clean the column, in
+            addition to the dataset and to the cleaned column. The memory used
+            per row is estimated on a sample of the column (with tracemalloc)
+            and the column is cleaned by chunks of rows which stay under this
+            budget, see 'memory_info'. Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'data' parameter must be a 
+            pandas.core.frame.DataFrame or pandas.cores.series.Series.
+            - To use this class, the 'column' parameter must be a string.
+            - To use this class, the 'n_jobs' parameter must be an integer.
+            - To use this class, the 'dedup' parameter must be a boolean.
+            - To use this class, the 'cache' parameter must be a ResultCache.
+            - To use this class, the 'inplace' parameter must be a boolean.
+            - To use this class, the 'max_memory' parameter must be an integer.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._set_data(data=data, column=column, inplace=inplace)
+        self._set_options(n_jobs=n_jobs, dedup=dedup, cache=cache, max_memory=max_memory)
+    
+    
+    @_instrument
+    def remove_stopword(self, language: str="english", lowercase: bool=True,
+                        remove_accents: bool=False, remove_stopwords: list=None,
+                        add_stopwords: list=None) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to remove all stopwords from each sentence in a dataset.
+
+        Parameters
+        ----------
+        language : {"english", "french"}, str, optional, default="english"
+            Language of stopwords to be removed. Default is "english".
+            
+        lowercase : bool, optional, default=True
+            If true, the text will be transform to lowercase before cleaning.
+            Otherwise the cleaning is applied to the text as in input.
+            Default is True.
+            
+        remove_accents : bool, optional, default=False
+            If false, the accents on words will not be removed before cleaning.
+            Otherwise, the cleaning is applied on the words without accents.
+            Default is False.
+
+        remove_stopwords : list, optional, default=None
+            You can specify a list of stopwords that you do not want to delete
+            from your textual corpus in order to keep them.
+            Default is None.
+
+        add_stopwords : list, optional, default=None
+            You can specify a list of stopwords that you want to remove from your
+            text corpus in addition to the basic stopwords.
+            Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'language' parameter must be a string.
+            - To use this function, the 'lowercase' parameter must be a boolean.
+            - To use this function, the 'remove_accents' parameter must be a boolean.
+            - To use this function, the 'remove_stopwords' parameter must be a list.
+            - To use this function, the 'add_stopwords' parameter must be a list.
+
+        ValueError
+            To use this function, the 'language' parameter must be {"english", "french"}
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(language, str):
+            if language in ["english", "french"]:
+                pass
+            else:
+                raise ValueError(
+                    "'language' parameter must be in {'english', 'french'}: default='english'"
+                )
+        else:
+            raise TypeError(
+                f"'language' parameter must be a str: got {type(language)}"
+            )
+        
+        if isinstance(lowercase, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
+            )
+        
+        if isinstance(remove_accents, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
+            )
+        
+        if isinstance(remove_stopwords, list) or remove_stopwords == None:
+            pass
+        else:
+            raise TypeError(
+                f"'remove_stopwords' parameter must be None or a list: got {type(remove_stopwords)}"
+            )
+        
+        if isinstance(add_stopwords, list) or add_stopwords == None:
+            pass
+        else:
+            raise TypeError(
+                f"'add_stopwords' parameter must be None or a list: got {type(add_stopwords)}"
+            )
+        
+        return self._apply(
+            steps=[
+                (
+                    "remove_stopword",
+                    {
+                        "language": language,
+                        "lowercase": lowercase,
+                        "remove_accents": remove_accents,
+                        "remove_stopwords": remove_stopwords,
+                        "add_stopwords": add_stopwords
+                    }
+                )
+            ]
+        )
+    
+    
+    @_instrument
+    def lemmatize(self, language: str="english", lowercase: bool=True,
+                  remove_accents: bool=False, lexicon=None) -> pd.core.frame.DataFrame:
+        """
+        Function that allows each sentence of a dataset to be lemmatized.
+        In other words, for each sentence, nouns are replaced by their radical
+        and verbs by their infinitive.
+        
+        Example of use: saw > see, mice > mouse, took > take, recommended > recommend
+        
+        The whole-word entries of the lexicon (\\bword\\b) are applied with a
+        single dictionary lookup per word, the other entries are applied as
+        regexs afterwards. A custom lexicon too large to be loaded in each
+        process can be given as a LemmaTable, a sorted table read from the
+        disk (see LemmaTable.build).
+
+        Parameters
+        ----------
+        language : {"english", "french"}, str, optional, default="english"
+            Language of stopwords to be removed. Default is "english".
+            
+        lowercase : bool, optional, default=True
+            If true, the text will be transform to lowercase before cleaning.
+            Otherwise the cleaning is applied to the text as in input.
+            Default is True.
+            
+        remove_accents : bool, optional, default=False
+            If false, the accents on words will not be removed before cleaning.
+            Otherwise, the cleaning is applied on the words without accents.
+            Default is False.
+            
+        lexicon : str or LemmaTable, optional, default=None
+            LemmaTable, or path of a LemmaTable file, used instead of the
+            lexicon of 'language'. Each word is looked up in the table, which
+            is shared by all the processes through the page cache. With
+            'remove_accents', the words of the table must be without accents.
+            Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'language' parameter must be a string.
+            - To use this function, the 'lowercase' parameter must be a boolean.
+            - To use this function, the 'remove_accents' parameter must be a boolean.
+            - To use this function, the 'lexicon' parameter must be None, a string or a LemmaTable.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(language, str):
+            if language in ["english", "french"]:
+                pass
+            else:
+                raise ValueError(
+                    "'language' parameter must be in {'english', 'french'}: default='english'"
+                )
+        else:
+            raise TypeError(
+                f"'language' parameter must be a str: got {type(language)}"
+            )
+        
+        if isinstance(lowercase, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
+            )
+        
+        if isinstance(remove_accents, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
+            )
+        
+        # the step keeps the path only, each process maps the file itself
+        if isinstance(lexicon, LemmaTable):
+            lexicon = lexicon.path
+        elif isinstance(lexicon, str):
+            _open_lemma_table(path=lexicon)
+        elif lexicon == None:
+            pass
+        else:
+            raise TypeError(
+                f"'lexicon' parameter must be None, a str or a LemmaTable: got {type(lexicon)}"
+            )
+        
+        dict_parameters = {
+            "language": language,
+            "lowercase": lowercase,
+            "remove_accents": remove_accents
+        }
+        
+        if lexicon != None:
+            dict_parameters["lexicon"] = lexicon
+        else:
+            pass
+        
+        return self._apply(steps=[("lemmatize", dict_parameters)])
+    
+    
+    @_instrument
+    def stemmatize(self, language: str="english", lowercase: bool=True, remove_accents: bool=False) -> pd.core.frame.DataFrame:
+        """
+        Function that allows each sentence of a dataset to be stemmatized.
+        In other words, for each sentence, verbs and words are replaced by their
+        root / base word.
+        
+        Example of use: ponies > poni, dogs > dog, running > runn
+
+        Parameters
+        ----------
+        language : {"english", "french"}, str, optional, default="english"
+            Language of stopwords to be removed. Default is "english".
+            
+        lowercase : bool, optional, default=True
+            If true, the text will be transform to lowercase before cleaning.
+            Otherwise the cleaning is applied to the text as in input.
+            Default is True.
+            
+        remove_accents : bool, optional, default=False
+            If false, the accents on words will not be removed before cleaning.
+            Otherwise, the cleaning is applied on the words without accents.
+            Default is False.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'language' parameter must be a string.
+            - To use this function, the 'lowercase' parameter must be a boolean.
+            - To use this function, the 'remove_accents' parameter must be a boolean.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(language, str):
+            if language in ["english", "french"]:
+                pass
+            else:
+                raise ValueError(
+                    "'language' parameter must be in {'english', 'french'}: default='english'"
+                )
+        else:
+            raise TypeError(
+                f"'language' parameter must be a str: got {type(language)}"
+            )
+        
+        if isinstance(lowercase, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
+            )
+        
+        if isinstance(remove_accents, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
+            )
+        
+        return self._apply(
+            steps=[
+                (
+                    "stemmatize",
+                    {
+                        "language": language,
+                        "lowercase": lowercase,
+                        "remove_accents": remove_accents
+                    }
+                )
+            ]
+        )
+
+
+#------------------------------------------------------------------------------
+
+
+class Tokenize(_BaseNet):
+    def __init__(self, data, column: str, n_jobs: int=1, dedup: bool=False, cache=None,
+                 inplace: bool=True, max_memory: int=None) -> None:
+        """
+        Function that allows to build the Tokenize class and initialise the
+        parameters.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
+            Dataset to be cleaned.
+        
+        column : str
+            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
+            parameter should be the 
+            name assigned to the column to clean.
+            - If 'data' parameter is a pandas.core.series.Series, 'column'
+            parameter will be its output name.
+        
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset. If n_jobs > 1, the
+            column is split into chunks cleaned in parallel by a pool of
+            processes. If n_jobs=-1, all the processors are used. Default is 1.
+        
+        dedup : bool, optional, default=False
+            If true, each distinct sentence of the column is cleaned only once
+            and the cleaned sentences are mapped back to the rows. It is
+            faster when the column has many duplicates. If the column is a
+            category, its categories are cleaned. Default is False.
+        
+        cache : ResultCache, optional, default=None
+            If not None, the sentences already cleaned with the same method,
+            parameters and lexicons are read from this on-disk cache instead
+            of being cleaned again, and the new ones are added to it.
+            Default is None.
+        
+        inplace : bool, optional, default=True
+            - If true, the cleaned column is written into 'data', whose other
+            columns and index are not modified.
+            - If false, 'data' is not modified: the methods return a new
+            DataFrame which shares the other columns of 'data' (they are not
+            copied), only the cleaned column is new.
+            A Series is always cleaned in a new DataFrame. Default is True.
+        
+        max_memory : int, optional, default=None
+            If not None, maximal number of bytes used to clean the column, in
+            addition to the dataset and to the cleaned column. The memory used
+            per row is estimated on a sample of the column (with tracemalloc)
+            and the column is cleaned by chunks of rows which stay under this
+            budget, see 'memory_info'. Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'data' parameter must be a
+            pandas.core.frame.DataFrame or pandas.cores.series.Series.
+            - To use this class, the 'column' parameter must be a string.
+            - To use this class, the 'n_jobs' parameter must be an integer.
+            - To use this class, the 'dedup' parameter must be a boolean.
+            - To use this class, the 'cache' parameter must be a ResultCache.
+            - To use this class, the 'inplace' parameter must be a boolean.
+            - To use this class, the 'max_memory' parameter must be an integer.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._set_data(data=data, column=column, inplace=inplace)
+        self._set_options(n_jobs=n_jobs, dedup=dedup, cache=cache, max_memory=max_memory)
+    
+    
+    @_instrument
+    def word_tokenize(self, output: str="list"):
+        """
+        Function that allows to transform in token each word from a sentence in
+        a dataset. Tokenize a word is the fact that divide single string into
+        list of substring.
+        
+        Example of use: >>> string = "I'm a Data Scientist"
+                        ... ["I'm", "a", "Data", "Scientist"]
+
+        Parameters
+        ----------
+        output : {"list", "csr"}, str, optional, default="list"
+            - If "list", each sentence of the dataset is replaced by its list
+            of tokens.
+            - If "csr", the dataset is not modified and the tokens of all the
+            sentences are returned in a compact TokenMatrix (a vocabulary and
+            two numpy arrays), without a Python list per sentence.
+            Default is "list".
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'output' parameter must be a string.
+        
+        ValueError
+            To use this function, the 'output' parameter must be {"list", "csr"}.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame or TokenMatrix
+            Dataset cleaned, or tokens of the dataset if output="csr".
+
+        """
+        if isinstance(output, str):
+            if output == "list":
+                return self._apply(steps=[("word_tokenize", {})])
+            elif output == "csr":
+                return TokenMatrix.from_series(series=self.data[self.column])
+            else:
+                raise ValueError(
+                    f"'output' parameter must be in {{'list', 'csr'}}: got {output}"
+                )
+        else:
+            raise TypeError(
+                f"'output' parameter must be a str: got {type(output)}"
+            )
+    
+    
+    @_instrument
+    def word_detokenize(self, tokens=None) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to transform in sentence a most of tokens from an
+        observation in a dataset. Detokenize a list of tokens is the fact that
+        join list of substring into a single string.
+        
+        Example of use: >>> string = ["I'm", "a", "Data", "Scientist"]
+                        ... "I'm a Data Scientist"
+
+        Parameters
+        ----------
+        tokens : TokenMatrix, optional, default=None
+            If not None, the sentences are rebuilt from this TokenMatrix (see
+            word_tokenize with output="csr") instead of the lists of tokens of
+            the column. Default is None.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'tokens' parameter must be a TokenMatrix.
+        
+        ValueError
+            To use this function, the 'tokens' parameter must have one row per
+            row of the dataset.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if tokens is None:
+            return self._apply(steps=[("word_detokenize", {})])
+        elif isinstance(tokens, TokenMatrix):
+            pass
+        else:
+            raise TypeError(
+                f"'tokens' parameter must be a TokenMatrix: got {type(tokens)}"
+            )
+        
+        if len(tokens) == self.data.shape[0]:
+            self.data[self.column] = tokens.detokenize()
+        else:
+            raise ValueError(
+                f"'tokens' parameter must have {self.data.shape[0]} rows: got {len(tokens)}"
+            )
+        
+        return self.data
+
+
+class TokenMatrix:
+    def __init__(self, vocabulary: list, token_ids: np.ndarray, offsets: np.ndarray,
+                 notna: np.ndarray=None) -> None:
+        """
+        Function that allows to build the TokenMatrix class and initialise the
+        parameters. A TokenMatrix stores the tokens of a column in the CSR
+        layout: the tokens of the row i are the words of the vocabulary whose
+        ids are token_ids[offsets[i]:offsets[i+1]]. The token_ids and offsets
+        arrays are the 'indices' and 'indptr' of a scipy.sparse.csr_matrix,
+        so a vectorizer can use them without a Python object per token.
+
+        Parameters
+        ----------
+        vocabulary : list
+            Words, the id of a word is its position in the list.
+        
+        token_ids : numpy.ndarray
+            Ids of the tokens of all the rows, one after the other.
+        
+        offsets : numpy.ndarray
+            Position of the first token of each row in 'token_ids', followed
+            by the number of tokens: len(offsets) is the number of rows + 1.
+        
+        notna : numpy.ndarray, optional, default=None
+            For each row, False if the value was missing. If None, no value
+            is missing. Default is None.
+
+        Raises
+        ------
+        ValueError
+            To use this class, 'offsets' must start with 0, end with the number
+            of tokens and 'notna' must have one value per row.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.vocabulary = list(vocabulary)
+        self.token_ids = np.asarray(token_ids)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        
+        if len(self.offsets) == 0 or self.offsets[0] != 0 or\
+            self.offsets[-1] != len(self.token_ids):
+            raise ValueError(
+                f"'offsets' parameter must start with 0 and end with {len(self.token_ids)}"
+            )
+        else:
+            pass
+        
+        if notna is None:
+            self.notna = np.ones(len(self.offsets) - 1, dtype=bool)
+        elif len(notna) == len(self.offsets) - 1:
+            self.notna = np.asarray(notna, dtype=bool)
+        else:
+            raise ValueError(
+                f"'notna' parameter must have {len(self.offsets) - 1} values: got {len(notna)}"
+            )
+    
+    
+    @classmethod
+    def from_series(cls, series: pd.core.series.Series):
+        """
+        Function that allows to tokenize a column into a TokenMatrix. The
+        sentences are split on the spaces, as with word_tokenize. If pyarrow
+        is installed, the column is split and encoded by Arrow, without a
+        Python string per token.
+
+        Parameters
+        ----------
+        series : pandas.core.series.Series
+            Column to tokenize.
+
+        Returns
+        -------
+        tokens : TokenMatrix
+            Tokens of the column.
+
+        """
+        array = _arrow_array(series=series)
+        
+        if array is None:
+            # Arrow splits and encodes faster than Python when it is installed
+            try:
+                pyarrow = _import_pyarrow()[0]
+                array = pyarrow.array(
+                    series.to_numpy(dtype=object),
+                    type=pyarrow.large_string(),
+                    from_pandas=True
+                )
+            except ImportError:
+                pass
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                pass
+        else:
+            pass
+        
+        if array is not None:
+            pyarrow = _import_pyarrow()[0]
+            notna = array.is_valid().to_numpy(zero_copy_only=False)
+            splitted = pyarrow.compute.split_pattern(
+                array.fill_null(""),
+                pattern=" "
+            )
+            encoded = pyarrow.compute.dictionary_encode(splitted.flatten())
+            
+            # a missing value has no token
+            offsets = splitted.offsets.to_numpy().astype(np.int64)
+            lengths = np.where(notna, np.diff(offsets), 0)
+            keep = np.repeat(notna, np.diff(offsets))
+            
+            return cls(
+                vocabulary=encoded.dictionary.to_pylist(),
+                token_ids=encoded.indices.to_numpy()[keep],
+                offsets=np.concatenate([[0], np.cumsum(lengths)]),
+                notna=notna
+            )
+        else:
+            pass
+        
+        list_tokens = []
+        list_lengths = []
+        list_notna = series.notna().tolist()
+        
+        for (text, keep) in zip(series.tolist(), list_notna):
+            if keep:
+                words = text.split(" ")
+                list_tokens.extend(words)
+                list_lengths.append(len(words))
+            else:
+                list_lengths.append(0)
+        
+        (token_ids, uniques) = pd.factorize(
+            np.array(list_tokens, dtype=object) if list_tokens else np.array([], dtype=object)
+        )
+        
+        return cls(
+            vocabulary=list(uniques),
+            token_ids=token_ids.astype(np.int32 if len(uniques) < 2**31 else np.int64),
+            offsets=np.concatenate([[0], np.cumsum(list_lengths, dtype=np.int64)]),
+            notna=np.array(list_notna, dtype=bool)
+        )
+    
+    
+    def __len__(self) -> int:
+        """
+        Function that allows to get the number of rows.
+
+        Returns
+        -------
+        rows : int
+            Number of rows.
+
+        """
+        return len(self.offsets) - 1
+    
+    
+    def __getitem__(self, i: int) -> np.ndarray:
+        """
+        Function that allows to get the ids of the tokens of a row. The array
+        is a view of 'token_ids', nothing is copied.
+
+        Parameters
+        ----------
+        i : int
+            Position of the row.
+
+        Returns
+        -------
+        token_ids : numpy.ndarray
+            Ids of the tokens of the row.
+
+        """
+        return self.token_ids[self.offsets[i]:self.offsets[i+1]]
+    
+    
+    def words(self, i: int) -> list:
+        """
+        Function that allows to get the tokens of a row.
+
+        Parameters
+        ----------
+        i : int
+            Position of the row.
+
+        Returns
+        -------
+        list_words : list
+            Tokens of the row, or None if the value was missing.
+
+        """
+        if self.notna[i]:
+            return [self.vocabulary[k] for k in self[i].tolist()]
+        else:
+            return None
+    
+    
+    def to_lists(self) -> list:
+        """
+        Function that allows to get the tokens of all the rows as lists, as
+        word_tokenize with output="list" does.
+
+        Returns
+        -------
+        list_tokens : list
+            List of tokens of each row, None for the missing values.
+
+        """
+        words = np.array(self.vocabulary + [None], dtype=object)[:-1].take(self.token_ids).tolist()
+        bounds = self.offsets.tolist()
+        
+        return [
+            words[bounds[i]:bounds[i+1]] if keep else None
+            for (i, keep) in enumerate(self.notna.tolist())
+        ]
+    
+    
+    def detokenize(self) -> list:
+        """
+        Function that allows to rebuild the sentences, the tokens of each row
+        being joined with a space.
+
+        Returns
+        -------
+        list_texts : list
+            Sentence of each row, None for the missing values.
+
+        """
+        words = np.array(self.vocabulary + [None], dtype=object)[:-1].take(self.token_ids).tolist()
+        bounds = self.offsets.tolist()
+        
+        return [
+            " ".join(words[bounds[i]:bounds[i+1]]) if keep else None
+            for (i, keep) in enumerate(self.notna.tolist())
+        ]
+
+
+#------------------------------------------------------------------------------
+
+
+class Pipeline:
+    def __init__(self, steps: list, n_jobs: int=1, dedup: bool=False,
+                 cache=None, max_memory: int=None) -> None:
+        """
+        Function that allows to build the Pipeline class and initialise the
+        parameters. A pipeline chains several cleaning methods of the TextNet,
+        WordNet and Tokenize classes: they are compiled into a single function
+        so that each sentence is cleaned by all the steps in one pass over the
+        dataset, instead of one pass per method.
+
+        Parameters
+        ----------
+        steps : list
+            Cleaning methods to apply, in order. Each step is the name of a
+            method, or a (name, parameters) tuple to give it arguments.
+            Exemple of use: steps = ["lowercase", "remove_url",
+            ("remove_stopword", {"language": "french"}), "lemmatize"]
+        
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset, see TextNet.
+            Default is 1.
+        
+        dedup : bool, optional, default=False
+            If true, each distinct sentence is cleaned only once, see TextNet.
+            Default is False.
+
+        cache : ResultCache, optional, default=None
+            If not None, on-disk cache of the cleaned sentences, see TextNet.
+            Default is None.
+        
+        max_memory : int, optional, default=None
+            If not None, maximal number of bytes used to clean a dataset, see
+            TextNet. Default is None.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'steps' parameter must be a list.
+            - To use this class, each step must be a string or a tuple
+            (string, dict).
+            - To use this class, the parameters of each step must be valid
+            for its cleaning method.
+            - To use this class, the 'n_jobs' parameter must be an integer.
+            - To use this class, the 'dedup' parameter must be a boolean.
+            - To use this class, the 'cache' parameter must be a ResultCache.
+            - To use this class, the 'max_memory' parameter must be an integer.
+        
+        ValueError
+            - To use this class, each step must be the name of a cleaning
+            method (the 'downcast' and 'word_count_filter' methods are not
+            steps).
+            - To use this class, the parameters of each step must be valid
+            for its cleaning method (e.g. a language with a lexicon).
+            - To use this class, the 'max_memory' parameter must be >= 1.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if isinstance(steps, list):
+            self.steps = []
+        else:
+            raise TypeError(
+                f"'steps' parameter must be a list: got {type(steps)}"
+            )
+        
+        for step in steps:
+            if isinstance(step, str):
+                (name, parameters) = (step, {})
+            elif isinstance(step, tuple) and len(step) == 2 and\
+                isinstance(step[0], str) and isinstance(step[1], dict):
+                (name, parameters) = step
+            else:
+                raise TypeError(
+                    f"each step must be a str or a tuple (str, dict): got {step}"
+                )
+            
+            # the parameters are checked by the cleaning method itself
+            if name in _STEPS:
+                self.steps.extend(_record_step(name, **parameters))
+            else:
+                raise ValueError(
+                    f"each step must be the name of a cleaning method: got {name}"
+                )
+        
+        if isinstance(n_jobs, int):
+            self.n_jobs = n_jobs
+        else:
+            raise TypeError(
+                f"'n_jobs' parameter must be an int: got {type(n_jobs)}"
+            )
+        
+        if isinstance(dedup, bool):
+            self.dedup = dedup
+        else:
+            raise TypeError(
+                f"'dedup' parameter must be a bool: got {type(dedup)}"
+            )
+        
+        if cache is None or isinstance(cache, ResultCache):
+            self.cache = cache
+        else:
+            raise TypeError(
+                f"'cache' parameter must be a ResultCache: got {type(cache)}"
+            )
+        
+        self.max_memory = _check_max_memory(max_memory=max_memory)
+        self.timings = None
+        self.rows = 0
+        self.memory = None
+    
+    
+    def transform(self, data, column: str, profile: bool=False,
+                  inplace: bool=True) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to apply all the steps of the pipeline to each
+        sentence in a dataset, in a single pass.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame
+            Dataset to be cleaned.
+        
+        column : str
+            Name of the column to clean.
+        
+        profile : bool, optional, default=False
+            If true, the time spent in each step is measured and can be read
+            with the 'report' function. Default is False.
+        
+        inplace : bool, optional, default=True
+            If false, 'data' is not modified and a new DataFrame is returned,
+            see TextNet. Default is True.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'profile' parameter must be a boolean.
+            - To use this function, the 'inplace' parameter must be a boolean.
+
+        Returns
+        -------
+        data : pandas.core.frame.DataFrame
+            Dataset cleaned.
+
+        """
+        if isinstance(profile, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'profile' parameter must be a bool: got {type(profile)}"
+            )
+        
+        net = TextNet(
+            data=data,
+            column=column,
+            n_jobs=self.n_jobs,
+            dedup=self.dedup,
+            cache=self.cache,
+            inplace=inplace,
+            max_memory=self.max_memory
+        )
+        
+        if profile == True:
+            self.timings = [0.0] * len(self.steps)
+            self.rows = net.data.shape[0]
+        else:
+            pass
+        
+        data = net._apply(
+            steps=self.steps,
+            timings=self.timings if profile == True else None
+        )
+        self.memory = net.memory_info()
+        
+        return data
+    
+    
+    def memory_info(self) -> dict:
+        """
+        Function that allows to get the memory used by the last call to
+        'transform' with the 'max_memory' option, see TextNet.memory_info.
+
+        Returns
+        -------
+        dict_info : dict
+            Memory used, or None if the 'max_memory' option is None.
+
+        """
+        return None if self.memory is None else dict(self.memory)
+    
+    
+    def transform_iter(self, texts):
+        """
+        Function that allows to apply all the steps of the pipeline to each
+        sentence of an iterable (list, generator, batch of messages, etc.),
+        without pandas. The steps are compiled once, when the first sentence
+        is requested, then each sentence is cleaned only when it is requested:
+        the memory used does not depend on the number of sentences. The
+        'n_jobs', 'dedup' and 'cache' options are not used.
+        
+        Example of use: >>> pipeline = Pipeline(["lowercase", "remove_url"])
+                        >>> for text in pipeline.transform_iter(messages):
+                        ...     send(text)
+
+        Parameters
+        ----------
+        texts : iterable
+            Sentences to clean, str or None for a missing value.
+
+        Raises
+        ------
+        TypeError
+            To use this function, each sentence must be a string or None.
+
+        Returns
+        -------
+        texts : generator
+            Sentences cleaned, in order (None for a missing value, a list of
+            words after the word_tokenize step).
+
+        """
+        function = _compile_steps(steps=self.steps)
+        
+        for text in texts:
+            if isinstance(text, str):
+                yield function(text)
+            elif text is None:
+                yield None
+            else:
+                raise TypeError(
+                    f"each sentence must be a str or None: got {type(text)}"
+                )
+    
+    
+    def transform_file(self, input_path: str, output_path: str, column: str,
+                       chunksize: int=100000, input_format: str=None,
+                       output_format: str=None, profile: bool=False) -> int:
+        """
+        Function that allows to apply all the steps of the pipeline to a file
+        too large to be loaded in memory. The file is read by chunks of
+        'chunksize' rows, each chunk is cleaned and appended to the output
+        file, so the memory used does not depend on the size of the file.
+        The chunks are written to a temporary file, which replaces the output
+        file only when the whole file is cleaned: if an error occurs, the
+        output file is left as it was.
+
+        Parameters
+        ----------
+        input_path : str
+            Path of the file to clean.
+        
+        output_path : str
+            Path of the cleaned file. It is overwritten if it exists.
+        
+        column : str
+            Name of the column to clean.
+        
+        chunksize : int, optional, default=100000
+            Number of rows read, cleaned and written at once. Default is 100000.
+        
+        input_format : {"csv", "jsonl", "parquet"}, str, optional, default=None
+            Format of the input file. If None, it is deduced from the
+            extension of 'input_path'. Default is None.
+        
+        output_format : {"csv", "jsonl", "parquet"}, str, optional, default=None
+            Format of the output file. If None, it is deduced from the
+            extension of 'output_path'. Default is None.
+        
+        profile : bool, optional, default=False
+            If true, the time spent in each step over all the chunks is
+            measured and can be read with the 'report' function.
+            Default is False.
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'chunksize' parameter must be an integer.
+            - To use this function, the 'profile' parameter must be a boolean.
+        
+        ValueError
+            - To use this function, the formats must be {"csv", "jsonl", "parquet"}.
+            - To use this function, the 'column' parameter must be a column
+            of the input file.
+        
+        ImportError
+            The parquet format needs the pyarrow library.
+
+        Returns
+        -------
+        rows : int
+            Number of rows written in the output file.
+
+        """
+        if isinstance(chunksize, int) and chunksize > 0:
+            pass
+        else:
+            raise TypeError(
+                f"'chunksize' parameter must be a positive int: got {chunksize}"
+            )
+        
+        if isinstance(profile, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'profile' parameter must be a bool: got {type(profile)}"
+            )
+        
+        input_format = _file_format(path=input_path, file_format=input_format)
+        output_format = _file_format(path=output_path, file_format=output_format)
+        
+        if profile == True:
+            self.timings = [0.0] * len(self.steps)
+            self.rows = 0
+        else:
+            pass
+        
+        # written under another name and then renamed, so that the output file
+        # is not truncated when the input can not be read or cleaned
+        temporary = f"{output_path}.{os.getpid()}.tmp"
+        tokens = False
+        
+        for (name, parameters) in self.steps:
+            tokens = (tokens or name == "word_tokenize") and name != "word_detokenize"
+        
+        writer = _ChunkWriter(
+            path=temporary,
+            file_format=output_format,
+            column=column,
+            tokens=tokens
+        )
+        rows = 0
+        
+        try:
+            for chunk in _read_chunks(path=input_path, file_format=input_format,
+                                      chunksize=chunksize, column=column):
+                if column in chunk.columns:
+                    pass
+                else:
+                    raise ValueError(
+                        f"'column' parameter must be a column of the input file: got {column}"
+                    )
+                
+                chunk = TextNet(
+                    data=chunk,
+                    column=column,
+                    n_jobs=self.n_jobs,
+                    dedup=self.dedup,
+                    cache=self.cache,
+                    max_memory=self.max_memory
+                )._apply(
+                    steps=self.steps,
+                    timings=self.timings if profile == True else None
+                )
+                writer.write(chunk=chunk)
+                rows += chunk.shape[0]
+        except BaseException:
+            writer.close()
+            
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            else:
+                pass
+            
+            raise
+        
+        writer.close()
+        os.replace(temporary, output_path)
+        
+        if profile == True:
+            self.rows = rows
+        else:
+            pass
+        
+        return rows
+    
+    
+    def report(self) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to get the time spent in each step during the
+        last call to 'transform' with profile=True.
+
+        Raises
+        ------
+        ValueError
+            To use this function, 'transform' must have been called with
+            profile=True.
+
+        Returns
+        -------
+        dataframe_report : pandas.core.frame.DataFrame
+            One row per step with its name, its time in seconds, its share of
+            the total time and its throughput in rows per second.
+
+        """
+        if self.timings == None:
+            raise ValueError(
+                "'transform' must be called with profile=True before 'report'"
+            )
+        else:
+            pass
+        
+        total = sum(self.timings)
+        
+        dataframe_report = pd.DataFrame(
+            {
+                "Step": [name for (name, parameters) in self.steps],
+                "Time (s)": self.timings,
+                "Time (%)": [
+                    100 * timing / total if total > 0 else 0.0 for timing in self.timings
+                ],
+                "Rows/s": [
+                    self.rows / timing if timing > 0 else np.inf for timing in self.timings
+                ]
+            }
+        )
+        
+        return dataframe_report
+
+
+class _ChunkWriter:
+    def __init__(self, path: str, file_format: str, column: str,
+                 tokens: bool=False) -> None:
+        """
+        Function that allows to build the _ChunkWriter class and initialise
+        the parameters. The _ChunkWriter class appends chunks of a dataset to
+        a csv, jsonl or parquet file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write. It is overwritten if it exists.
+        
+        file_format : {"csv", "jsonl", "parquet"}, str
+            Format of the file.
+        
+        column : str
+            Name of the cleaned column. In a parquet file, it is always
+            written as strings, or as lists of strings if 'tokens' is true,
+            whatever the values of the first chunk.
+        
+        tokens : bool, optional, default=False
+            If true, the cleaned column holds lists of words. Default is False.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.path = path
+        self.file_format = file_format
+        self.column = column
+        self.tokens = tokens
+        self.file = None
+        self.writer = None
+        
+        if file_format == "parquet":
+            _import_pyarrow()
+        else:
+            self.file = open(path, "w", encoding="utf-8", newline="")
+    
+    
+    def write(self, chunk: pd.core.frame.DataFrame) -> None:
+        """
+        Function that allows to append a chunk to the file.
+
+        Parameters
+        ----------
+        chunk : pandas.core.frame.DataFrame
+            Chunk to write.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if self.file_format == "csv":
+            chunk.to_csv(self.file, header=self.file.tell() == 0, index=False)
+        elif self.file_format == "jsonl":
+            if chunk.shape[0] > 0:
+                self.file.write(
+                    chunk.to_json(
+                        orient="records",
+                        lines=True,
+                        force_ascii=False
+                    ).rstrip("\n") + "\n"
+                )
+            else:
+                pass
+        else:
+            (pa, pq) = _import_pyarrow()
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            
+            # the type of the cleaned column is not guessed from the first
+            # chunk, which can be empty or only hold null values
+            if self.writer == None:
+                schema = table.schema.set(
+                    table.schema.get_field_index(self.column),
+                    pa.field(self.column, self._column_type())
+                )
+                self.writer = pq.ParquetWriter(self.path, schema)
+            else:
+                pass
+            
+            self.writer.write_table(table.cast(self.writer.schema))
+    
+    
+    def _column_type(self):
+        """
+        Hidden function that allows to get the Arrow type of the cleaned column.
+
+        Returns
+        -------
+        column_type : pyarrow.DataType
+            String type, or list of strings type if 'tokens' is true.
+
+        """
+        (pa, pq) = _import_pyarrow()
+        
+        if self.tokens == True:
+            return pa.list_(pa.string())
+        else:
+            return pa.string()
+            
+            self.writer.write_table(table)
+    
+    
+    def close(self) -> None:
+        """
+        Function that allows to close the file. A parquet file without any
+        chunk is written with the cleaned column only.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if self.file != None:
+            self.file.close()
+        elif self.writer != None:
+            self.writer.close()
+        else:
+            (pa, pq) = _import_pyarrow()
+            pq.write_table(
+                pa.table({self.column: pa.array([], type=self._column_type())}),
+                self.path
+            )
+
+
+def _read_chunks(path: str, file_format: str, chunksize: int, column: str):
+    """
+    Hidden function that allows to read a csv, jsonl or parquet file by chunks.
+    The column to clean is read as text, so that its type does not depend on
+    the values of each chunk, and a parquet file without any row gives one
+    empty chunk.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to read.
+    
+    file_format : {"csv", "jsonl", "parquet"}, str
+        Format of the file.
+    
+    chunksize : int
+        Number of rows of each chunk.
+    
+    column : str
+        Name of the column to read as text. Missing values stay missing.
+
+    Yields
+    ------
+    chunk : pandas.core.frame.DataFrame
+        Chunk of the file.
+
+    """
+    if file_format == "csv":
+        with pd.read_csv(path, chunksize=chunksize, dtype={column: str}) as reader:
+            yield from reader
+    elif file_format == "jsonl":
+        # the lines are decoded here, as pandas would turn the integers of a
+        # chunk with a missing value into floats ("1" would become "1.0")
+        with open(path, encoding="utf-8") as file:
+            records = []
+            
+            for line in file:
+                if line.strip() != "":
+                    records.append(json.loads(line))
+                else:
+                    pass
+                
+                if len(records) == chunksize:
+                    yield _text_records(records=records, column=column)
+                    records = []
+                else:
+                    pass
+            
+            if len(records) > 0:
+                yield _text_records(records=records, column=column)
+            else:
+                pass
+    else:
+        (pa, pq) = _import_pyarrow()
+        parquet_file = pq.ParquetFile(path)
+        index = parquet_file.schema_arrow.get_field_index(column)
+        empty = True
+        
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            table = pa.Table.from_batches([batch])
+            
+            if index >= 0 and not pa.types.is_string(table.schema.field(index).type):
+                table = table.set_column(
+                    index,
+                    column,
+                    table.column(index).cast(pa.string())
+                )
+            else:
+                pass
+            
+            empty = False
+            yield table.to_pandas()
+        
+        if empty == True:
+            yield parquet_file.schema_arrow.empty_table().to_pandas()
+        else:
+            pass
+
+
+def _text_records(records: list, column: str) -> pd.core.frame.DataFrame:
+    """
+    Hidden function that allows to build a chunk from the decoded lines of a
+    jsonl file, with the values of the column to clean as strings.
+
+    Parameters
+    ----------
+    records : list
+        Decoded lines of the file, one dictionary per row.
+    
+    column : str
+        Name of the column to read as text. Missing values stay missing.
+
+    Returns
+    -------
+    chunk : pandas.core.frame.DataFrame
+        Chunk of the file.
+
+    """
+    chunk = pd.DataFrame.from_records(records)
+    
+    if column in chunk.columns:
+        chunk[column] = pd.Series(
+            [
+                value if value is None or isinstance(value, str) else str(value)
+                for value in (record.get(column) for record in records)
+            ],
+            index=chunk.index,
+            dtype=object
+        )
+    else:
+        pass
+    
+    return chunk
+
+
+def _file_format(path: str, file_format: str=None) -> str:
+    """
+    Hidden function that allows to check a file format, or to deduce it from
+    the extension of the file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    
+    file_format : str, optional, default=None
+        Format of the file. If None, it is deduced from the extension.
+        Default is None.
+
+    Raises
+    ------
+    ValueError
+        The format must be {"csv", "jsonl", "parquet"}.
+
+    Returns
+    -------
+    file_format : str
+        Format of the file.
+
+    """
+    if file_format == None:
+        extension = os.path.splitext(path)[1].lower().lstrip(".")
+        file_format = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(
+            extension,
+            extension
+        )
+    else:
+        pass
+    
+    if file_format in ["csv", "jsonl", "parquet"]:
+        return file_format
+    else:
+        raise ValueError(
+            f"file format must be in {{'csv', 'jsonl', 'parquet'}}: got {file_format}"
+        )
+
+
+def _import_pyarrow() -> tuple:
+    """
+    Hidden function that allows to import pyarrow, which is only needed for
+    the parquet format and the Arrow string columns.
+
+    Raises
+    ------
+    ImportError
+        The pyarrow library is not installed.
+
+    Returns
+    -------
+    (pyarrow, pyarrow.parquet) : tuple
+        Modules.
+
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "the parquet format and the Arrow columns need the pyarrow library: pip install pyarrow"
+        )
+    
+    return (pyarrow, pyarrow.parquet)
+
+
+#------------------------------------------------------------------------------
+
+
+class LazyNet:
+    def __init__(self, data, column: str, n_jobs: int=1, dedup: bool=False, cache=None,
+                 inplace: bool=True, max_memory: int=None) -> None:
+        """
+        Function that allows to build the LazyNet class and initialise the
+        parameters. The cleaning methods of the TextNet, WordNet and Tokenize
+        classes can be called on a LazyNet, with the same arguments: they are
+        checked and added to a plan, and nothing runs until the 'collect'
+        function is called. The plan is then optimized (see 'explain') and
+        its steps run in as few passes over the dataset as possible.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
+            Dataset to be cleaned.
+        
+        column : str
+            Name of the column to clean, see TextNet.
+        
+        n_jobs : int, optional, default=1
+            Number of processes used to clean the dataset, see TextNet.
+            Default is 1.
+        
+        dedup : bool, optional, default=False
+            If true, each distinct sentence is cleaned only once, see TextNet.
+            Default is False.
+        
+        cache : ResultCache, optional, default=None
+            If not None, on-disk cache of the cleaned sentences, see TextNet.
+            Default is None.
+        
+        inplace : bool, optional, default=True
+            - If true, the cleaned column is written into 'data', whose other
+            columns and index are not modified.
+            - If false, 'data' is not modified: the methods return a new
+            DataFrame which shares the other columns of 'data' (they are not
+            copied), only the cleaned column is new.
+            A Series is always cleaned in a new DataFrame. Default is True.
+        
+        max_memory : int, optional, default=None
+            If not None, maximal number of bytes used to clean the column, in
+            addition to the dataset and to the cleaned column. The memory used
+            per row is estimated on a sample of the column (with tracemalloc)
+            and the column is cleaned by chunks of rows which stay under this
+            budget, see 'memory_info'. Default is None.
+
+        Raises
+        ------
+        TypeError
+            To use this class, the parameters must be valid for a TextNet.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.net = TextNet(
+            data=data,
+            column=column,
+            n_jobs=n_jobs,
+            dedup=dedup,
+            cache=cache,
+            inplace=inplace,
+            max_memory=max_memory
+        )
+        self.data = self.net.data
+        self.column = self.net.column
+        self.plan = []
+    
+    
+    def __getattr__(self, name: str):
+        """
+        Function that allows to get a cleaning method of the TextNet, WordNet
+        or Tokenize class which adds its step to the plan and returns the
+        LazyNet, so that the calls can be chained.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cleaning method.
+
+        Raises
+        ------
+        AttributeError
+            The 'downcast' method and the other attributes are not planned.
+
+        Returns
+        -------
+        method : callable
+            Cleaning method.
+
+        """
+        if name in _LAZY_METHODS:
+            return functools.partial(self._record, name)
+        else:
+            raise AttributeError(
+                f"'LazyNet' object has no attribute '{name}'"
+            )
+    
+    
+    def explain(self, optimize: bool=True) -> list:
+        """
+        Function that allows to get the steps which 'collect' will run. The
+        optimizer keeps the result of the plan and:
+            - moves each word_count_filter before the steps which do not
+            change the number of spaces, so that less rows are cleaned;
+            - removes a lowercase step, and the lowercase of the steps with
+            lowercase=True, when the sentences are already lowercase;
+            - removes a step repeated just after itself when a second run
+            does not change the sentences (e.g. remove_space);
+            - merges remove_whitespace with remove_space, remove_digit,
+            remove_emoji and additional_cleaning into one regex of
+            characters, and remove_mention with remove_hastag into one regex,
+            when these steps are adjacent.
+
+        Parameters
+        ----------
+        optimize : bool, optional, default=True
+            If false, the plan is returned as built. Default is True.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'optimize' parameter must be a boolean.
+
+        Returns
+        -------
+        list_steps : list
+            List of (name, parameters) tuples, in order. The merged steps
+            have a name starting with an underscore and the merged steps in
+            their parameters.
+
+        """
+        if isinstance(optimize, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'optimize' parameter must be a bool: got {type(optimize)}"
+            )
+        
+        if optimize == True:
+            return _optimize_plan(plan=self.plan)
+        else:
+            return list(self.plan)
+    
+    
+    @_instrument
+    def collect(self, optimize: bool=True) -> pd.core.frame.DataFrame:
+        """
+        Function that allows to run the plan on the dataset. The steps between
+        two word_count_filter run together, in a single pass.
+
+        Parameters
+        ----------
+        optimize : bool, optional, default=True
+            If true, the plan is optimized first, see 'explain'.
+            Default is True.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'optimize' parameter must be a boolean.
+
+        Returns
+        -------
+        self.data : pandas.core.frame.DataFrame
+            Dataset cleaned (a new DataFrame if the plan filters rows).
+
+        """
+        list_steps = []
+        
+        for (name, parameters) in self.explain(optimize=optimize) + [(None, None)]:
+            if name == "word_count_filter" or name == None:
+                if list_steps:
+                    self.net._apply(steps=list_steps)
+                    list_steps = []
+                else:
+                    pass
+                
+                if name == "word_count_filter":
+                    self.net.data = self.net.word_count_filter(**parameters)
+                else:
+                    pass
+            else:
+                list_steps.append((name, parameters))
+        
+        self.data = self.net.data
+        
+        return self.data
+    
+    
+    def _record(self, name: str, *args, **kwargs):
+        """
+        Hidden function that allows to check the arguments of a cleaning
+        method and to add its step to the plan.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cleaning method.
+        
+        *args, **kwargs
+            Arguments of the cleaning method.
+
+        Raises
+        ------
+        TypeError
+            The arguments must be valid for the cleaning method.
+        
+        ValueError
+            The arguments must be valid for the cleaning method, see
+            _record_step.
+
+        Returns
+        -------
+        self : LazyNet
+            LazyNet with the step added to its plan.
+
+        """
+        self.plan.extend(_record_step(name, *args, **kwargs))
+        
+        return self
+
+
+def _record_step(name: str, *args, **kwargs) -> list:
+    """
+    Hidden function that allows to check the arguments of a cleaning method,
+    without a dataset, and to get its steps with all their parameters. The
+    method is called on a _PlanRecorder, so its own checks are run.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cleaning method.
+    
+    *args, **kwargs
+        Arguments of the cleaning method.
+
+    Raises
+    ------
+    TypeError
+        The arguments must be valid for the cleaning method.
+    
+    ValueError
+        - The arguments must be valid for the cleaning method.
+        - The word_tokenize and word_detokenize methods are only steps with
+        their default 'output' and 'tokens' parameters.
+
+    Returns
+    -------
+    list_steps : list
+        List of (name, parameters) tuples of the method.
+
+    """
+    function = inspect.unwrap(getattr(_LAZY_METHODS[name], name))
+    recorder = _PlanRecorder()
+    
+    try:
+        arguments = inspect.signature(function).bind(recorder, *args, **kwargs)
+    except TypeError as error:
+        raise TypeError(
+            f"invalid arguments for the '{name}' method: {error}"
+        )
+    
+    arguments.apply_defaults()
+    
+    if name == "lowercase":
+        recorder.steps.append(("lowercase", {}))
+    elif name == "word_count_filter":
+        if isinstance(arguments.arguments["min_words"], int):
+            recorder.steps.append(
+                ("word_count_filter", {"min_words": arguments.arguments["min_words"]})
+            )
+        else:
+            raise TypeError(
+                f"'min_words' parameter must be an int: got {type(arguments.arguments['min_words'])}"
+            )
+    elif name == "word_tokenize" and arguments.arguments["output"] != "list":
+        raise ValueError(
+            f"'output' parameter must be 'list' in a step: got {arguments.arguments['output']}"
+        )
+    elif name == "word_detokenize" and arguments.arguments["tokens"] is not None:
+        raise ValueError(
+            "'tokens' parameter must be None in a step"
+        )
+    else:
+        function(*arguments.args, **arguments.kwargs)
+    
+    return recorder.steps
+
+
+class _PlanRecorder(_BaseNet):
+    def __init__(self) -> None:
+        """
+        Function that allows to build the _PlanRecorder class. A cleaning
+        method called on a _PlanRecorder checks its arguments and gives its
+        steps to '_apply', which keeps them instead of running them.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.steps = []
+    
+    
+    def _apply(self, steps: list, timings: list=None) -> None:
+        """
+        Hidden function that allows to keep the steps of a cleaning method.
+
+        Parameters
+        ----------
+        steps : list
+            List of (name, parameters) tuples of the steps.
+        
+        timings : list, optional, default=None
+            Not used. Default is None.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.steps.extend(steps)
+
+
+def _optimize_plan(plan: list) -> list:
+    """
+    Hidden function that allows to optimize the plan of a LazyNet, see
+    LazyNet.explain. The optimized plan gives the same result as the plan.
+
+    Parameters
+    ----------
+    plan : list
+        List of (name, parameters) tuples, in order.
+
+    Returns
+    -------
+    list_steps : list
+        Optimized list of (name, parameters) tuples.
+
+    """
+    list_steps = []
+    
+    # a filter counts the spaces: it can run before the steps keeping them
+    for (name, parameters) in plan:
+        position = len(list_steps)
+        
+        if name == "word_count_filter":
+            while position > 0 and list_steps[position-1][0] != "word_count_filter" and\
+                _step_traits(*list_steps[position-1])[1] == True:
+                position -= 1
+        else:
+            pass
+        
+        list_steps.insert(position, (name, parameters))
+    
+    plan = list_steps
+    list_steps = []
+    lowercase = False
+    
+    # str.lower does not change a lowercase sentence
+    for (name, parameters) in plan:
+        if name == "lowercase" and lowercase == True:
+            continue
+        elif name in _PRELUDE_STEPS and parameters.get("lowercase", True) == True:
+            if lowercase == True:
+                parameters = dict(parameters, lowercased=True)
+            else:
+                pass
+            
+            lowercase = True
+        elif name == "lowercase":
+            lowercase = True
+        else:
+            pass
+        
+        lowercase = lowercase and _step_traits(name, parameters)[0]
+        list_steps.append((name, parameters))
+    
+    plan = list_steps
+    list_steps = []
+    
+    for (name, parameters) in plan:
+        if list_steps:
+            (previous, previous_parameters) = list_steps[-1]
+        else:
+            (previous, previous_parameters) = (None, None)
+        
+        fused = _fused_step(name=name, parameters=parameters)
+        
+        if (name, parameters) == (previous, previous_parameters) and name in _IDEMPOTENT_STEPS:
+            continue
+        elif fused != None and fused == _fused_step(name=previous, parameters=previous_parameters):
+            if previous == fused:
+                list_fused = previous_parameters["steps"]
+            else:
+                list_fused = [(previous, previous_parameters)]
+            
+            list_steps[-1] = (fused, {"steps": list_fused + [(name, parameters)]})
+        else:
+            list_steps.append((name, parameters))
+    
+    return list_steps
+
+
+def _fused_step(name: str, parameters: dict) -> str:
+    """
+    Hidden function that allows to get the merged step which a step can be
+    part of, with the adjacent steps of the same merged step.
+
+    Parameters
+    ----------
+    name : str
+        Name of the step.
+    
+    parameters : dict
+        Parameters of the step.
+
+    Returns
+    -------
+    fused : str
+        Name of the merged step, or None if the step is not merged.
+
+    """
+    if name in ["remove_space", "remove_whitespace", "_squeeze_space"]:
+        return "_squeeze_space"
+    elif name in ["remove_digit", "remove_emoji", "_delete_characters"] or\
+        (name == "additional_cleaning" and not parameters.get("add_regexs")):
+        return "_delete_characters"
+    elif name in ["remove_mention", "remove_hastag", "_delete_regexs"]:
+        return "_delete_regexs"
+    else:
+        return None
+
+
+def _step_traits(name: str, parameters: dict) -> tuple:
+    """
+    Hidden function that allows to know if a step keeps a lowercase sentence
+    lowercase, and if it keeps the number of spaces of a sentence.
+
+    Parameters
+    ----------
+    name : str
+        Name of the step.
+    
+    parameters : dict
+        Parameters of the step.
+
+    Returns
+    -------
+    (lowercase, spaces) : tuple
+        Booleans, false when the step may not keep the property.
+
+    """
+    if name in ["lowercase", "word_count_filter", "remove_url", "remove_email",
+                "remove_digit", "remove_mention", "remove_hastag", "remove_plural"]:
+        traits = (True, True)
+    elif name == "remove_emoji":
+        traits = (
+            True,
+            not any(
+                [first <= 0x20 <= last for (first, last) in _compile_emoji(ranges=parameters.get("ranges")).ranges]
+            )
+        )
+    elif name == "additional_cleaning":
+        traits = (True, not parameters.get("add_regexs"))
+    elif name in ["remove_punctuation", "remove_html", "remove_space",
+                  "remove_whitespace", "remove_single_character", "remove_stopword"]:
+        traits = (True, False)
+    elif name == "remove_accent":
+        traits = (True, True)
+    elif name == "lemmatize" and parameters.get("lexicon") != None:
+        traits = _open_lemma_table(path=parameters["lexicon"]).traits
+    elif name in ["lemmatize", "stemmatize"]:
+        traits = lexicons._get_compiled(
+            kind=_STEP_LEXICONS[name],
+            name=parameters.get("language", "english"),
+            builder=_lexicon_traits
+        )
+    else:
+        return (False, False)
+    
+    # the accents are removed with the lexicon and the "translate" method
+    if name == "remove_accent" or parameters.get("remove_accents") == True:
+        (lowercase, spaces) = lexicons._get_compiled(
+            kind="accents",
+            name="accents",
+            builder=_lexicon_traits
+        )
+        traits = (traits[0] and lowercase, traits[1] and spaces)
+    else:
+        pass
+    
+    return traits
+
+
+def _lexicon_traits(lexicon) -> tuple:
+    """
+    Hidden function that allows to know if the replacements of a lexicon
+    keep a lowercase sentence lowercase, and if they keep the number of
+    spaces of a sentence.
+
+    Parameters
+    ----------
+    lexicon : dict or list
+        Lexicon {regex: replacement}, or list of regexs to delete.
+
+    Returns
+    -------
+    (lowercase, spaces) : tuple
+        Booleans, false when a replacement may not keep the property.
+
+    """
+    if isinstance(lexicon, dict):
+        items = lexicon.items()
+    else:
+        items = [(regex, "") for regex in lexicon]
+    
+    lowercase = all([value == value.lower() for (regex, value) in items])
+    spaces = all(
+        [
+            " " not in value and (
+                _REGEX_WORD_ENTRY.fullmatch(regex) or _REGEX_SUFFIX_ENTRY.fullmatch(regex) or\
+                " " not in (_literal_sequence(regex) or " ")
+            ) for (regex, value) in items
+        ]
+    )
+    
+    return (lowercase, spaces)
+
+
+#------------------------------------------------------------------------------
+
+
+class AsyncCleaner:
+    def __init__(self, steps: list, max_batch: int=64, max_delay: float=0.002,
+                 n_jobs: int=1) -> None:
+        """
+        Function that allows to build the AsyncCleaner class and initialise the
+        parameters. An AsyncCleaner cleans the sentences sent one by one by
+        asyncio tasks (e.g. one per request of a web service): the sentences
+        are gathered in micro-batches, each batch is cleaned by the steps in
+        an executor, so the event loop is never blocked, and the result of
+        each sentence is given back to the task which sent it.
+        
+        Example of use: >>> cleaner = AsyncCleaner(["lowercase", "remove_url"])
+                        >>> text = await cleaner.clean("Hello https://x.y")
+
+        Parameters
+        ----------
+        steps : list
+            Cleaning methods to apply, in order, see Pipeline.
+        
+        max_batch : int, optional, default=64
+            A batch is cleaned as soon as it has 'max_batch' sentences.
+            Default is 64.
+        
+        max_delay : float, optional, default=0.002
+            A batch is cleaned at the latest 'max_delay' seconds after its
+            first sentence was sent. Default is 0.002.
+        
+        n_jobs : int, optional, default=1
+            - If 1, the batches are cleaned in a thread of the default
+            executor of the event loop.
+            - If > 1, they are cleaned by a pool of 'n_jobs' processes, see
+            TextNet. If -1, all the processors are used.
+            Default is 1.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'steps' parameter must be valid for a
+            Pipeline.
+            - To use this class, the 'max_batch' and 'n_jobs' parameters must
+            be integers.
+            - To use this class, the 'max_delay' parameter must be a float.
+        
+        ValueError
+            - To use this class, the 'max_batch' parameter must be >= 1.
+            - To use this class, the 'max_delay' parameter must be >= 0.
+            - To use this class, the 'n_jobs' parameter must be -1 or >= 1.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.steps = Pipeline(steps=steps).steps
+        
+        if isinstance(max_batch, int) and not isinstance(max_batch, bool):
+            if max_batch >= 1:
+                self.max_batch = max_batch
+            else:
+                raise ValueError(
+                    f"'max_batch' parameter must be >= 1: got {max_batch}"
+                )
+        else:
+            raise TypeError(
+                f"'max_batch' parameter must be an int: got {type(max_batch)}"
+            )
+        
+        if isinstance(max_delay, (int, float)) and not isinstance(max_delay, bool):
+            if max_delay >= 0:
+                self.max_delay = max_delay
+            else:
+                raise ValueError(
+                    f"'max_delay' parameter must be >= 0: got {max_delay}"
+                )
+        else:
+            raise TypeError(
+                f"'max_delay' parameter must be a float: got {type(max_delay)}"
+            )
+        
+        if isinstance(n_jobs, int) and not isinstance(n_jobs, bool):
+            if n_jobs == -1:
+                self.n_jobs = os.cpu_count() or 1
+            elif n_jobs >= 1:
+                self.n_jobs = n_jobs
+            else:
+                raise ValueError(
+                    f"'n_jobs' parameter must be -1 or >= 1: got {n_jobs}"
+                )
+        else:
+            raise TypeError(
+                f"'n_jobs' parameter must be an int: got {type(n_jobs)}"
+            )
+        
+        # the lexicons are loaded now, not during the first request
+        self.function = _compile_steps(steps=self.steps)
+        self.list_pending = []
+        self.set_tasks = set()
+        self.timer = None
+        self.requests = 0
+        self.batches = 0
+    
+    
+    async def __aenter__(self):
+        return self
+    
+    
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+    
+    
+    async def clean(self, text: str):
+        """
+        Function that allows to clean a sentence. The sentence waits for the
+        next batch, at most 'max_delay' seconds.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to clean, or None for a missing value.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'text' parameter must be a string.
+
+        Returns
+        -------
+        text : str
+            Sentence cleaned (a list of words after the word_tokenize step).
+
+        """
+        if isinstance(text, str) or text is None:
+            pass
+        else:
+            raise TypeError(
+                f"'text' parameter must be a str: got {type(text)}"
+            )
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.list_pending.append((text, future))
+        self.requests += 1
+        
+        if len(self.list_pending) >= self.max_batch:
+            self._flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self._flush)
+        else:
+            pass
+        
+        return await future
+    
+    
+    async def aclose(self) -> None:
+        """
+        Function that allows to clean the sentences waiting for a batch and to
+        wait for all the batches being cleaned.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._flush()
+        
+        if self.set_tasks:
+            await asyncio.gather(*self.set_tasks, return_exceptions=True)
+        else:
+            pass
+    
+    
+    def info(self) -> dict:
+        """
+        Function that allows to get the number of sentences and batches
+        cleaned.
+
+        Returns
+        -------
+        dict_info : dict
+            Sentences sent, batches cleaned and mean size of a batch.
+
+        """
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "batch_size": self.requests / self.batches if self.batches > 0 else 0.0
+        }
+    
+    
+    def _flush(self) -> None:
+        """
+        Hidden function that allows to send the sentences waiting to the
+        executor, as one batch.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        else:
+            pass
+        
+        if self.list_pending:
+            (batch, self.list_pending) = (self.list_pending, [])
+            task = asyncio.get_running_loop().create_task(self._run(batch=batch))
+            self.set_tasks.add(task)
+            task.add_done_callback(self.set_tasks.discard)
+            self.batches += 1
+        else:
+            pass
+    
+    
+    async def _run(self, batch: list) -> None:
+        """
+        Hidden function that allows to clean a batch in the executor and to
+        give its result to the tasks waiting for it.
+
+        Parameters
+        ----------
+        batch : list
+            List of (sentence, future) tuples.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        loop = asyncio.get_running_loop()
+        values = [text for (text, future) in batch]
+        notna = [text is not None for text in values]
+        
+        try:
+            if self.n_jobs > 1:
+                (cleaned, timings) = await loop.run_in_executor(
+                    _get_executor(n_jobs=self.n_jobs),
+                    _apply_chunk,
+                    self.steps,
+                    values,
+                    notna,
+                    False
+                )
+            else:
+                cleaned = await loop.run_in_executor(
+                    None,
+                    _apply_rows,
+                    self.function,
+                    values,
+                    notna
+                )
+        except Exception as error:
+            for (text, future) in batch:
+                if not future.done():
+                    future.set_exception(error)
+                else:
+                    pass
+            
+            return
+        
+        for ((text, future), value) in zip(batch, cleaned):
+            if not future.done():
+                future.set_result(value)
+            else:
+                pass
+
+
+#------------------------------------------------------------------------------
+
+
+def _compile_steps(steps: list, timings: list=None):
+    """
+    Hidden function that allows to build a single function, applied to each
+    row, from a list of cleaning steps.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, parameters) tuples, where name is the name of a
+        cleaning method (e.g. "remove_url") and parameters a dict of its
+        arguments (e.g. {"word_length": 5} for "remove_plural").
+    
+    timings : list, optional, default=None
+        If not None, list of floats of the same length as 'steps': the time
+        spent in each step (in seconds) is added to it. Default is None.
+
+    Returns
+    -------
+    function : callable
+        Function that takes a row and returns it cleaned.
+
+    """
+    list_functions = [
+        _compile_step(name, **parameters) for (name, parameters) in steps
+    ]
+    
+    if timings != None:
+        list_functions = [
+            functools.partial(
+                _run_timed,
+                function=function,
+                timings=timings,
+                index=index
+            ) for (index, function) in enumerate(list_functions)
+        ]
+    else:
+        pass
+    
+    return _chain_functions(list_functions=list_functions)
+
+
+def _compile_step(name: str, **parameters):
+    """
+    Hidden function that allows to build the function applied to each row
+    for a cleaning step. The function does the same as the cleaning method
+    of the same name, with the same arguments and default values.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cleaning method.
+    
+    **parameters
+        Arguments of the cleaning method.
+
+    Raises
+    ------
+    ValueError
+        The 'name' parameter must be the name of a cleaning method.
+
+    Returns
+    -------
+    function : callable
+        Function that takes a row and returns it cleaned.
+
+    """
+    if name in _REGEX_STEPS:
+        return functools.partial(_sub_regexs, list_regexs=_REGEX_STEPS[name])
+    elif name == "_squeeze_space":
+        return _squeeze_space
+    elif name == "_delete_characters":
+        return functools.partial(
+            _sub_regexs,
+            list_regexs=[(_compile_characters(steps=parameters["steps"]), "")]
+        )
+    elif name == "_delete_regexs":
+        regex = re.compile(
+            "|".join(
+                [_REGEX_STEPS[step][0][0].pattern for (step, step_parameters) in parameters["steps"]]
+            )
+        )
+        
+        return functools.partial(_sub_regexs, list_regexs=[(regex, "")])
+    elif name == "remove_emoji":
+        return _compile_emoji(ranges=parameters.get("ranges")).strip
+    elif name == "lowercase":
+        return str.lower
+    elif name == "remove_space":
+        return str.strip
+    elif name == "additional_cleaning":
+        list_functions = [_LITERAL_ADDITIONAL.replace]
+        
+        # the regexs given by the user are applied in their order, after
+        if parameters.get("add_regexs"):
+            list_functions.append(
+                functools.partial(
+                    _sub_regexs,
+                    list_regexs=[
+                        (re.compile(regex, flags=re.IGNORECASE), "") for regex in parameters["add_regexs"]
+                    ]
+                )
+            )
+        else:
+            pass
+        
+        return _chain_functions(list_functions=list_functions)
+    elif name == "remove_accent":
+        method = parameters.get("method", "translate")
+        
+        if method == "regex":
+            list_regexs = lexicons._get_compiled(
+                kind="accents",
+                name="accents",
+                builder=_compile_regexs
+            )
+            function = functools.partial(_sub_regexs, list_regexs=list_regexs)
+        else:
+            function = lexicons._get_compiled(
+                kind="accents",
+                name="accents",
+                builder=_AccentFolder,
+                method=method
+            ).fold
+        
+        # "lowercased" is set by the LazyNet optimizer for a lowercase row
+        return _chain_functions(
+            list_functions=_compile_prelude(
+                lowercase=parameters.get("lowercase", True) and not parameters.get("lowercased", False),
+                remove_accents=False
+            ) + [function]
+        )
+    elif name == "remove_single_character":
+        return _remove_single_character
+    elif name == "remove_plural":
+        return functools.partial(
+            _remove_plural,
+            word_length=parameters.get("word_length", 5)
+        )
+    elif name in ["remove_stopword", "lemmatize", "stemmatize"]:
+        language = parameters.get("language", "english")
+        lowercase = parameters.get("lowercase", True)
+        remove_accents = parameters.get("remove_accents", False)
+        list_functions = _compile_prelude(
+            lowercase=lowercase and not parameters.get("lowercased", False),
+            remove_accents=remove_accents
+        )
+        
+        if name == "remove_stopword":
+            stopwords = lexicons._get_compiled(
+                kind="stopwords",
+                name=language,
+                builder=_StopwordSet,
+                lowercase=lowercase,
+                remove_accents=remove_accents
+            )
+            
+            list_functions.append(
+                functools.partial(
+                    _remove_words,
+                    set_words=stopwords.select(
+                        remove_stopwords=parameters.get("remove_stopwords"),
+                        add_stopwords=parameters.get("add_stopwords")
+                    )
+                )
+            )
+        elif name == "lemmatize" and parameters.get("lexicon") != None:
+            list_functions.append(
+                _open_lemma_table(path=parameters["lexicon"]).lemmatize
+            )
+        elif name == "lemmatize":
+            engine = lexicons._get_compiled(
+                kind="lemme",
+                name=language,
+                builder=_LemmaEngine,
+                lowercase=lowercase,
+                remove_accents=remove_accents
+            )
+            
+            list_functions.append(engine.lemmatize)
+        else:
+            engine = lexicons._get_compiled(
+                kind="stemme",
+                name=language,
+                builder=_StemEngine,
+                language=language,
+                lowercase=lowercase,
+                remove_accents=remove_accents
+            )
+            
+            list_functions.append(engine.stemmatize)
+        
+        return _chain_functions(list_functions=list_functions)
+    elif name == "word_tokenize":
+        return functools.partial(str.split, sep=" ")
+    elif name == "word_detokenize":
+        return " ".join
+    else:
+        raise ValueError(
+            f"'name' parameter must be the name of a cleaning method: got {name}"
+        )
+
+
+def _compile_prelude(lowercase: bool, remove_accents: bool) -> list:
+    """
+    Hidden function that allows to build the functions applied to each row
+    before a word level cleaning (lowercase and accents removal).
+
+    Parameters
+    ----------
+    lowercase : bool
+        If true, the rows are transform to lowercase.
+    
+    remove_accents : bool
+        If true, the accents are removed from the rows.
+
+    Returns
+    -------
+    list_functions : list
+        Functions to apply, in order.
+
+    """
+    list_functions = []
+    
+    if lowercase == True:
+        list_functions.append(str.lower)
+    else:
+        pass
+    
+    if remove_accents == True:
+        list_functions.append(_compile_step("remove_accent", lowercase=False))
+    else:
+        pass
+    
+    return list_functions
+
+
+def _compile_characters(steps: list):
+    """
+    Hidden function that allows to compile steps which delete characters
+    (remove_digit, remove_emoji and additional_cleaning) into a single regex.
+    Deleting a character never creates another one, so the regex gives the
+    same result as the steps one after the other.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, parameters) tuples of the steps.
+
+    Returns
+    -------
+    regex : re.Pattern
+        Regex matching the characters deleted by the steps.
+
+    """
+    list_classes = []
+    
+    for (name, parameters) in steps:
+        if name == "remove_digit":
+            list_classes.append(r"\d")
+        elif name == "remove_emoji":
+            stripper = _compile_emoji(ranges=parameters.get("ranges"))
+            
+            if stripper.ranges:
+                list_classes.append(stripper.regex.pattern[1:-2])
+            else:
+                pass
+        else:
+            list_classes.append(
+                "".join([re.escape(character) for character in _ADDITIONAL_CHARACTERS])
+            )
+    
+    if list_classes:
+        return re.compile("[" + "".join(list_classes) + "]+")
+    else:
+        return re.compile("(?!)")
+
+
+def _fold_words(list_words: list, lowercase: bool) -> list:
+    """
+    Hidden function that allows to remove the accents from the words of a
+    lexicon, as TextNet.remove_accent does for the rows of a dataset.
+
+    Parameters
+    ----------
+    list_words : list
+        Words (or regexs) of the lexicon.
+    
+    lowercase : bool
+        If true, the words are transform to lowercase too.
+
+    Returns
+    -------
+    list_words : list
+        Words without accents, in the same order.
+
+    """
+    function = _compile_step("remove_accent", lowercase=lowercase)
+    
+    return [function(word) for word in list_words]
+
+
+def _chain_functions(list_functions: list):
+    """
+    Hidden function that allows to build a single function from several
+    functions applied one after the other.
+
+    Parameters
+    ----------
+    list_functions : list
+        Functions to apply, in order.
+
+    Returns
+    -------
+    function : callable
+        Function that applies all the functions to a row.
+
+    """
+    if len(list_functions) == 1:
+        return list_functions[0]
+    else:
+        return functools.partial(_run_functions, list_functions=list_functions)
+
+
+def _compile_regexs(regexs) -> list:
+    """
+    Hidden function that allows to compile a lexicon of regexs.
+
+    Parameters
+    ----------
+    regexs : dict or list
+        Lexicon {regex: replacement}, or list of regexs to delete.
+
+    Returns
+    -------
+    list_regexs : list
+        List of (compiled regex, replacement) tuples, in the lexicon order.
+
+    """
+    if isinstance(regexs, dict):
+        items = regexs.items()
+    else:
+        items = [(regex, "") for regex in regexs]
+    
+    return [
+        (re.compile(regex, flags=re.IGNORECASE), value) for (regex, value) in items
+    ]
+
+
+def _steps_digest(steps: list) -> bytes:
+    """
+    Hidden function that allows to get a digest of cleaning steps: their
+    names, their parameters and the version of the lexicons they use. Two
+    lists of steps with the same digest clean a sentence the same way.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, parameters) tuples of the steps.
+
+    Returns
+    -------
+    digest : bytes
+        Digest of the steps.
+
+    """
+    list_versions = []
+    
+    for (name, parameters) in steps:
+        if name == "lemmatize" and parameters.get("lexicon") != None:
+            list_versions.append(_open_lemma_table(path=parameters["lexicon"]).version)
+        elif name in _STEP_LEXICONS:
+            list_versions.append(
+                lexicons.version(kind=_STEP_LEXICONS[name], name=parameters.get("language", "english"))
+            )
+        else:
+            pass
+        
+        if name == "remove_accent" or parameters.get("remove_accents") == True:
+            list_versions.append(lexicons.version(kind="accents", name="accents"))
+        else:
+            pass
+    
+    payload = repr(
+        (
+            _RESULT_CACHE_VERSION,
+            [(name, sorted(parameters.items())) for (name, parameters) in steps],
+            list_versions
+        )
+    )
+    
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _arrow_array(series: pd.core.series.Series):
+    """
+    Hidden function that allows to get the Arrow array of an Arrow string
+    column, without copying the strings.
+
+    Parameters
+    ----------
+    series : pandas.core.series.Series
+        Column to clean.
+
+    Returns
+    -------
+    array : pyarrow.Array or None
+        Strings of the column, or None if it is not an Arrow string column.
+
+    """
+    dtype = series.dtype
+    
+    if isinstance(dtype, pd.StringDtype) and "pyarrow" in str(dtype.storage):
+        pass
+    elif hasattr(pd, "ArrowDtype") and isinstance(dtype, pd.ArrowDtype) and\
+        str(dtype.pyarrow_dtype) in ["string", "large_string"]:
+        pass
+    else:
+        return None
+    
+    pyarrow = _import_pyarrow()[0]
+    array = pyarrow.array(series.array)
+    
+    if isinstance(array, pyarrow.ChunkedArray):
+        array = array.combine_chunks()
+    else:
+        pass
+    
+    return array
+
+
+def _compile_arrow_step(name: str, **parameters):
+    """
+    Hidden function that allows to compile a cleaning step into an Arrow
+    compute function, when one gives the same result as the Python step.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cleaning method.
+    
+    **parameters
+        Arguments of the cleaning method.
+
+    Returns
+    -------
+    function : callable or None
+        Function that takes a pyarrow.Array and returns it cleaned, or None if
+        the step must run in Python.
+
+    """
+    if name in _ARROW_REGEX_STEPS and not parameters.get("add_regexs"):
+        return functools.partial(
+            _arrow_sub_regexs,
+            list_regexs=_ARROW_REGEX_STEPS[name]
+        )
+    elif name == "remove_emoji":
+        return functools.partial(
+            _arrow_sub_regexs,
+            list_regexs=[(_compile_emoji(ranges=parameters.get("ranges")).regex.pattern, "")]
+        )
+    elif name == "lowercase":
+        return _arrow_lower
+    elif name == "remove_space":
+        return _arrow_strip
+    elif name in ["_squeeze_space", "_delete_characters", "_delete_regexs"]:
+        list_functions = [
+            _compile_arrow_step(step, **step_parameters) for (step, step_parameters) in parameters["steps"]
+        ]
+        
+        if None in list_functions:
+            return None
+        else:
+            return _chain_functions(list_functions=list_functions)
+    else:
+        return None
+
+
+def _arrow_regex(regex: str) -> str:
+    """
+    Hidden function that allows to translate the \\s, \\S and \\d classes of a
+    Python regex for the Arrow (RE2) regex engine. RE2 only matches ASCII
+    spaces and digits with them, so they are replaced by the explicit list of
+    the characters matched by Python.
+
+    Parameters
+    ----------
+    regex : str
+        Python regex.
+
+    Returns
+    -------
+    regex : str
+        RE2 regex.
+
+    """
+    for (pattern, negate) in [(r"\s", False), (r"\S", True), (r"\d", False)]:
+        if pattern in regex:
+            if pattern.lower() not in _ARROW_CLASSES:
+                list_ranges = []
+                
+                for character in re.findall(pattern.lower(), _all_characters()):
+                    if list_ranges and ord(character) == list_ranges[-1][1] + 1:
+                        list_ranges[-1][1] = ord(character)
+                    else:
+                        list_ranges.append([ord(character), ord(character)])
+                
+                _ARROW_CLASSES[pattern.lower()] = "".join(
+                    [
+                        f"\\x{{{a:x}}}" if a == b else f"\\x{{{a:x}}}-\\x{{{b:x}}}"
+                        for (a, b) in list_ranges
+                    ]
+                )
+            else:
+                pass
+            
+            regex = regex.replace(
+                pattern,
+                ("[^" if negate else "[") + _ARROW_CLASSES[pattern.lower()] + "]"
+            )
+        else:
+            pass
+    
+    return regex
+
+
+def _all_characters() -> str:
+    """
+    Hidden function that allows to get a string of all the Unicode
+    characters, except the surrogates.
+
+    Returns
+    -------
+    text : str
+        All the characters, in order.
+
+    """
+    return "".join(
+        [chr(i) for i in range(0, 0x110000) if not 0xD800 <= i <= 0xDFFF]
+    )
+
+
+def _arrow_sub_regexs(array, list_regexs: list):
+    """
+    Hidden function that allows to apply regexs to an Arrow string array.
+
+    Parameters
+    ----------
+    array : pyarrow.Array
+        Strings to clean.
+    
+    list_regexs : list
+        List of (regex, value) tuples, in Python syntax.
+
+    Returns
+    -------
+    array : pyarrow.Array
+        Strings cleaned.
+
+    """
+    pyarrow = _import_pyarrow()[0]
+    
+    for (regex, value) in list_regexs:
+        array = pyarrow.compute.replace_substring_regex(
+            array,
+            pattern=_arrow_regex(regex),
+            replacement=value
+        )
+    
+    return array
+
+
+def _arrow_lower(array):
+    """
+    Hidden function that allows to transform an Arrow string array to
+    lowercase. The strings with a capital sigma (Σ) or a dotted capital I
+    (İ), that Arrow and Python do not always lowercase the same way, are
+    lowercased by Python.
+
+    Parameters
+    ----------
+    array : pyarrow.Array
+        Strings to lowercase.
+
+    Returns
+    -------
+    array : pyarrow.Array
+        Strings lowercased.
+
+    """
+    pyarrow = _import_pyarrow()[0]
+    lowered = pyarrow.compute.utf8_lower(array)
+    mask = pyarrow.compute.fill_null(
+        pyarrow.compute.match_substring_regex(array, pattern="[Σİ]"),
+        False
+    )
+    
+    if pyarrow.compute.any(mask).as_py() == True:
+        lowered = pyarrow.compute.replace_with_mask(
+            lowered,
+            mask,
+            pyarrow.array(
+                [text.lower() for text in array.filter(mask).to_pylist()],
+                type=array.type
+            )
+        )
+    else:
+        pass
+    
+    return lowered
+
+
+def _arrow_strip(array):
+    """
+    Hidden function that allows to remove the spaces at the beginning and at
+    the end of the strings of an Arrow string array.
+
+    Parameters
+    ----------
+    array : pyarrow.Array
+        Strings to strip.
+
+    Returns
+    -------
+    array : pyarrow.Array
+        Strings stripped.
+
+    """
+    return _import_pyarrow()[0].compute.utf8_trim_whitespace(array)
+
+
+def _compile_emoji(ranges: list=None):
+    """
+    Hidden function that allows to get the _EmojiStripper of a list of code
+    point ranges. It is built on the first call only.
+
+    Parameters
+    ----------
+    ranges : list, optional, default=None
+        List of (first, last) code points. If None, EMOJI_RANGES.
+        Default is None.
+
+    Raises
+    ------
+    ValueError
+        Each range must be a (first, last) tuple of code points.
+
+    Returns
+    -------
+    stripper : _EmojiStripper
+        Function object that removes the characters of the ranges.
+
+    """
+    key = tuple(
+        [tuple(bounds) for bounds in (EMOJI_RANGES if ranges is None else ranges)]
+    )
+    
+    if key not in _EMOJI_STRIPPERS:
+        _EMOJI_STRIPPERS[key] = _EmojiStripper(ranges=key)
+    else:
+        pass
+    
+    return _EMOJI_STRIPPERS[key]
+
+
+class _EmojiStripper:
+    def __init__(self, ranges: tuple) -> None:
+        """
+        Function that allows to build the _EmojiStripper class. The ranges,
+        which may overlap, are merged into disjoint ranges and compiled into
+        a single character class: the regex engine tests a character with one
+        lookup in its set of code points whatever the number of ranges.
+
+        Parameters
+        ----------
+        ranges : tuple
+            (first, last) code points of the characters to remove, included.
+
+        Raises
+        ------
+        ValueError
+            Each range must be a (first, last) tuple of code points.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.ranges = _merge_ranges(ranges=ranges)
+        
+        if self.ranges:
+            self.regex = re.compile(
+                "["
+                + "".join(
+                    [
+                        re.escape(chr(first)) if first == last else re.escape(chr(first)) + "-" + re.escape(chr(last))
+                        for (first, last) in self.ranges
+                    ]
+                )
+                + "]+"
+            )
+        else:
+            self.regex = re.compile("(?!)")
+        
+        # an ASCII sentence can only lose characters of the ASCII ranges
+        self.ascii = any([first < 0x80 for (first, last) in self.ranges])
+    
+    
+    def strip(self, text: str) -> str:
+        """
+        Function that allows to remove the characters of the ranges from a
+        sentence.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to clean.
+
+        Returns
+        -------
+        text : str
+            Sentence cleaned.
+
+        """
+        if text.isascii() and self.ascii == False:
+            return text
+        else:
+            return self.regex.sub("", text)
+
+
+def _merge_ranges(ranges: tuple) -> list:
+    """
+    Hidden function that allows to merge overlapping or adjacent ranges of
+    code points.
+
+    Parameters
+    ----------
+    ranges : tuple
+        (first, last) code points, included.
+
+    Raises
+    ------
+    ValueError
+        Each range must be a (first, last) tuple of code points.
+
+    Returns
+    -------
+    list_ranges : list
+        Disjoint (first, last) ranges, sorted.
+
+    """
+    list_ranges = []
+    
+    for bounds in sorted(ranges):
+        if len(bounds) == 2 and all([isinstance(bound, int) for bound in bounds]) and\
+            0 <= bounds[0] <= bounds[1] <= 0x10FFFF:
+            pass
+        else:
+            raise ValueError(
+                f"each range must be a (first, last) tuple of code points: got {bounds}"
+            )
+        
+        if list_ranges and bounds[0] <= list_ranges[-1][1] + 1:
+            list_ranges[-1][1] = max(list_ranges[-1][1], bounds[1])
+        else:
+            list_ranges.append([bounds[0], bounds[1]])
+    
+    return [tuple(bounds) for bounds in list_ranges]
+
+
+def _check_max_memory(max_memory: int=None) -> int:
+    """
+    Hidden function that allows to check the 'max_memory' option.
+
+    Parameters
+    ----------
+    max_memory : int, optional, default=None
+        Number of bytes, or None. Default is None.
+
+    Raises
+    ------
+    TypeError
+        The 'max_memory' parameter must be None or an integer.
+    
+    ValueError
+        The 'max_memory' parameter must be >= 1.
+
+    Returns
+    -------
+    max_memory : int
+        Number of bytes, or None.
+
+    """
+    if max_memory is None:
+        return None
+    elif isinstance(max_memory, int) and not isinstance(max_memory, bool):
+        if max_memory >= 1:
+            return max_memory
+        else:
+            raise ValueError(
+                f"'max_memory' parameter must be >= 1: got {max_memory}"
+            )
+    else:
+        raise TypeError(
+            f"'max_memory' parameter must be an int: got {type(max_memory)}"
+        )
+
+
+def _apply_rows(function, values: list, notna: list) -> list:
+    """
+    Hidden function that allows to apply a function to each row of a column.
+    The missing values are kept as they are.
+
+    Parameters
+    ----------
+    function : callable
+        Function applied to each row.
+    
+    values : list
+        Rows of the column.
+    
+    notna : list
+        For each row, False if the value is missing.
+
+    Returns
+    -------
+    values : list
+        Rows cleaned.
+
+    """
+    if all(notna):
+        return [function(value) for value in values]
+    else:
+        return [
+            function(value) if keep else value for (value, keep) in zip(values, notna)
+        ]
+
+
+def _apply_parallel(steps: list, values: list, notna: list, n_jobs: int,
+                    timings: list=None) -> list:
+    """
+    Hidden function that allows to apply cleaning steps to each row of a
+    column with a pool of processes. The column is split into contiguous
+    chunks and the cleaned chunks are put back together in their order.
+    Only the steps (names and parameters) are sent to the processes: each
+    process compiles them, with its lexicons, once and keeps them for the
+    next chunks.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, parameters) tuples of the steps to apply, in order.
+    
+    values : list
+        Rows of the column.
+    
+    notna : list
+        For each row, False if the value is missing.
+    
+    n_jobs : int
+        Number of processes.
+    
+    timings : list, optional, default=None
+        If not None, the time spent in each step by all the processes is
+        added to it. Default is None.
+
+    Returns
+    -------
+    values : list
+        Rows cleaned.
+
+    """
+    chunksize = -(-len(values) // (n_jobs * _PARALLEL_CHUNKS_PER_JOB))
+    bounds = range(0, len(values), chunksize)
+    
+    results = _get_executor(n_jobs=n_jobs).map(
+        _apply_chunk,
+        [steps] * len(bounds),
+        [values[i:i+chunksize] for i in bounds],
+        [notna[i:i+chunksize] for i in bounds],
+        [timings != None] * len(bounds)
+    )
+    
+    list_values = []
+    
+    for (chunk, chunk_timings) in results:
+        list_values.extend(chunk)
+        
+        if timings != None:
+            for index, timing in enumerate(chunk_timings):
+                timings[index] += timing
+        else:
+            pass
+    
+    return list_values
+
+
+def _apply_chunk(steps: list, values: list, notna: list, profile: bool) -> tuple:
+    """
+    Hidden function, run in a process of the pool, that allows to clean a
+    chunk of rows. The steps are compiled on the first chunk only.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, parameters) tuples of the steps to apply, in order.
+    
+    values : list
+        Rows of the chunk.
+    
+    notna : list
+        For each row, False if the value is missing.
+    
+    profile : bool
+        If true, the time spent in each step is measured.
+
+    Returns
+    -------
+    (values, timings) : tuple
+        Rows cleaned, and the time spent in each step (None if 'profile' is
+        False).
+
+    """
+    key = (repr(steps), profile)
+    
+    if key not in _WORKER_FUNCTIONS:
+        if len(_WORKER_FUNCTIONS) >= _WORKER_FUNCTIONS_SIZE:
+            _WORKER_FUNCTIONS.clear()
+        else:
+            pass
+        
+        timings = [0.0] * len(steps) if profile == True else None
+        _WORKER_FUNCTIONS[key] = (
+            _compile_steps(steps=steps, timings=timings),
+            timings
+        )
+    else:
+        pass
+    
+    (function, timings) = _WORKER_FUNCTIONS[key]
+    values = _apply_rows(function=function, values=values, notna=notna)
+    
+    if profile == True:
+        chunk_timings = list(timings)
+        timings[:] = [0.0] * len(timings)
+    else:
+        chunk_timings = None
+    
+    return (values, chunk_timings)
+
+
+def _get_executor(n_jobs: int) -> ProcessPoolExecutor:
+    """
+    Hidden function that allows to get the pool of processes. The pool is
+    kept between the calls and is only created again if the number of
+    processes changes.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of processes.
+
+    Returns
+    -------
+    executor : concurrent.futures.ProcessPoolExecutor
+        Pool of processes.
+
+    """
+    global _EXECUTOR
+    
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR == None or _EXECUTOR[0] != n_jobs:
+            if _EXECUTOR != None:
+                _EXECUTOR[1].shutdown()
+            else:
+                pass
+            
+            _EXECUTOR = (n_jobs, ProcessPoolExecutor(max_workers=n_jobs))
+        else:
+            pass
+        
+        return _EXECUTOR[1]
+
+
+def _run_functions(text: str, list_functions: list) -> str:
+    """
+    Hidden function that allows to apply several functions to a row, in order.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+    
+    list_functions : list
+        Functions to apply.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    for function in list_functions:
+        text = function(text)
+    
+    return text
+
+
+def _run_timed(text: str, function, timings: list, index: int) -> str:
+    """
+    Hidden function that allows to apply a function to a row and to add the
+    time spent to a list of timings.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+    
+    function : callable
+        Function to apply.
+    
+    timings : list
+        Timings of the steps, in seconds.
+    
+    index : int
+        Index of the step in 'timings'.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    start = time.perf_counter()
+    text = function(text)
+    timings[index] += time.perf_counter() - start
+    
+    return text
+
+
+def _sub_regexs(text: str, list_regexs: list) -> str:
+    """
+    Hidden function that allows to apply several regex substitutions to a row,
+    in order.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+    
+    list_regexs : list
+        List of (compiled regex, replacement) tuples.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    for regex, value in list_regexs:
+        text = regex.sub(value, text)
+    
+    return text
+
+
+def _remove_single_character(text: str) -> str:
+    """
+    Hidden function that allows to remove the unique characters from a row.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    return " ".join(
+        [
+            word for word in text.split(" ") if len(word) > 1
+        ]
+    )
+
+
+def _remove_words(text: str, set_words: frozenset) -> str:
+    """
+    Hidden function that allows to remove some words from a row.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+    
+    set_words : frozenset
+        Words to remove.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    return " ".join(
+        [
+            word for word in text.split(" ") if word not in set_words
+        ]
+    )
+
+
+def _remove_plural(text: str, word_length: int) -> str:
+    """
+    Hidden function that allows to remove the s character from the words of a
+    row that are longer than 'word_length'.
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+    
+    word_length : int
+        Length of the words to which the s must be deleted.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    return " ".join(
+        [
+            _REGEX_PLURAL.sub("", word) if len(word) > word_length else word
+            for word in text.split(" ")
+        ]
+    )
+
+
+def _squeeze_space(text: str) -> str:
+    """
+    Hidden function that allows to replace the whitespaces of a row by one
+    space and to remove them at its start and end, as remove_whitespace and
+    remove_space do (str.split and the \\s class use the same whitespaces).
+
+    Parameters
+    ----------
+    text : str
+        Row to clean.
+
+    Returns
+    -------
+    text : str
+        Row cleaned.
+
+    """
+    return " ".join(text.split())
+
+
+EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),
+    (0x1F300, 0x1F5FF),
+    (0x1F680, 0x1F6FF),
+    (0x1F1E0, 0x1F1FF),
+    (0x2500, 0x2BEF),
+    (0x2702, 0x27B0),
+    (0x24C2, 0x1F251),
+    (0x1F926, 0x1F937),
+    (0x10000, 0x10FFFF),
+    (0x2640, 0x2642),
+    (0x2600, 0x2B55),
+    (0x200D, 0x200D),
+    (0x23CF, 0x23CF),
+    (0x23E9, 0x23E9),
+    (0x231A, 0x231A),
+    (0xFE0F, 0xFE0F)
+]
+_ADDITIONAL_CHARACTERS = "\n\t\r‘’„“„”“”「」『』…¤¶‰™©®▶➤¿∎≤≥⋅﹣°☒"
+_ARROW_CLASSES = {}
+_ARROW_REGEX_STEPS = {
+    "remove_url": [
+        (r"(?i)https?://\S+|www\.\S+", "")
+    ],
+    "remove_html": [
+        (r"<.*?>", "")
+    ],
+    "remove_email": [
+        (r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", "")
+    ],
+    "remove_digit": [
+        (r"\d+", "")
+    ],
+    "remove_whitespace": [
+        (r"\s+", " ")
+    ],
+    "additional_cleaning": [
+        ("[" + _ADDITIONAL_CHARACTERS + "]", "")
+    ]
+}
+_EMOJI_STRIPPERS = {}
+_EXECUTOR = None
+_RESULT_CACHE_VERSION = 1
+_STEP_LEXICONS = {
+    "remove_stopword": "stopwords",
+    "lemmatize": "lemme",
+    "stemmatize": "stemme"
+}
+_EXECUTOR_LOCK = threading.Lock()
+_IDEMPOTENT_STEPS = (
+    "remove_punctuation",
+    "remove_digit",
+    "remove_space",
+    "remove_whitespace",
+    "remove_mention",
+    "remove_hastag",
+    "remove_emoji",
+    "remove_single_character"
+)
+_PRELUDE_STEPS = ("remove_accent", "remove_stopword", "lemmatize", "stemmatize")
+_PARALLEL_CHUNKS_PER_JOB = 4
+_PARALLEL_MIN_ROWS = 1000
+_WORKER_FUNCTIONS = {}
+_WORKER_FUNCTIONS_SIZE = 32
+_STEPS = (
+    "lowercase",
+    "remove_punctuation",
+    "remove_url",
+    "remove_html",
+    "remove_email",
+    "remove_digit",
+    "remove_space",
+    "remove_whitespace",
+    "remove_mention",
+    "remove_hastag",
+    "remove_emoji",
+    "additional_cleaning",
+    "remove_accent",
+    "remove_single_character",
+    "remove_plural",
+    "remove_stopword",
+    "lemmatize",
+    "stemmatize",
+    "word_tokenize",
+    "word_detokenize"
+)
+_MEMORY_SAMPLE_ROWS = 1000
+# word_count_filter: count of words (int32), comparison and mask of a row
+_WORD_COUNT_ROW_BYTES = 6
+_LAZY_METHODS = dict(
+    [
+        (name, net) for net in (TextNet, WordNet, Tokenize) for name in _STEPS + ("word_count_filter",)
+        if name in vars(net)
+    ]
+)
+_REGEX_PLURAL = re.compile(r"s\b", flags=re.IGNORECASE)
+_REGEX_STEPS = {
+    "remove_punctuation": [
+        (re.compile(r"[^\w\s\-–'‘’]"), ""),
+        (re.compile(r"[-–'‘’]"), " ")
+    ],
+    "remove_url": [
+        (re.compile(r"https?://\S+|www\.\S+", flags=re.IGNORECASE), "")
+    ],
+    "remove_html": [
+        (re.compile(r"<.*?>", flags=re.IGNORECASE), "")
+    ],
+    "remove_email": [
+        (re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", flags=re.IGNORECASE), "")
+    ],
+    "remove_digit": [
+        (re.compile(r"\d+"), "")
+    ],
+    "remove_whitespace": [
+        (re.compile(r"\s+"), " ")
+    ],
+    "remove_mention": [
+        (re.compile(r"@\w+"), "")
+    ],
+    "remove_hastag": [
+        (re.compile(r"#\w+"), "")
+    ]
+}
+
+
+#------------------------------------------------------------------------------
+
+
+class ResultCache:
+    def __init__(self, path: str, max_rows: int=None, max_bytes: int=None,
+                 timeout: float=30.0) -> None:
+        """
+        Function that allows to build the ResultCache class and initialise the
+        parameters. The ResultCache class keeps the cleaned sentences in a
+        SQLite file, under a digest of the sentence, of the cleaning steps and
+        of the lexicons used, so that a new run only cleans the new sentences.
+        The file can be shared by several processes: it is opened in WAL mode
+        and each process has its own connection. The number of sentences and
+        their size are kept up to date by triggers, so that a write does not
+        scan the whole file, and the last reads are written with the next
+        write (or 'close').
+
+        Parameters
+        ----------
+        path : str
+            Path of the SQLite file, created if it does not exist.
+        
+        max_rows : int, optional, default=None
+            Maximal number of sentences kept. If None, no limit.
+            Default is None.
+        
+        max_bytes : int, optional, default=None
+            Maximal size of the sentences kept (inputs are not stored, only
+            their digest). If None, no limit. Default is None.
+        
+        timeout : float, optional, default=30.0
+            Number of seconds to wait when another process writes to the file.
+            Default is 30.0.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'path' parameter must be a string.
+            - To use this class, the 'max_rows' and 'max_bytes' parameters must
+            be positive integers or None.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if isinstance(path, str):
+            self.path = path
+        else:
+            raise TypeError(
+                f"'path' parameter must be a str: got {type(path)}"
+            )
+        
+        for (parameter, value) in [("max_rows", max_rows), ("max_bytes", max_bytes)]:
+            if value is None or (isinstance(value, int) and value > 0):
+                pass
+            else:
+                raise TypeError(
+                    f"'{parameter}' parameter must be a positive int or None: got {value}"
+                )
+        
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._used = {}
+        self._connect()
+    
+    
+    def __getstate__(self) -> dict:
+        """
+        Function that allows to pickle the cache without its connection, the
+        other process opens its own one.
+
+        Returns
+        -------
+        dict_state : dict
+            Attributes of the cache.
+
+        """
+        dict_state = dict(self.__dict__)
+        dict_state["_connection"] = None
+        dict_state["_pid"] = None
+        dict_state["_lock"] = None
+        dict_state["_used"] = {}
+        
+        return dict_state
+    
+    
+    def __setstate__(self, dict_state: dict) -> None:
+        """
+        Function that allows to unpickle the cache.
+
+        Parameters
+        ----------
+        dict_state : dict
+            Attributes of the cache.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.__dict__.update(dict_state)
+        self._lock = threading.Lock()
+    
+    
+    @staticmethod
+    def key(text: str, config: bytes) -> bytes:
+        """
+        Function that allows to get the key of a sentence in the cache.
+
+        Parameters
+        ----------
+        text : str
+            Sentence before cleaning.
+        
+        config : bytes
+            Digest of the cleaning steps and lexicons.
+
+        Returns
+        -------
+        key : bytes
+            Key of the sentence.
+
+        """
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"),
+            digest_size=16,
+            key=config
+        ).digest()
+    
+    
+    def get_many(self, keys: list) -> dict:
+        """
+        Function that allows to read cleaned sentences from the cache.
+
+        Parameters
+        ----------
+        keys : list
+            Keys of the sentences, see 'key'.
+
+        Returns
+        -------
+        dict_values : dict
+            Cleaned sentences found {key: sentence}.
+
+        """
+        dict_values = {}
+        keys = list(dict.fromkeys(keys))
+        
+        with self._lock:
+            connection = self._connect()
+            
+            for i in range(0, len(keys), _RESULT_CACHE_BATCH):
+                batch = keys[i:i+_RESULT_CACHE_BATCH]
+                dict_values.update(
+                    connection.execute(
+                        f"SELECT key, value FROM results WHERE key IN ({', '.join(['?'] * len(batch))})",
+                        batch
+                    ).fetchall()
+                )
+            
+            # the sentences read are the last to be evicted: their time is
+            # written with the next write, not by each read
+            used = time.time()
+            self._used.update(dict.fromkeys(dict_values, used))
+            
+            if len(self._used) >= _RESULT_CACHE_USED_ROWS:
+                with connection:
+                    self._write_used(connection=connection)
+            else:
+                pass
+            
+            self.hits += len(dict_values)
+            self.misses += len(keys) - len(dict_values)
+        
+        return dict_values
+    
+    
+    def put_many(self, items: list) -> None:
+        """
+        Function that allows to add cleaned sentences to the cache. The least
+        recently used sentences are evicted if the cache is full.
+
+        Parameters
+        ----------
+        items : list
+            List of (key, sentence) tuples.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if len(items) == 0:
+            return None
+        else:
+            pass
+        
+        used = time.time()
+        
+        with self._lock:
+            connection = self._connect()
+            
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (key, value, size, used) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, value, len(value.encode("utf-8", "surrogatepass")), used)
+                        for (key, value) in items
+                    ]
+                )
+                self._write_used(connection=connection)
+                self._evict(connection=connection)
+    
+    
+    def info(self) -> dict:
+        """
+        Function that allows to get the statistics of the cache.
+
+        Returns
+        -------
+        dict_info : dict
+            Number of hits and misses of this object, number of sentences and
+            their size in the file.
+
+        """
+        with self._lock:
+            (rows, size) = self._connect().execute(
+                "SELECT rows, size FROM totals"
+            ).fetchone()
+        
+        dict_info = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rows": rows,
+            "bytes": size,
+            "max_rows": self.max_rows,
+            "max_bytes": self.max_bytes
+        }
+        
+        return dict_info
+    
+    
+    def clear(self) -> None:
+        """
+        Function that allows to empty the cache and to reset its statistics.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            
+            with connection:
+                connection.execute("DELETE FROM results")
+            
+            self._used = {}
+            self.hits = 0
+            self.misses = 0
+    
+    
+    def close(self) -> None:
+        """
+        Function that allows to close the connection to the file, after
+        writing the time of the last reads.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                with self._connection:
+                    self._write_used(connection=self._connection)
+                
+                self._connection.close()
+            else:
+                pass
+            
+            self._connection = None
+            self._pid = None
+            self._used = {}
+    
+    
+    def _connect(self):
+        """
+        Hidden function that allows to get the connection of this process to
+        the file, and to create the table the first time.
+
+        Returns
+        -------
+        connection : sqlite3.Connection
+            Connection to the file.
+
+        """
+        # a connection can not be used by a forked process
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            # the rows deleted by INSERT OR REPLACE go through the triggers
+            connection.execute("PRAGMA recursive_triggers=ON")
+            
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(key BLOB PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS totals "
+                    "(id INTEGER PRIMARY KEY CHECK (id = 0), rows INTEGER NOT NULL, size INTEGER NOT NULL)"
+                )
+                connection.execute(
+                    "INSERT OR IGNORE INTO totals "
+                    "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results "
+                    "BEGIN UPDATE totals SET rows = rows + 1, size = size + new.size WHERE id = 0; END"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results "
+                    "BEGIN UPDATE totals SET rows = rows - 1, size = size - old.size WHERE id = 0; END"
+                )
+            
+            self._connection = connection
+            self._pid = os.getpid()
+        else:
+            pass
+        
+        return self._connection
+    
+    
+    def _write_used(self, connection) -> None:
+        """
+        Hidden function that allows to write the time of the sentences read
+        since the last write.
+
+        Parameters
+        ----------
+        connection : sqlite3.Connection
+            Connection to the file, in a transaction.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if self._used:
+            connection.executemany(
+                "UPDATE results SET used = ? WHERE key = ?",
+                [(used, key) for (key, used) in self._used.items()]
+            )
+            self._used = {}
+        else:
+            pass
+    
+    
+    def _evict(self, connection) -> None:
+        """
+        Hidden function that allows to delete the least recently used
+        sentences until the cache fits in 'max_rows' and 'max_bytes'.
+
+        Parameters
+        ----------
+        connection : sqlite3.Connection
+            Connection to the file, in a transaction.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        (rows, size) = connection.execute("SELECT rows, size FROM totals").fetchone()
+        
+        if self.max_rows is not None:
+            if rows > self.max_rows:
+                connection.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY used LIMIT ?)",
+                    (rows - self.max_rows,)
+                )
+                size = connection.execute("SELECT size FROM totals").fetchone()[0]
+            else:
+                pass
+        else:
+            pass
+        
+        if self.max_bytes is not None:
+            if size > self.max_bytes:
+                list_keys = []
+                
+                for (key, value_size) in connection.execute(
+                    "SELECT key, size FROM results ORDER BY used"
+                ):
+                    if size <= self.max_bytes:
+                        break
+                    else:
+                        list_keys.append((key,))
+                        size -= value_size
+                
+                connection.executemany("DELETE FROM results WHERE key = ?", list_keys)
+            else:
+                pass
+        else:
+            pass
+
+
+#------------------------------------------------------------------------------
+
+
+class LexiconCache:
+    def __init__(self, path: str=None, allow_download: bool=True,
+                 precompiled: bool=True) -> None:
+        """
+        Function that allows to build the LexiconCache class and initialise the
+        parameters. The LexiconCache class loads the vocabulary files shipped
+        in the 'ressources' folder, parses each of them only once per process
+        and keeps the parsed lexicons in memory. If the folder contains the
+        binary file written by 'compile', the lexicons and the objects built
+        from them are read from this file instead, without parsing.
+
+        Parameters
+        ----------
+        path : str, optional, default=None
+            Path to the 'ressources' folder. If None, the 'PYTCTK_RESSOURCES'
+            environment variable is used if it is set, otherwise the folder
+            shipped next to this file. Default is None.
+        
+        allow_download : bool, optional, default=True
+            If true and a file is missing from the 'ressources' folder, it is
+            read once from GitHub (in memory, nothing is written on the disk).
+            Otherwise a FileNotFoundError is raised. Default is True.
+        
+        precompiled : bool, optional, default=True
+            If true, the binary file of the 'ressources' folder written by
+            'compile' is loaded, if it exists. Default is True.
+
+        Raises
+        ------
+        TypeError
+            - To use this class, the 'path' parameter must be None or a string.
+            - To use this class, the 'allow_download' parameter must be a boolean.
+            - To use this class, the 'precompiled' parameter must be a boolean.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if isinstance(path, str):
+            self.path = path
+        elif path == None:
+            self.path = os.environ.get(
+                "PYTCTK_RESSOURCES",
+                os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)),
+                    os.pardir,
+                    "ressources"
+                )
+            )
+        else:
+            raise TypeError(
+                f"'path' parameter must be None or a str: got {type(path)}"
+            )
+        
+        if isinstance(allow_download, bool):
+            self.allow_download = allow_download
+        else:
+            raise TypeError(
+                f"'allow_download' parameter must be a bool: got {type(allow_download)}"
+            )
+        
+        if isinstance(precompiled, bool):
+            pass
+        else:
+            raise TypeError(
+                f"'precompiled' parameter must be a bool: got {type(precompiled)}"
+            )
+        
+        self._lexicons = {}
+        self._compiled = {}
+        self._sources = {}
+        self._artifact = {}
+        self._lock = threading.RLock()
+        
+        if precompiled == True and os.path.isfile(os.path.join(self.path, _LEXICON_ARTIFACT)):
+            self.load()
+        else:
+            pass
+    
+    
+    def get(self, kind: str, name: str):
+        """
+        Function that allows to get a parsed lexicon. The file is read and
+        parsed on the first call only, the next calls use the in-memory copy.
+
+        Parameters
+        ----------
+        kind : {"accents", "lemme", "stemme", "stopwords"}, str
+            Subfolder of the 'ressources' folder.
+        
+        name : str
+            Name of the file without its extension (e.g. "english", "french"
+            or "accents").
+
+        Raises
+        ------
+        ValueError
+            To use this function, the 'kind' parameter must be {"accents",
+            "lemme", "stemme", "stopwords"}.
+
+        Returns
+        -------
+        lexicon : dict or list
+            - For "accents" and "lemme", a dict {regex: replacement}.
+            - For "stemme" and "stopwords", a list of words or regexs.
+            A new copy is returned at each call, so it can be modified freely.
+
+        """
+        if kind not in _LEXICON_KINDS:
+            raise ValueError(
+                "'kind' parameter must be in {'accents', 'lemme', 'stemme', 'stopwords'}"
+            )
+        
+        key = (kind, name)
+        
+        with self._lock:
+            if key in self._lexicons:
+                pass
+            elif key in self._artifact:
+                self._lexicons[key] = _load_artifact(data=self._artifact.pop(key))
+            else:
+                text = self._read(kind=kind, name=name)
+                self._sources[key] = _lexicon_digest(text)
+                self._lexicons[key] = self._parse(kind=kind, text=text)
+            lexicon = self._lexicons[key]
+        
+        if isinstance(lexicon, dict):
+            return dict(lexicon)
+        else:
+            return list(lexicon)
+    
+    
+    def invalidate(self, kind: str=None, name: str=None) -> None:
+        """
+        Function that allows to drop parsed lexicons from the cache. They will
+        be read again from the 'ressources' folder on their next use.
+
+        Parameters
+        ----------
+        kind : str, optional, default=None
+            Subfolder of the lexicons to drop. If None, every subfolder is
+            concerned. Default is None.
+        
+        name : str, optional, default=None
+            Name of the lexicons to drop. If None, every name is concerned.
+            Default is None.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        with self._lock:
+            for key in list(self._lexicons):
+                if (kind == None or key[0] == kind) and (name == None or key[1] == name):
+                    del self._lexicons[key]
+            
+            for key in list(self._compiled):
+                if (kind == None or key[0] == kind) and (name == None or key[1] == name):
+                    del self._compiled[key]
+            
+            # the lexicons dropped are read again from their file, not from
+            # the binary file
+            for key in list(self._artifact):
+                if (kind == None or key[0] == kind) and (name == None or key[1] == name):
+                    del self._artifact[key]
+            
+            # the cached stems may come from the lexicons removed
+            token_cache.clear()
+    
+    
+    def reload(self, kind: str, name: str):
+        """
+        Function that allows to read and parse again a lexicon, for example
+        after its file has been modified.
+
+        Parameters
+        ----------
+        kind : {"accents", "lemme", "stemme", "stopwords"}, str
+            Subfolder of the 'ressources' folder.
+        
+        name : str
+            Name of the file without its extension.
+
+        Returns
+        -------
+        lexicon : dict or list
+            Lexicon parsed from the file.
+
+        """
+        with self._lock:
+            self.invalidate(kind=kind, name=name)
+            
+            return self.get(kind=kind, name=name)
+    
+    
+    def version(self, kind: str, name: str) -> str:
+        """
+        Function that allows to get the version of a lexicon: a digest of its
+        content, which changes when its file is modified and reloaded.
+
+        Parameters
+        ----------
+        kind : {"accents", "lemme", "stemme", "stopwords"}, str
+            Subfolder of the 'ressources' folder.
+        
+        name : str
+            Name of the file without its extension.
+
+        Returns
+        -------
+        version : str
+            Digest of the lexicon.
+
+        """
+        return self._get_compiled(kind=kind, name=name, builder=_lexicon_digest)
+    
+    
+    def _get_compiled(self, kind: str, name: str, builder, **options):
+        """
+        Hidden function that allows to get an object built from a lexicon
+        (e.g. a lemmatization engine). The object is built on the first call
+        only and is dropped with the lexicon by 'invalidate' and 'reload'.
+
+        Parameters
+        ----------
+        kind : str
+            Subfolder of the 'ressources' folder.
+        
+        name : str
+            Name of the file without its extension.
+        
+        builder : callable
+            Function called as builder(lexicon, **options) to build the object.
+        
+        **options
+            Hashable options given to the builder, they are part of the key.
+
+        Returns
+        -------
+        compiled : object
+            Object built from the lexicon.
+
+        """
+        key = (kind, name, builder, tuple(sorted(options.items())))
+        
+        with self._lock:
+            if key in self._compiled:
+                pass
+            elif key in self._artifact:
+                self._compiled[key] = _load_artifact(data=self._artifact.pop(key))
+            else:
+                self._compiled[key] = builder(
+                    self.get(kind=kind, name=name),
+                    **options
+                )
+            
+            return self._compiled[key]
+    
+    
+    def compile(self, filename: str=None) -> str:
+        """
+        Function that allows to compile all the lexicons of the 'ressources'
+        folder into a binary file: the parsed lexicons and the objects built
+        from them (lemmatization and stemming engines, sets of stopwords,
+        accents folders, digests) for every combination of the 'lowercase',
+        'remove_accents' and 'method' parameters, pickled. The LexiconCache
+        objects created next load this file, so the first call of a function
+        such as lemmatize does not read, parse nor build anything. It must be
+        run again after a lexicon file is modified: the entries of a modified
+        file are ignored.
+        Exemple of use: python -c "import pyTCTK; pyTCTK.lexicons.compile()"
+
+        Parameters
+        ----------
+        filename : str, optional, default=None
+            Path of the binary file. If None, 'lexicons.pickle' in the
+            'ressources' folder, where the LexiconCache objects look for it.
+            Default is None.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'filename' parameter must be None or a string.
+
+        Returns
+        -------
+        filename : str
+            Path of the binary file written.
+
+        """
+        if isinstance(filename, str):
+            pass
+        elif filename == None:
+            filename = os.path.join(self.path, _LEXICON_ARTIFACT)
+        else:
+            raise TypeError(
+                f"'filename' parameter must be None or a str: got {type(filename)}"
+            )
+        
+        # the lexicons are read again from their files, not from an older
+        # binary file or from this cache
+        cache = LexiconCache(
+            path=self.path,
+            allow_download=self.allow_download,
+            precompiled=False
+        )
+        dict_builders = {
+            "lemme": _LemmaEngine,
+            "stemme": _StemEngine,
+            "stopwords": _StopwordSet
+        }
+        
+        for kind in _LEXICON_KINDS:
+            folder = os.path.join(self.path, kind)
+            list_names = sorted(
+                [
+                    file[:-len(".txt")] for file in os.listdir(folder) if file.endswith(".txt")
+                ]
+            ) if os.path.isdir(folder) else []
+            
+            for name in list_names:
+                cache.version(kind=kind, name=name)
+                cache._get_compiled(kind=kind, name=name, builder=_lexicon_traits)
+                
+                if kind == "accents":
+                    cache._get_compiled(kind=kind, name=name, builder=_compile_regexs)
+                    
+                    for method in ["translate", "unicode"]:
+                        cache._get_compiled(
+                            kind=kind,
+                            name=name,
+                            builder=_AccentFolder,
+                            method=method
+                        )
+                else:
+                    for lowercase in [True, False]:
+                        for remove_accents in [False, True]:
+                            dict_options = {
+                                "lowercase": lowercase,
+                                "remove_accents": remove_accents
+                            }
+                            
+                            if kind == "stemme":
+                                dict_options["language"] = name
+                            else:
+                                pass
+                            
+                            cache._get_compiled(
+                                kind=kind,
+                                name=name,
+                                builder=dict_builders[kind],
+                                **dict_options
+                            )
+        
+        # each entry is pickled on its own, so that loading the file only
+        # reads the index and an entry is unpickled on its first use
+        dict_entries = {}
+        
+        for key, lexicon in cache._lexicons.items():
+            dict_entries[key] = pickle.dumps(lexicon, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        for key, compiled in cache._compiled.items():
+            dict_entries[(key[0], key[1], key[2].__name__, key[3])] = pickle.dumps(
+                compiled,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        
+        artifact = {
+            "version": _LEXICON_ARTIFACT_VERSION,
+            "sources": dict(cache._sources),
+            "entries": dict_entries
+        }
+        
+        # written under another name and then renamed, so that a process
+        # never reads a file being written
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        
+        with open(temporary, "wb") as file:
+            pickle.dump(artifact, file, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        os.replace(temporary, filename)
+        
+        return filename
+    
+    
+    def load(self, filename: str=None) -> bool:
+        """
+        Function that allows to load the binary file written by 'compile'.
+        Only its index is read, each lexicon or object is unpickled on its
+        first use. The entries of a lexicon whose file has been modified
+        since are ignored, as well as the whole file if it was written by
+        another version of the library.
+
+        Parameters
+        ----------
+        filename : str, optional, default=None
+            Path of the binary file. If None, 'lexicons.pickle' in the
+            'ressources' folder. Default is None.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'filename' parameter must be None or a string.
+
+        Returns
+        -------
+        loaded : bool
+            True if the file is loaded, False if it is missing, not valid or
+            of another version.
+
+        """
+        if isinstance(filename, str):
+            pass
+        elif filename == None:
+            filename = os.path.join(self.path, _LEXICON_ARTIFACT)
+        else:
+            raise TypeError(
+                f"'filename' parameter must be None or a str: got {type(filename)}"
+            )
+        
+        try:
+            with open(filename, "rb") as file:
+                artifact = _LexiconUnpickler(file).load()
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False
+        
+        if isinstance(artifact, dict) and artifact.get("version") == _LEXICON_ARTIFACT_VERSION:
+            pass
+        else:
+            return False
+        
+        # a lexicon file modified since the compilation makes its entries
+        # stale, a missing file does not (the binary file can be shipped alone)
+        set_stale = set()
+        
+        for (kind, name), digest in artifact["sources"].items():
+            source = os.path.join(self.path, kind, name + ".txt")
+            
+            if os.path.isfile(source):
+                with open(source, "r", encoding=_LEXICON_ENCODING) as file:
+                    if _lexicon_digest(file.read()) != digest:
+                        set_stale.add((kind, name))
+                    else:
+                        pass
+            else:
+                pass
+        
+        with self._lock:
+            for key, data in artifact["entries"].items():
+                if key[:2] in set_stale:
+                    pass
+                elif len(key) == 2:
+                    self._artifact[key] = data
+                elif key[2] in _LEXICON_BUILDERS:
+                    self._artifact[(key[0], key[1], _LEXICON_BUILDERS[key[2]], key[3])] = data
+                else:
+                    pass
+            
+            for key in set(artifact["sources"]) - set_stale:
+                self._sources[key] = artifact["sources"][key]
+        
+        return True
+    
+    
+    def _read(self, kind: str, name: str) -> str:
+        """
+        Hidden function that allows to read the content of a lexicon file from
+        the 'ressources' folder, or from GitHub if the file is missing.
+
+        Parameters
+        ----------
+        kind : str
+            Subfolder of the 'ressources' folder.
+        
+        name : str
+            Name of the file without its extension.
+
+        Raises
+        ------
+        FileNotFoundError
+            The file is missing and 'allow_download' is False.
+
+        Returns
+        -------
+        text : str
+            Content of the file.
+
+        """
+        filename = os.path.join(self.path, kind, name + ".txt")
+        
+        if os.path.isfile(filename):
+            with open(filename, "r", encoding=_LEXICON_ENCODING) as file:
+                return file.read()
+        elif self.allow_download:
+            url = f"{_LEXICON_URL}/{kind}/{name}.txt"
+            
+            with request.urlopen(url) as response:
+                return response.read().decode(_LEXICON_ENCODING)
+        else:
+            raise FileNotFoundError(
+                f"lexicon file not found: {filename}"
+            )
+    
+    
+    def _parse(self, kind: str, text: str):
+        """
+        Hidden function that allows to parse the content of a lexicon file.
+
+        Parameters
+        ----------
+        kind : str
+            Subfolder of the 'ressources' folder.
+        
+        text : str
+            Content of the file.
+
+        Returns
+        -------
+        lexicon : dict or list
+            Lexicon parsed.
+
+        """
+        if kind in ["accents", "lemme"]:
+            dict_regexs = {}
+            
+            for line in text.splitlines():
+                if line.strip():
+                    (key, value) = line.split()
+                    dict_regexs[str(key)] = str(value)
+            
+            return dict_regexs
+        else:
+            return text.split()
+
+
+def _lexicon_digest(lexicon) -> str:
+    """
+    Hidden function that allows to get a digest of the content of a lexicon.
+
+    Parameters
+    ----------
+    lexicon : dict or list
+        Lexicon parsed.
+
+    Returns
+    -------
+    digest : str
+        Hexadecimal digest of the lexicon.
+
+    """
+    return hashlib.blake2b(repr(lexicon).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_artifact(data: bytes):
+    """
+    Hidden function that allows to unpickle an entry of the binary lexicon
+    file.
+
+    Parameters
+    ----------
+    data : bytes
+        Entry pickled.
+
+    Returns
+    -------
+    entry : object
+        Lexicon or object built from a lexicon.
+
+    """
+    return _LexiconUnpickler(io.BytesIO(data)).load()
+
+
+class _LexiconUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        """
+        Function that allows to restrict the objects of the binary lexicon
+        file to the classes built from the lexicons and to the compiled
+        regexs, so that loading it can not run any other code. The classes
+        are taken from this module whatever the name it is imported with.
+
+        Parameters
+        ----------
+        module : str
+            Module of the object.
+        
+        name : str
+            Name of the object.
+
+        Raises
+        ------
+        pickle.UnpicklingError
+            The object is not allowed in the binary lexicon file.
+
+        Returns
+        -------
+        object : type or callable
+            Object allowed.
+
+        """
+        if name in _LEXICON_CLASSES:
+            return _LEXICON_CLASSES[name]
+        elif module == "re" and name == "_compile":
+            return re._compile
+        else:
+            raise pickle.UnpicklingError(
+                f"object not allowed in a lexicon file: {module}.{name}"
+            )
+
+
+class _LemmaEngine:
+    def __init__(self, dict_regexs: dict, lowercase: bool=True,
+                 remove_accents: bool=False) -> None:
+        """
+        Function that allows to build the _LemmaEngine class from a lemma
+        lexicon. The whole-word entries (\\bword\\b) are gathered in a single
+        dictionary so that a sentence is lemmatized with one lookup per word,
+        the other entries are kept as compiled regexs.
+
+        Parameters
+        ----------
+        dict_regexs : dict
+            Lemma lexicon {regex: replacement}, in the order of the file.
+        
+        lowercase : bool, optional, default=True
+            If true, the lexicon is transform to lowercase before use.
+            It is only used with 'remove_accents'. Default is True.
+        
+        remove_accents : bool, optional, default=False
+            If true, the accents are removed from the lexicon before use.
+            Default is False.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if remove_accents == True:
+            dict_regexs = dict(
+                zip(
+                    _fold_words(list_words=list(dict_regexs), lowercase=lowercase),
+                    _fold_words(list_words=list(dict_regexs.values()), lowercase=lowercase)
+                )
+            )
+        else:
+            pass
+        
+        list_words = []
+        self.list_regexs = []
+        
+        for regex, value in dict_regexs.items():
+            match = _REGEX_WORD_ENTRY.fullmatch(regex)
+            
+            if match:
+                list_words.append((match.group(1).lower(), value))
+            else:
+                self.list_regexs.append(
+                    (re.compile(regex, flags=re.IGNORECASE), value)
+                )
+        
+        # the entries are applied one after the other in the file order, so a
+        # word replaced by an entry can be replaced again by a later entry:
+        # walking the file backwards gives the final replacement of each word
+        self.dict_words = {}
+        
+        for word, value in reversed(list_words):
+            self.dict_words[word] = _REGEX_WORD.sub(self._replace, value)
+    
+    
+    def lemmatize(self, text: str) -> str:
+        """
+        Function that allows to lemmatize a sentence.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to lemmatize.
+
+        Returns
+        -------
+        text : str
+            Sentence lemmatized.
+
+        """
+        text = _REGEX_WORD.sub(self._replace, text)
+        
+        for regex, value in self.list_regexs:
+            text = regex.sub(value, text)
+        
+        return text
+    
+    
+    def _replace(self, match) -> str:
+        """
+        Hidden function that allows to get the replacement of a matched word.
+
+        Parameters
+        ----------
+        match : re.Match
+            Word matched.
+
+        Returns
+        -------
+        word : str
+            Lemma of the word, or the word itself if it is not in the lexicon.
+
+        """
+        word = match.group()
+        
+        return self.dict_words.get(word.lower(), word)
+
+
+class LemmaTable:
+    def __init__(self, path: str) -> None:
+        """
+        Function that allows to build the LemmaTable class and initialise the
+        parameters. The LemmaTable class reads a lemma lexicon written by
+        LemmaTable.build: the words, lowercase and sorted, their lemmas and a
+        hash index of the words are stored in a file mapped in memory (mmap),
+        so a word is looked up with a hash and one or two comparisons. Nothing
+        is loaded in the memory of the process: the pages read are kept by
+        the page cache of the system and shared by all the processes which
+        map the same file, so a lexicon of millions of words does not take
+        more memory with more workers.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Raises
+        ------
+        TypeError
+            To use this class, the 'path' parameter must be a string.
+        
+        ValueError
+            The file must be a LemmaTable file of this version of the library,
+            written on a machine of the same byte order.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if isinstance(path, str):
+            self.path = os.path.abspath(path)
+        else:
+            raise TypeError(
+                f"'path' parameter must be a str: got {type(path)}"
+            )
+        
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._map) >= _LEMMA_TABLE_HEADER.size:
+            (magic, version, flags, count, size, digest) = _LEMMA_TABLE_HEADER.unpack_from(self._map, 0)
+        else:
+            (magic, version, flags) = (None, None, 0)
+        
+        if magic == _LEMMA_TABLE_MAGIC and version == _LEMMA_TABLE_VERSION and\
+            bool(flags & 4) == (sys.byteorder == "big"):
+            pass
+        else:
+            self._map.close()
+            raise ValueError(
+                f"'path' parameter must be a LemmaTable file of version {_LEMMA_TABLE_VERSION}: got {path}"
+            )
+        
+        self.count = count
+        self.version = digest.hex()
+        self.traits = (bool(flags & 1), bool(flags & 2))
+        self._key = ("lemme", self.version)
+        self._mask = size - 1
+        
+        # the offsets and the index are read in place, as views of the file
+        self._view = memoryview(self._map)
+        start = _LEMMA_TABLE_HEADER.size
+        self._word_offsets = self._view[start:start + 8 * (count + 1)].cast("Q")
+        start += 8 * (count + 1)
+        self._lemma_offsets = self._view[start:start + 8 * (count + 1)].cast("Q")
+        start += 8 * (count + 1)
+        self._slots = self._view[start:start + 4 * size].cast("I")
+        self._words_start = start + 4 * size
+        self._lemmas_start = self._words_start + self._word_offsets[count]
+    
+    
+    @classmethod
+    def build(cls, entries, path: str, encoding: str="utf-8"):
+        """
+        Function that allows to write a LemmaTable file from a lemma lexicon.
+        The words are lowercased and sorted; when a word is given several
+        times, its first lemma is kept, as with the lexicon files. The file
+        is written under another name and then renamed, so the processes
+        which use the previous version are not disturbed.
+
+        Parameters
+        ----------
+        entries : dict, list or str
+            Lexicon {word: lemma}, list of (word, lemma) pairs, or path of a
+            text file with a word and its lemma per line, separated by
+            spaces, as the files of the 'ressources/lemme' folder (the words
+            may be written \\bword\\b).
+        
+        path : str
+            Path of the file written.
+        
+        encoding : str, optional, default="utf-8"
+            Encoding of the text file. Default is "utf-8".
+
+        Raises
+        ------
+        TypeError
+            - To use this function, the 'entries' parameter must be a dict, a list or a string.
+            - To use this function, the 'path' parameter must be a string.
+        
+        ValueError
+            Each word must be a single word (\\w+) and each lemma a string.
+
+        Returns
+        -------
+        table : LemmaTable
+            Table written.
+
+        """
+        if isinstance(entries, dict):
+            items = entries.items()
+        elif isinstance(entries, list):
+            items = entries
+        elif isinstance(entries, str):
+            items = _read_lemma_pairs(path=entries, encoding=encoding)
+        else:
+            raise TypeError(
+                f"'entries' parameter must be a dict, a list or a str: got {type(entries)}"
+            )
+        
+        if isinstance(path, str):
+            pass
+        else:
+            raise TypeError(
+                f"'path' parameter must be a str: got {type(path)}"
+            )
+        
+        dict_words = {}
+        
+        for (word, lemma) in items:
+            match = _REGEX_WORD_ENTRY.fullmatch(word) if isinstance(word, str) else None
+            word = match.group(1) if match else word
+            
+            if isinstance(word, str) and _REGEX_WORD.fullmatch(word) and isinstance(lemma, str):
+                dict_words.setdefault(word.lower().encode("utf-8"), lemma.encode("utf-8"))
+            else:
+                raise ValueError(
+                    f"each entry must be a word (\\w+) and its lemma: got {(word, lemma)}"
+                )
+        
+        list_words = sorted(dict_words)
+        list_lemmas = [dict_words[word] for word in list_words]
+        digest = hashlib.blake2b(digest_size=16)
+        
+        for (word, lemma) in zip(list_words, list_lemmas):
+            digest.update(word + b"\t" + lemma + b"\n")
+        
+        # open addressing: a slot holds the position of a word plus one, or
+        # 0 if it is free, and at most half of the slots are used
+        size = 1 << max(1, (2 * len(list_words)).bit_length())
+        slots = [0] * size
+        
+        for (i, word) in enumerate(list_words, start=1):
+            slot = zlib.crc32(word) & (size - 1)
+            
+            while slots[slot] != 0:
+                slot = (slot + 1) & (size - 1)
+            
+            slots[slot] = i
+        
+        flags = (
+            all([lemma == lemma.lower() for lemma in list_lemmas])
+            | all([b" " not in lemma for lemma in list_lemmas]) << 1
+            | (sys.byteorder == "big") << 2
+        )
+        temporary = f"{path}.{os.getpid()}.tmp"
+        
+        with open(temporary, "wb") as file:
+            file.write(
+                _LEMMA_TABLE_HEADER.pack(
+                    _LEMMA_TABLE_MAGIC, _LEMMA_TABLE_VERSION, flags, len(list_words), size, digest.digest()
+                )
+            )
+            
+            for list_bytes in [list_words, list_lemmas]:
+                offsets = np.zeros(len(list_bytes) + 1, dtype=np.uint64)
+                np.cumsum([len(value) for value in list_bytes], out=offsets[1:])
+                file.write(offsets.tobytes())
+            
+            file.write(np.array(slots, dtype=np.uint32).tobytes())
+            file.write(b"".join(list_words))
+            file.write(b"".join(list_lemmas))
+        
+        os.replace(temporary, path)
+        
+        return cls(path=path)
+    
+    
+    def __len__(self) -> int:
+        """
+        Function that allows to get the number of words of the table.
+
+        Returns
+        -------
+        count : int
+            Number of words.
+
+        """
+        return self.count
+    
+    
+    def get(self, word: str, default: str=None) -> str:
+        """
+        Function that allows to get the lemma of a word, ignoring its case.
+
+        Parameters
+        ----------
+        word : str
+            Word to look up.
+        
+        default : str, optional, default=None
+            Value returned if the word is not in the table. Default is None.
+
+        Returns
+        -------
+        lemma : str
+            Lemma of the word, or 'default'.
+
+        """
+        key = word.lower().encode("utf-8")
+        slot = zlib.crc32(key) & self._mask
+        
+        while True:
+            i = self._slots[slot]
+            
+            if i == 0:
+                return default
+            elif self._map[self._words_start + self._word_offsets[i - 1]:self._words_start + self._word_offsets[i]] == key:
+                return self._map[
+                    self._lemmas_start + self._lemma_offsets[i - 1]:self._lemmas_start + self._lemma_offsets[i]
+                ].decode("utf-8")
+            else:
+                slot = (slot + 1) & self._mask
+    
+    
+    def lemmatize(self, text: str) -> str:
+        """
+        Function that allows to lemmatize a sentence. The lemmas are kept in
+        the token_cache, so a frequent word is looked up only once.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to lemmatize.
+
+        Returns
+        -------
+        text : str
+            Sentence lemmatized.
+
+        """
+        return _REGEX_WORD.sub(self._replace, text)
+    
+    
+    def close(self) -> None:
+        """
+        Function that allows to unmap the file. The table can not be used
+        after.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        for view in [self._word_offsets, self._lemma_offsets, self._slots, self._view]:
+            view.release()
+        
+        self._map.close()
+    
+    
+    def _replace(self, match) -> str:
+        """
+        Hidden function that allows to get the lemma of a matched word.
+
+        Parameters
+        ----------
+        match : re.Match
+            Word matched.
+
+        Returns
+        -------
+        word : str
+            Lemma of the word, or the word itself if it is not in the table.
+
+        """
+        return token_cache.get(
+            key=self._key,
+            word=match.group(),
+            function=self._lookup
+        )
+    
+    
+    def _lookup(self, word: str) -> str:
+        """
+        Hidden function that allows to look up a single word.
+
+        Parameters
+        ----------
+        word : str
+            Word to look up.
+
+        Returns
+        -------
+        word : str
+            Lemma of the word, or the word itself if it is not in the table.
+
+        """
+        return self.get(word=word, default=word)
+
+
+def _open_lemma_table(path: str) -> LemmaTable:
+    """
+    Hidden function that allows to get the LemmaTable of a file, mapped once
+    per process. It is mapped again if the file has been rebuilt.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    table : LemmaTable
+        Table of the file.
+
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    with _LEMMA_TABLES_LOCK:
+        if path not in _LEMMA_TABLES or _LEMMA_TABLES[path][0] != key:
+            _LEMMA_TABLES[path] = (key, LemmaTable(path=path))
+        else:
+            pass
+        
+        return _LEMMA_TABLES[path][1]
+
+
+def _read_lemma_pairs(path: str, encoding: str):
+    """
+    Hidden function that allows to read the (word, lemma) pairs of a text
+    file, one pair per line, without loading the whole file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    
+    encoding : str
+        Encoding of the file.
+
+    Raises
+    ------
+    ValueError
+        Each line must contain a word and its lemma.
+
+    Returns
+    -------
+    pairs : generator
+        (word, lemma) pairs, in the order of the file.
+
+    """
+    with open(path, "r", encoding=encoding) as file:
+        for line in file:
+            if line.strip():
+                values = line.split()
+                
+                if len(values) == 2:
+                    yield (values[0], values[1])
+                else:
+                    raise ValueError(
+                        f"each line must contain a word and its lemma: got {line.strip()}"
+                    )
+            else:
+                pass
+
+
+class TokenCache:
+    def __init__(self, maxsize: int=100000) -> None:
+        """
+        Function that allows to build the TokenCache class and initialise the
+        parameters. The TokenCache class keeps the last normalized words
+        (e.g. stems), so that the frequent words of a corpus are normalized
+        once and then looked up. The least recently used words are dropped
+        when the cache is full.
+
+        Parameters
+        ----------
+        maxsize : int, optional, default=100000
+            Maximal number of words kept. If 0, nothing is kept.
+            Default is 100000.
+
+        Raises
+        ------
+        TypeError
+            To use this class, the 'maxsize' parameter must be a positive integer.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._words = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.resize(maxsize=maxsize)
+    
+    
+    def get(self, key: tuple, word: str, function) -> str:
+        """
+        Function that allows to get a normalized word from the cache, or to
+        normalize it and to store it.
+
+        Parameters
+        ----------
+        key : tuple
+            Language and options of the normalization.
+        
+        word : str
+            Word to normalize.
+        
+        function : callable
+            Function that normalizes the word.
+
+        Returns
+        -------
+        word : str
+            Word normalized.
+
+        """
+        try:
+            value = self._words[(word, key)]
+            self._words.move_to_end((word, key))
+            self.hits += 1
+            
+            return value
+        except KeyError:
+            pass
+        
+        self.misses += 1
+        value = function(word)
+        
+        if self.maxsize > 0:
+            self._words[(word, key)] = value
+            
+            if len(self._words) > self.maxsize:
+                self._words.popitem(last=False)
+            else:
+                pass
+        else:
+            pass
+        
+        return value
+    
+    
+    def info(self) -> dict:
+        """
+        Function that allows to get the statistics of the cache.
+
+        Returns
+        -------
+        dict_info : dict
+            Number of hits, misses, words kept and maximal size.
+
+        """
+        dict_info = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._words),
+            "maxsize": self.maxsize
+        }
+        
+        return dict_info
+    
+    
+    def resize(self, maxsize: int) -> None:
+        """
+        Function that allows to change the maximal size of the cache. The
+        least recently used words are dropped if needed.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximal number of words kept. If 0, nothing is kept.
+
+        Raises
+        ------
+        TypeError
+            To use this function, the 'maxsize' parameter must be a positive integer.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if isinstance(maxsize, int) and maxsize >= 0:
+            self.maxsize = maxsize
+        else:
+            raise TypeError(
+                f"'maxsize' parameter must be a positive int: got {maxsize}"
+            )
+        
+        while len(self._words) > self.maxsize:
+            self._words.popitem(last=False)
+    
+    
+    def clear(self) -> None:
+        """
+        Function that allows to empty the cache and to reset its statistics.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self._words.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class _StemEngine:
+    def __init__(self, list_regexs: list, language: str="english",
+                 lowercase: bool=True, remove_accents: bool=False) -> None:
+        """
+        Function that allows to build the _StemEngine class from a stem
+        lexicon. If all the entries are suffixes (e.g. ing\\b), each word of
+        a sentence is stemmed on its own and the stems are kept in the
+        token_cache, otherwise the entries are applied to the whole sentence.
+
+        Parameters
+        ----------
+        list_regexs : list
+            Stem lexicon, list of regexs to delete.
+        
+        language : str, optional, default="english"
+            Language of the lexicon, part of the key of the cached stems.
+            Default is "english".
+        
+        lowercase : bool, optional, default=True
+            If true, the lexicon is transform to lowercase before use.
+            It is only used with 'remove_accents'. Default is True.
+        
+        remove_accents : bool, optional, default=False
+            If true, the accents are removed from the lexicon before use.
+            Default is False.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        if remove_accents == True:
+            list_regexs = _fold_words(list_words=list_regexs, lowercase=lowercase)
+        else:
+            pass
+        
+        self.list_regexs = _compile_regexs(list_regexs)
+        # a suffix regex can only match inside a word, so stemming the words
+        # one by one gives the same result as stemming the whole sentence
+        self.by_word = all(
+            [_REGEX_SUFFIX_ENTRY.fullmatch(regex) for regex in list_regexs]
+        )
+        self.key = ("stemme", language, lowercase, remove_accents)
+    
+    
+    def stemmatize(self, text: str) -> str:
+        """
+        Function that allows to stemmatize a sentence.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to stemmatize.
+
+        Returns
+        -------
+        text : str
+            Sentence stemmatized.
+
+        """
+        if self.by_word == True:
+            return _REGEX_WORD.sub(self._replace, text)
+        else:
+            return _sub_regexs(text=text, list_regexs=self.list_regexs)
+    
+    
+    def _replace(self, match) -> str:
+        """
+        Hidden function that allows to get the stem of a matched word.
+
+        Parameters
+        ----------
+        match : re.Match
+            Word matched.
+
+        Returns
+        -------
+        word : str
+            Stem of the word.
+
+        """
+        return token_cache.get(
+            key=self.key,
+            word=match.group(),
+            function=self._stem
+        )
+    
+    
+    def _stem(self, word: str) -> str:
+        """
+        Hidden function that allows to stem a single word.
+
+        Parameters
+        ----------
+        word : str
+            Word to stem.
+
+        Returns
+        -------
+        word : str
+            Stem of the word.
+
+        """
+        return _sub_regexs(text=word, list_regexs=self.list_regexs)
+
+
+class _StopwordSet:
+    def __init__(self, list_stopwords: list, lowercase: bool=True,
+                 remove_accents: bool=False) -> None:
+        """
+        Function that allows to build the _StopwordSet class from a stopwords
+        lexicon. The stopwords, without accents if needed, are kept in an
+        immutable set built once per process.
+
+        Parameters
+        ----------
+        list_stopwords : list
+            Stopwords lexicon.
+        
+        lowercase : bool, optional, default=True
+            If true, the stopwords are transform to lowercase before use.
+            It is only used with 'remove_accents'. Default is True.
+        
+        remove_accents : bool, optional, default=False
+            If true, the accents are removed from the stopwords before use.
+            Default is False.
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.lowercase = lowercase
+        self.remove_accents = remove_accents
+        
+        if remove_accents == True:
+            self.dict_words = dict(
+                zip(
+                    list_stopwords,
+                    _fold_words(list_words=list_stopwords, lowercase=lowercase)
+                )
+            )
+        else:
+            self.dict_words = dict(zip(list_stopwords, list_stopwords))
+        
+        # several stopwords can give the same word without accents (e.g. a
+        # and à), it is only removed when all of them are removed
+        self.dict_sources = {}
+        
+        for word, folded in self.dict_words.items():
+            self.dict_sources.setdefault(folded, set()).add(word)
+        
+        self.words = frozenset(self.dict_sources)
+    
+    
+    def select(self, remove_stopwords: list=None, add_stopwords: list=None) -> frozenset:
+        """
+        Function that allows to get the set of stopwords to remove, after the
+        changes asked by the user.
+
+        Parameters
+        ----------
+        remove_stopwords : list, optional, default=None
+            Stopwords to keep in the text. Default is None.
+        
+        add_stopwords : list, optional, default=None
+            Words to remove from the text in addition to the stopwords.
+            Default is None.
+
+        Returns
+        -------
+        set_words : frozenset
+            Words to remove.
+
+        """
+        if not remove_stopwords and not add_stopwords:
+            return self.words
+        else:
+            pass
+        
+        set_remove = set(remove_stopwords or [])
+        set_words = self.words - {
+            self.dict_words[word] for word in set_remove
+            if word in self.dict_words and self.dict_sources[self.dict_words[word]] <= set_remove
+        }
+        
+        if add_stopwords and self.remove_accents == True:
+            set_words = set_words | set(
+                _fold_words(list_words=add_stopwords, lowercase=self.lowercase)
+            )
+        elif add_stopwords:
+            set_words = set_words | set(add_stopwords)
+        else:
+            pass
+        
+        return frozenset(set_words)
+
+
+class _AccentFolder:
+    def __init__(self, dict_regexs: dict, method: str="translate") -> None:
+        """
+        Function that allows to build the _AccentFolder class from the accents
+        lexicon. The literal entries, characters (e.g. é) and sequences (badly
+        encoded characters, e.g. \\xc3\\xa9), are gathered in a
+        _LiteralReplacer and the other entries are kept as regexs.
+
+        Parameters
+        ----------
+        dict_regexs : dict
+            Accents lexicon {regex: replacement}.
+        
+        method : {"translate", "unicode"}, str, optional, default="translate"
+            If "unicode", the characters that are not in the lexicon are also
+            decomposed (NFD) and their combining accents removed. The
+            canonical decomposition only separates the accents: it keeps the
+            case and the other characters (NFKD would turn ™ into TM).
+            Default is "translate".
+
+        Returns
+        -------
+        None
+            NoneType.
+
+        """
+        self.method = method
+        self.dict_characters = {}
+        self.dict_sequences = {}
+        self.list_regexs = []
         
-        if isinstance(remove_accents, bool):
-            if remove_accents == True:
-                self.data = TextNet(
-                    data=self.data,
-                    column=self.column
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                df_regexs = pd.DataFrame(
-                    list(dict_regexs.items()),
-                    columns=["Keys", "Values"]
-                )
-                df_regexs = TextNet(
-                    data=df_regexs,
-                    column="Keys"
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                df_regexs = TextNet(
-                    data=df_regexs,
-                    column="Values"
-                ).remove_accent(
-                    lowercase=lowercase
+        # the lexicon is applied ignoring the case, like the regex method, so
+        # each entry is registered with all its case variants
+        for regex, value in dict_regexs.items():
+            sequence = _literal_sequence(regex=regex)
+            
+            if sequence == None:
+                self.list_regexs.append(
+                    (re.compile(regex, flags=re.IGNORECASE), value)
                 )
-                liste_keys = df_regexs["Keys"].tolist()
-                liste_values = df_regexs["Values"].tolist()
-                dict_regexs = dict(zip(liste_keys, liste_values))
+            elif len(sequence) == 1:
+                for variant in _case_variants(text=sequence):
+                    self.dict_characters.setdefault(variant, value)
             else:
-                pass
-        else:
-            raise TypeError(
-                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
-            )
-        
-        for i in range(0, self.data[self.column].shape[0]):
-            for regex in dict_regexs:
-                self.data[self.column][i] = re.sub(
-                    regex,
-                    dict_regexs[regex],
-                    self.data[self.column][i],
-                    flags=re.IGNORECASE
-                )
+                for variant in _case_variants(text=sequence):
+                    self.dict_sequences.setdefault(variant, value)
         
-        return self.data
+        # the sequences are replaced before the regexs and the characters
+        # after, so with regexs they can not share the same scan
+        if self.list_regexs:
+            self.list_replacers = [
+                _LiteralReplacer(dict_rules=self.dict_sequences),
+                _LiteralReplacer(dict_rules=self.dict_characters)
+            ]
+        else:
+            self.list_replacers = [
+                _LiteralReplacer(dict_rules={**self.dict_sequences, **self.dict_characters})
+            ]
     
     
-    def stemmatize(self, language: str="english", lowercase: bool=True, remove_accents: bool=False) -> pd.core.frame.DataFrame:
+    def fold(self, text: str) -> str:
         """
-        Function that allows each sentence of a dataset to be stemmatized.
-        In other words, for each sentence, verbs and words are replaced by their
-        root / base word.
-        
-        Example of use: ponies > poni, dogs > dog, running > runn
+        Function that allows to remove the accents from a sentence.
 
         Parameters
         ----------
-        language : {"english", "french"}, str, optional, default="english"
-            Language of stopwords to be removed. Default is "english".
-            
-        lowercase : bool, optional, default=True
-            If true, the text will be transform to lowercase before cleaning.
-            Otherwise the cleaning is applied to the text as in input.
-            Default is True.
-            
-        remove_accents : bool, optional, default=False
-            If false, the accents on words will not be removed before cleaning.
-            Otherwise, the cleaning is applied on the words without accents.
-            Default is False.
-
-        Raises
-        ------
-        TypeError
-            - To use this function, the 'language' parameter must be a string.
-            - To use this function, the 'lowercase' parameter must be a boolean.
-            - To use this function, the 'remove_accents' parameter must be a boolean.
+        text : str
+            Sentence to clean.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        text : str
+            Sentence without accents.
 
         """
-        if isinstance(language, str):
-            pass
+        if text.isascii():
+            return text
         else:
-            raise TypeError(
-                f"'language' parameter must be a str: got {type(language)}"
-            )
+            pass
         
-        if isinstance(lowercase, bool):
-            if lowercase == True:
-                self.data = TextNet(data=self.data, column=self.column).lowercase()
-            else:
-                pass
-        else:
-            raise TypeError(
-                f"'lowercase' parameter must be a bool: got {type(lowercase)}"
-            )
+        text = self.list_replacers[0].replace(text)
         
-        if language == "english":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/stemme/english.txt"
-            path = os.getcwd()
-            filename = "\\english.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            with open(path+filename, "r") as file:
-                list_regexs = file.read().split()
-            
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
-        elif language == "french":
-            url = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources/stemme/french.txt"
-            path = os.getcwd()
-            filename = "\\french.txt"
-            
-            _DownloadDeleteFile(path=path, filename=filename)._download_file(url=url)
-            
-            with open(path+filename, "r") as file:
-                list_regexs = file.read().split()
-            
-            _DownloadDeleteFile(path=path, filename=filename)._remove_file()
+        for regex, value in self.list_regexs:
+            text = regex.sub(value, text)
         
-        list_regexs_len = len(list_regexs)
+        for replacer in self.list_replacers[1:]:
+            text = replacer.replace(text)
         
-        if isinstance(remove_accents, bool):
-            if remove_accents == True:
-                self.data = TextNet(
-                    data=self.data,
-                    column=self.column
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                df_regexs = pd.DataFrame(list_regexs, columns=["Regexs"])
-                df_regexs = TextNet(
-                    data=df_regexs,
-                    column="Regexs"
-                ).remove_accent(
-                    lowercase=lowercase
-                )
-                list_regexs = df_regexs["Regexs"].tolist()
-                
-                assert len(list_regexs) == list_regexs_len, "list_regexs' shape must remain the same as before deletion"
-            else:
-                pass
-        else:
-            raise TypeError(
-                f"'remove_accents' parameter must be a bool: got {type(remove_accents)}"
+        if self.method == "unicode" and not text.isascii():
+            text = "".join(
+                [
+                    character for character in unicodedata.normalize("NFD", text)
+                    if not unicodedata.combining(character)
+                ]
             )
+        else:
+            pass
         
-        for i in range(0, self.data[self.column].shape[0]):
-            for regex in list_regexs:
-                self.data[self.column][i] = re.sub(
-                    regex,
-                    "",
-                    self.data[self.column][i],
-                    flags=re.IGNORECASE
-                )
-        
-        return self.data
-
-
-#------------------------------------------------------------------------------
+        return text
 
 
-class Tokenize:
-    def __init__(self, data, column: str) -> None:
+class _LiteralReplacer:
+    def __init__(self, dict_rules: dict) -> None:
         """
-        Function that allows to build the Tokenize class and initialise the
-        parameters.
+        Function that allows to build the _LiteralReplacer class from a set of
+        literal rules {text: replacement}. The texts are gathered in a trie
+        compiled into a single regex (see _trie_regex), so a sentence is
+        cleaned in one scan whatever the number of rules. It is also faster
+        than str.translate for the rules of one character.
 
         Parameters
         ----------
-        data : pandas.core.frame.DataFrame or pandas.cores.series.Series
-            Dataset to be cleaned.
-        
-        column : str
-            - If 'data' parameter is a pandas.core.frame.DataFrame, 'column'
-            parameter should be the 
-            name assigned to the column to clean.
-            - If 'data' parameter is a pandas.core.series.Series, 'column'
-            parameter will be its output name.
-        
-        Raises
-        ------
-        TypeError
-            - To use this class, the 'data' parameter must be a
-            pandas.core.frame.DataFrame or pandas.cores.series.Series.
-            - To use this class, the 'column' parameter must be a string.
+        dict_rules : dict
+            Literal rules {text: replacement}, the texts are case sensitive.
 
         Returns
         -------
@@ -1138,94 +7270,95 @@ class Tokenize:
             NoneType.
 
         """
-        if isinstance(data, pd.core.frame.DataFrame):
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
-        elif isinstance(data, pd.core.series.Series):
-            data.to_frame(
-                name=column
+        self.dict_rules = {
+            text: value for (text, value) in dict_rules.items() if len(text) > 0
+        }
+        
+        if self.dict_rules:
+            self.regex_rules = re.compile(
+                _trie_regex(list_words=list(self.dict_rules))
             )
-            data.reset_index(drop=True, inplace=True)
-            self.data = data
         else:
-            raise TypeError(
-                f"'data' parameter must be a pandas.core.frame.DataFrame or pandas.cores.series.Series: got {type(data)}"
-            )
+            self.regex_rules = None
         
-        if isinstance(column, str):
-            self.column = column
+        # without a function per match when all the replacements are the same
+        if len(set(self.dict_rules.values())) == 1:
+            self.replacement = list(self.dict_rules.values())[0].replace("\\", "\\\\")
         else:
-            raise TypeError(
-                f"'column' parameter must be a str: got {type(column)}"
-            )
+            self.replacement = self._replace
     
     
-    def word_tokenize(self) -> pd.core.frame.DataFrame:
+    def replace(self, text: str) -> str:
         """
-        Function that allows to transform in token each word from a sentence in
-        a dataset. Tokenize a word is the fact that divide single string into
-        list of substring.
-        
-        Example of use: >>> string = "I'm a Data Scientist"
-                        ... ["I'm", "a", "Data", "Scientist"]
+        Function that allows to apply all the rules to a sentence. At each
+        position, the longest text matched is replaced.
+
+        Parameters
+        ----------
+        text : str
+            Sentence to clean.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        text : str
+            Sentence cleaned.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = self.data[self.column][i].split(" ")
-        
-        return self.data
+        if self.regex_rules != None:
+            return self.regex_rules.sub(self.replacement, text)
+        else:
+            return text
     
     
-    def word_detokenize(self) -> pd.core.frame.DataFrame:
+    def _replace(self, match) -> str:
         """
-        Function that allows to transform in sentence a most of tokens from an
-        observation in a dataset. Detokenize a list of tokens is the fact that
-        join list of substring into a single string.
-        
-        Example of use: >>> string = ["I'm", "a", "Data", "Scientist"]
-                        ... "I'm a Data Scientist"
+        Hidden function that allows to get the replacement of a matched
+        text.
+
+        Parameters
+        ----------
+        match : re.Match
+            Text matched.
 
         Returns
         -------
-        self.data : pandas.core.frame.DataFrame
-            Dataset cleaned.
+        value : str
+            Replacement of the text.
 
         """
-        for i in range(0, self.data[self.column].shape[0]):
-            self.data[self.column][i] = " ".join(
-                self.data[self.column][i]
-            )
-        
-        return self.data
-
-
-#------------------------------------------------------------------------------
+        return self.dict_rules[match.group()]
+    
+    
+    def __getstate__(self) -> dict:
+        """
+        Function that allows to pickle the _LiteralReplacer class (see
+        LexiconCache.compile) without its bound method, which the binary
+        lexicon file does not allow.
 
+        Returns
+        -------
+        dict_state : dict
+            Attributes of the object.
 
-class _DownloadDeleteFile:
-    def __init__(self, path: str, filename: str) -> None:
         """
-        Function that allows to build the _DownloadDeleteFile class and initialise
-        the parameters.
+        dict_state = dict(self.__dict__)
+        
+        if dict_state["replacement"] == self._replace:
+            dict_state["replacement"] = None
+        else:
+            pass
+        
+        return dict_state
+    
+    
+    def __setstate__(self, dict_state: dict) -> None:
+        """
+        Function that allows to unpickle the _LiteralReplacer class.
 
         Parameters
         ----------
-        path : str
-            Path to where to download the file.
-        
-        filename : str
-            Name of the file.
-        
-        Raises
-        ------
-        TypeError
-            - To use this class, the 'path' parameter must be a string.
-            - To use this class, the 'filename' parameter must be a string.
+        dict_state : dict
+            Attributes of the object.
 
         Returns
         -------
@@ -1233,47 +7366,394 @@ class _DownloadDeleteFile:
             NoneType.
 
         """
-        if isinstance(path, str):
-            self.path = path
+        self.__dict__.update(dict_state)
+        
+        if self.replacement == None:
+            self.replacement = self._replace
         else:
-            raise TypeError(
-                f"'path' parameter must be a str: got {type(path)}"
-            )
+            pass
+
+
+def _trie_regex(list_words: list) -> str:
+    """
+    Hidden function that allows to compile a list of texts into a regex that
+    follows their trie: the texts sharing a prefix share the beginning of the
+    regex (e.g. ["abc", "abd", "ab"] gives "ab(?:[cd])?"). The regex engine
+    tries one branch per character at most, so its cost does not depend on
+    the number of texts, and the longest text is matched.
+
+    Parameters
+    ----------
+    list_words : list
+        Texts to match.
+
+    Returns
+    -------
+    regex : str
+        Regex matching any of the texts.
+
+    """
+    trie = {}
+    
+    for word in list_words:
+        node = trie
         
-        if isinstance(filename, str):
-            self.filename = filename
+        for character in word:
+            node = node.setdefault(character, {})
+        
+        node[""] = {}
+    
+    return _trie_node_regex(node=trie)
+
+
+def _trie_node_regex(node: dict) -> str:
+    """
+    Hidden function that allows to compile a node of a trie into a regex.
+
+    Parameters
+    ----------
+    node : dict
+        Node {character: child node}, the key "" marks the end of a text.
+
+    Returns
+    -------
+    regex : str
+        Regex matching the ends of the texts below the node.
+
+    """
+    list_characters = []
+    list_branches = []
+    
+    for character in sorted([key for key in node if key != ""]):
+        child = _trie_node_regex(node=node[character])
+        
+        if child == "":
+            list_characters.append(re.escape(character))
         else:
-            raise TypeError(
-                f"'filename' parameter must be a str: got {type(filename)}"
-            )
+            list_branches.append(re.escape(character) + child)
+    
+    if len(list_characters) == 1:
+        list_branches.append(list_characters[0])
+    elif len(list_characters) > 1:
+        list_branches.append("[" + "".join(list_characters) + "]")
+    else:
+        pass
+    
+    if len(list_branches) == 0:
+        return ""
+    elif len(list_branches) == 1 and "" not in node:
+        return list_branches[0]
+    elif "" in node:
+        return "(?:" + "|".join(list_branches) + ")?"
+    else:
+        return "(?:" + "|".join(list_branches) + ")"
+
+
+def _literal_sequence(regex: str) -> str:
+    """
+    Hidden function that allows to get the text matched by a regex if the
+    regex only matches a literal text (e.g. "\\xc3\\xa9" matches "Ã©").
+
+    Parameters
+    ----------
+    regex : str
+        Regex of a lexicon.
+
+    Returns
+    -------
+    sequence : str
+        Text matched by the regex, or None if the regex is not literal.
+
+    """
+    if re.escape(regex) == regex:
+        return regex
+    elif _REGEX_LITERAL_ESCAPES.fullmatch(regex):
+        try:
+            return codecs.decode(regex, "unicode_escape")
+        except UnicodeError:
+            return None
+    else:
+        return None
+
+
+def _case_variants(text: str) -> list:
+    """
+    Hidden function that allows to get all the lowercase and uppercase
+    variants of a short text (e.g. "Ã©" gives "Ã©", "ã©").
+
+    Parameters
+    ----------
+    text : str
+        Text.
+
+    Returns
+    -------
+    list_variants : list
+        Variants of the text, the text itself first.
+
+    """
+    list_variants = [""]
+    
+    for character in text:
+        list_cases = [character]
+        
+        for case in [character.lower(), character.upper()]:
+            if len(case) == 1 and case not in list_cases:
+                list_cases.append(case)
+            else:
+                pass
+        
+        list_variants = [
+            variant + case for variant in list_variants for case in list_cases
+        ]
+    
+    return list_variants
+
+
+_RESULT_CACHE_BATCH = 500
+_RESULT_CACHE_USED_ROWS = 10000
+_LEXICON_KINDS = ("accents", "lemme", "stemme", "stopwords")
+_LEXICON_ENCODING = "cp1252"
+_LEXICON_URL = "https://raw.githubusercontent.com/lprtk/pyTCTK/main/ressources"
+_LEMMA_TABLE_HEADER = struct.Struct("<8sIIQQ16s")
+_LEMMA_TABLE_MAGIC = b"PYTCTKLT"
+_LEMMA_TABLE_VERSION = 1
+_LEMMA_TABLES = {}
+_LEMMA_TABLES_LOCK = threading.Lock()
+_LEXICON_ARTIFACT = "lexicons.pickle"
+_LEXICON_ARTIFACT_VERSION = 1
+_LEXICON_BUILDERS = {
+    builder.__name__: builder for builder in [
+        _LemmaEngine, _StemEngine, _StopwordSet, _AccentFolder, _compile_regexs,
+        _lexicon_digest, _lexicon_traits
+    ]
+}
+_LEXICON_CLASSES = {
+    cls.__name__: cls for cls in [
+        _LemmaEngine, _StemEngine, _StopwordSet, _AccentFolder, _LiteralReplacer
+    ]
+}
+_REGEX_WORD = re.compile(r"\w+")
+_REGEX_LITERAL_ESCAPES = re.compile(r"(?:\\x[0-9a-fA-F]{2}|\\u[0-9a-fA-F]{4}|\w)+")
+_REGEX_SUFFIX_ENTRY = re.compile(r"\w+\\b")
+_REGEX_WORD_ENTRY = re.compile(r"\\b(\w+)\\b")
+
+lexicons = LexiconCache()
+token_cache = TokenCache()
+_LITERAL_ADDITIONAL = _LiteralReplacer(
+    dict_rules=dict.fromkeys(_ADDITIONAL_CHARACTERS, "")
+)
+
+
+#------------------------------------------------------------------------------
+
+
+def main(argv: list=None) -> int:
+    """
+    Function that allows to clean a csv, jsonl or parquet file from the
+    command line, with a Pipeline read by chunks.
     
+    Example of use:
+        $ python pyTCTK.py input.csv output.csv --column Text --steps lowercase
+          remove_url "remove_stopword:language=french" --workers 4 --profile
+        $ python pyTCTK.py input.parquet output.parquet --config config.json
+    
+    A step is the name of a cleaning method, followed by its arguments after
+    a colon (e.g. "lemmatize:language=french,remove_accents=true"); the
+    values are read as JSON when possible. The config file is a JSON object
+    with the same options as the command line, the steps being a list of
+    names or of [name, {arguments}] pairs. The options of the command line
+    override the config file.
+
+    Parameters
+    ----------
+    argv : list, optional, default=None
+        Arguments of the command line. If None, sys.argv is used.
+        Default is None.
+
+    Returns
+    -------
+    code : int
+        0 if the file is cleaned, 2 if the arguments are not valid or the
+        input file can not be read or cleaned.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="pyTCTK",
+        description="Clean the text column of a csv, jsonl or parquet file."
+    )
+    parser.add_argument("input", help="file to clean")
+    parser.add_argument("output", help="cleaned file, overwritten if it exists")
+    parser.add_argument("--column", help="name of the column to clean")
+    parser.add_argument("--steps", nargs="+",
+                        help="cleaning methods to apply, in order (name or name:key=value,...)")
+    parser.add_argument("--config", help="JSON file with the steps and the options")
+    parser.add_argument("--workers", type=int,
+                        help="number of processes, -1 for all the processors (default 1)")
+    parser.add_argument("--chunksize", type=int,
+                        help="number of rows read and cleaned at once (default 100000)")
+    parser.add_argument("--input-format", choices=["csv", "jsonl", "parquet"],
+                        help="format of the input file (default: its extension)")
+    parser.add_argument("--output-format", choices=["csv", "jsonl", "parquet"],
+                        help="format of the output file (default: its extension)")
+    parser.add_argument("--dedup", action="store_true", default=None,
+                        help="clean each distinct sentence only once")
+    parser.add_argument("--cache", help="SQLite file of the results already cleaned")
+    parser.add_argument("--profile", action="store_true", default=None,
+                        help="print the time spent in each step")
+    args = parser.parse_args(argv)
     
-    def _download_file(self, url: str) -> None:
-            """
-            Hidden function that allows to dowload file from an url.
+    dict_config = {}
     
-            Parameters
-            ----------
-            url : str
-                URL of the file to doawload.
+    if args.config != None:
+        try:
+            with open(args.config, "r", encoding="utf-8") as file:
+                dict_config = json.load(file)
+        except (OSError, ValueError) as error:
+            parser.error(f"can not read the config file: {error}")
+        
+        if isinstance(dict_config, dict):
+            pass
+        else:
+            parser.error("the config file must contain a JSON object")
+    else:
+        pass
     
-            Returns
-            -------
-            None
-                NoneType.
+    for option in ["column", "steps", "workers", "chunksize", "input_format",
+                   "output_format", "dedup", "cache", "profile"]:
+        if getattr(args, option) != None:
+            dict_config[option] = getattr(args, option)
+        else:
+            pass
     
-            """
-            request.urlretrieve(url=url, filename=self.path+self.filename)
+    if dict_config.get("column") == None:
+        parser.error("the column to clean must be given with --column or in the config file")
+    elif not dict_config.get("steps"):
+        parser.error("the steps must be given with --steps or in the config file")
+    else:
+        pass
     
+    try:
+        cache = ResultCache(path=dict_config["cache"]) if dict_config.get("cache") else None
+    except (TypeError, ValueError, OSError, sqlite3.Error) as error:
+        parser.error(f"can not open the cache: {error}")
     
-    def _remove_file(self) -> None:
-        """
-        Hidden function that allows to delete a downloaded file.
+    try:
+        pipeline = Pipeline(
+            steps=[_parse_step(step) for step in dict_config["steps"]],
+            n_jobs=dict_config.get("workers", 1),
+            dedup=dict_config.get("dedup", False),
+            cache=cache
+        )
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+    
+    start = time.perf_counter()
+    
+    # a missing input file, a wrong column or format are errors of the
+    # arguments, the output file is kept as it was
+    try:
+        rows = pipeline.transform_file(
+            input_path=args.input,
+            output_path=args.output,
+            column=dict_config["column"],
+            chunksize=dict_config.get("chunksize", 100000),
+            input_format=dict_config.get("input_format"),
+            output_format=dict_config.get("output_format"),
+            profile=dict_config.get("profile", False)
+        )
+    except (OSError, TypeError, ValueError, ImportError) as error:
+        parser.error(str(error))
+    
+    seconds = time.perf_counter() - start
+    
+    print(f"{rows} rows cleaned in {seconds:.2f}s", file=sys.stderr)
+    
+    if dict_config.get("profile", False) == True:
+        print(pipeline.report().to_string(index=False), file=sys.stderr)
+    else:
+        pass
+    
+    return 0
 
-        Returns
-        -------
-        None
-            NoneType.
 
-        """
-        os.remove(self.path+self.filename)
\ No newline at end of file
+def _parse_step(step):
+    """
+    Hidden function that allows to read a step of the command line
+    ("name:key=value,...") or of the config file (name or [name, {...}]).
+
+    Parameters
+    ----------
+    step : str or list
+        Step to read.
+
+    Raises
+    ------
+    ValueError
+        The step must be a name, "name:key=value,..." or [name, {arguments}].
+
+    Returns
+    -------
+    step : str or tuple
+        Step of a Pipeline.
+
+    """
+    if isinstance(step, list) and len(step) == 2 and isinstance(step[1], dict):
+        return (step[0], step[1])
+    elif isinstance(step, str) and ":" not in step:
+        return step
+    elif isinstance(step, str):
+        (name, arguments) = step.split(":", 1)
+        dict_parameters = {}
+        
+        list_arguments = [""]
+        (depth, quoted, escaped) = (0, False, False)
+        
+        # a comma only starts a new argument outside the brackets and the
+        # strings of a JSON value: add_stopwords=["foo","bar"]
+        for character in arguments:
+            if quoted == True:
+                if escaped == True:
+                    escaped = False
+                elif character == "\\":
+                    escaped = True
+                elif character == '"':
+                    quoted = False
+                else:
+                    pass
+            elif character == '"':
+                quoted = True
+            elif character in "[{":
+                depth += 1
+            elif character in "]}":
+                depth -= 1
+            elif character == "," and depth == 0:
+                list_arguments.append("")
+                continue
+            else:
+                pass
+            
+            list_arguments[-1] += character
+        
+        for argument in list_arguments:
+            if "=" in argument:
+                (key, value) = argument.split("=", 1)
+            else:
+                raise ValueError(
+                    f"each argument of a step must be key=value: got {argument}"
+                )
+            
+            try:
+                dict_parameters[key.strip()] = json.loads(value)
+            except ValueError:
+                dict_parameters[key.strip()] = value.strip()
+        
+        return (name.strip(), dict_parameters)
+    else:
+        raise ValueError(
+            f"each step must be a name, 'name:key=value,...' or [name, {{arguments}}]: got {step}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
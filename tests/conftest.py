@@ -0,0 +1,68 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "codefile")
+)
+
+import pyTCTK
+
+
+TEXTS = [
+    "Hello World! Visit https://example.com/page?id=3 or write to john.doe@mail.com",
+    "I'm a Data Scientist, @lprtk #NLP loves 2 cats and 3 dogs 😀🚀",
+    "Les enfants étaient allés à l'école, mangeant des pommes à Noël !",
+    "<p>The   dogs were   running quickly</p> and answered the questions",
+    "Ça été très ÉLÉGANT, les élèves présentent leurs expériences",
+    "",
+    "a b c d e f",
+    "The mice took the recommended books™ from the libraries",
+    "ok",
+    "ok",
+    "Hello World! Visit https://example.com/page?id=3 or write to john.doe@mail.com",
+]
+
+RECIPE = [
+    "lowercase",
+    "remove_url",
+    "remove_email",
+    "remove_html",
+    "remove_mention",
+    "remove_hastag",
+    "remove_emoji",
+    "remove_digit",
+    "remove_punctuation",
+    ("remove_accent", {"lowercase": False}),
+    ("remove_stopword", {"language": "english"}),
+    ("lemmatize", {"language": "english"}),
+    "remove_single_character",
+    "remove_whitespace",
+    "remove_space",
+]
+
+
+@pytest.fixture
+def corpus():
+    return pd.DataFrame({"Text": TEXTS, "Id": range(len(TEXTS))})
+
+
+def run_steps(data, column, steps):
+    """
+    Clean 'data' by calling the method of each step one by one, on the class
+    which defines it: the reference of the fused and optimized executions.
+    """
+    for step in steps:
+        (name, parameters) = (step, {}) if isinstance(step, str) else step
+        
+        for net in (pyTCTK.TextNet, pyTCTK.WordNet, pyTCTK.Tokenize):
+            if name in vars(net):
+                data = getattr(net(data, column), name)(**parameters)
+                break
+        else:
+            raise ValueError(f"unknown step: {name}")
+    
+    return data
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+pytest.importorskip("pyarrow")
+
+
+def values(series):
+    return [
+        value if isinstance(value, (str, list)) or not pd.isna(value) else None
+        for value in series.tolist()
+    ]
+
+
+@pytest.fixture
+def arrow_corpus():
+    return pd.DataFrame({"Text": pd.Series(TEXTS + [None], dtype="string[pyarrow]")})
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        RECIPE,
+        ["lowercase", "remove_url", "remove_email", "remove_digit", "remove_space"],
+        ["remove_html", "remove_mention", "remove_hastag", "remove_whitespace"],
+        ["remove_emoji", "remove_single_character", "remove_plural", "remove_punctuation"],
+        [("additional_cleaning", {"add_regexs": [r"\d+"]}), ("remove_accent", {"method": "unicode"})],
+    ]
+)
+def test_arrow_column_matches_object_column(arrow_corpus, steps):
+    expected = run_steps(arrow_corpus.astype(object), "Text", steps)
+    result = pyTCTK.Pipeline(steps=steps).transform(arrow_corpus.copy(), "Text")
+    by_step = run_steps(arrow_corpus, "Text", steps)
+    
+    assert str(result["Text"].dtype) == str(by_step["Text"].dtype) == "string"
+    assert values(result["Text"]) == values(by_step["Text"]) == values(expected["Text"])
+
+
+@pytest.mark.parametrize("min_words", [1, 2, 4])
+def test_word_count_filter_on_an_arrow_column(min_words):
+    data = pd.DataFrame({"Text": TEXTS})
+    expected = pyTCTK.TextNet(data.copy(), "Text").word_count_filter(min_words=min_words)
+    result = pyTCTK.TextNet(data.astype("string[pyarrow]"), "Text").word_count_filter(min_words=min_words)
+    
+    assert values(result["Text"]) == values(expected["Text"])
+
+
+def test_downcast_to_arrow(corpus):
+    pyTCTK.TextNet(corpus, "Text").downcast(arrow=True)
+    
+    assert str(corpus["Text"].dtype) == "string"
+    assert corpus["Text"].dtype.storage == "pyarrow"
+    assert values(corpus["Text"]) == TEXTS
+
+
+def test_word_tokenize_on_an_arrow_column(arrow_corpus):
+    expected = pyTCTK.Tokenize(arrow_corpus.astype(object), "Text").word_tokenize()
+    result = pyTCTK.Tokenize(arrow_corpus, "Text").word_tokenize()
+    
+    assert values(result["Text"]) == values(expected["Text"])
@@ -0,0 +1,66 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+async def clean_all(cleaner, texts):
+    async with cleaner:
+        return await asyncio.gather(*[cleaner.clean(text) for text in texts])
+
+
+@pytest.mark.parametrize("steps", [RECIPE, ["lowercase", "remove_punctuation", "word_tokenize"]])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_clean_matches_steps_one_by_one(steps, n_jobs):
+    texts = TEXTS * 20
+    expected = run_steps(pd.DataFrame({"Text": texts}), "Text", steps)["Text"].tolist()
+    cleaner = pyTCTK.AsyncCleaner(steps=steps, max_batch=16, n_jobs=n_jobs)
+    
+    assert asyncio.run(clean_all(cleaner, texts)) == expected
+
+
+def test_sentences_are_grouped_in_batches():
+    cleaner = pyTCTK.AsyncCleaner(steps=["lowercase"], max_batch=10, max_delay=1.0)
+    
+    result = asyncio.run(clean_all(cleaner, [f"Text {i}" for i in range(25)]))
+    
+    assert result == [f"text {i}" for i in range(25)]
+    assert cleaner.info()["requests"] == 25
+    assert cleaner.info()["batches"] == 3
+
+
+def test_deadline_cleans_a_partial_batch():
+    async def clean_one(cleaner):
+        return await asyncio.wait_for(cleaner.clean("Hello"), timeout=5)
+    
+    cleaner = pyTCTK.AsyncCleaner(steps=["lowercase"], max_batch=100, max_delay=0.01)
+    
+    assert asyncio.run(clean_one(cleaner)) == "hello"
+    assert cleaner.info()["batches"] == 1
+
+
+def test_missing_value_and_invalid_text():
+    cleaner = pyTCTK.AsyncCleaner(steps=["lowercase"])
+    
+    assert asyncio.run(clean_all(cleaner, [None, "A"])) == [None, "a"]
+    
+    with pytest.raises(TypeError):
+        asyncio.run(clean_all(cleaner, [1]))
+
+
+@pytest.mark.parametrize(
+    ("parameters", "error"),
+    [
+        ({"steps": ["unknown"]}, ValueError),
+        ({"steps": ["lowercase"], "max_batch": 0}, ValueError),
+        ({"steps": ["lowercase"], "max_delay": -1}, ValueError),
+        ({"steps": ["lowercase"], "max_delay": "1"}, TypeError),
+        ({"steps": ["lowercase"], "n_jobs": 0}, ValueError),
+    ]
+)
+def test_invalid_parameters_are_rejected(parameters, error):
+    with pytest.raises(error):
+        pyTCTK.AsyncCleaner(**parameters)
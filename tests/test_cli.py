@@ -0,0 +1,138 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE
+
+
+@pytest.fixture
+def input_path(tmp_path, corpus):
+    path = str(tmp_path / "input.csv")
+    corpus.to_csv(path, index=False)
+    
+    return path
+
+
+def test_steps_of_the_command_line_match_the_pipeline(tmp_path, input_path):
+    output_path = str(tmp_path / "output.csv")
+    expected_path = str(tmp_path / "expected.csv")
+    steps = [
+        "lowercase",
+        "remove_url",
+        'remove_stopword:language="french",add_stopwords=["hello","world"]',
+        "remove_accent:lowercase=false,method=unicode",
+        "remove_whitespace",
+    ]
+    
+    code = pyTCTK.main(
+        [input_path, output_path, "--column", "Text", "--steps", *steps, "--chunksize", "4"]
+    )
+    pyTCTK.Pipeline(
+        steps=[
+            "lowercase",
+            "remove_url",
+            ("remove_stopword", {"language": "french", "add_stopwords": ["hello", "world"]}),
+            ("remove_accent", {"lowercase": False, "method": "unicode"}),
+            "remove_whitespace",
+        ]
+    ).transform_file(input_path, expected_path, "Text")
+    
+    assert code == 0
+    assert open(output_path).read() == open(expected_path).read()
+
+
+def test_config_file_matches_the_pipeline(tmp_path, input_path, capsys):
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, "w") as file:
+        json.dump(
+            {
+                "column": "Text",
+                "steps": [step if isinstance(step, str) else list(step) for step in RECIPE],
+                "workers": 2,
+                "dedup": True,
+                "cache": str(tmp_path / "cache.sqlite")
+            },
+            file
+        )
+    
+    code = pyTCTK.main([input_path, str(tmp_path / "output.jsonl"), "--config", config_path, "--profile"])
+    pyTCTK.Pipeline(steps=RECIPE).transform_file(input_path, str(tmp_path / "expected.jsonl"), "Text")
+    
+    assert code == 0
+    assert open(tmp_path / "output.jsonl").read() == open(tmp_path / "expected.jsonl").read()
+    assert "Rows/s" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ["--steps", "lowercase"],
+        ["--column", "Text"],
+        ["--column", "Missing", "--steps", "lowercase"],
+        ["--column", "Text", "--steps", "unknown"],
+        ["--column", "Text", "--steps", "remove_stopword:language=german"],
+        ["--column", "Text", "--steps", "lowercase:unknown=1"],
+        ["--column", "Text", "--steps", "lowercase", "--chunksize", "0"],
+        ["--column", "Text", "--steps", "lowercase", "--cache", "/nonexistent/folder/cache.sqlite"],
+        ["--column", "Text", "--steps", "lowercase", "--config", "/nonexistent/config.json"],
+    ]
+)
+def test_invalid_arguments_exit_with_code_2(tmp_path, input_path, arguments, capsys):
+    output_path = tmp_path / "output.csv"
+    output_path.write_text("previous")
+    
+    with pytest.raises(SystemExit) as error:
+        pyTCTK.main([input_path, str(output_path), *arguments])
+    
+    assert error.value.code == 2
+    assert "error" in capsys.readouterr().err
+    assert output_path.read_text() == "previous"
+
+
+def test_missing_input_file_exits_with_code_2(tmp_path):
+    with pytest.raises(SystemExit) as error:
+        pyTCTK.main(
+            [str(tmp_path / "missing.csv"), str(tmp_path / "output.csv"), "--column", "Text", "--steps", "lowercase"]
+        )
+    
+    assert error.value.code == 2
+
+
+def test_script_exit_codes(tmp_path, input_path):
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "codefile", "pyTCTK.py")
+    command = [sys.executable, script, input_path, str(tmp_path / "output.csv"), "--steps", "lowercase"]
+    
+    assert subprocess.run(command + ["--column", "Text"], capture_output=True).returncode == 0
+    assert subprocess.run(command + ["--column", "Missing"], capture_output=True).returncode == 2
+
+
+@pytest.mark.parametrize(
+    ("step", "expected"),
+    [
+        ("lowercase", "lowercase"),
+        (["remove_plural", {"word_length": 3}], ("remove_plural", {"word_length": 3})),
+        ("remove_plural:word_length=3", ("remove_plural", {"word_length": 3})),
+        (
+            'remove_stopword:language="french",add_stopwords=["foo","bar"]',
+            ("remove_stopword", {"language": "french", "add_stopwords": ["foo", "bar"]})
+        ),
+        (
+            "remove_stopword: language = french , remove_stopwords = [\"a\", \"b\"]",
+            ("remove_stopword", {"language": "french", "remove_stopwords": ["a", "b"]})
+        ),
+        ('additional_cleaning:add_regexs=["a,b=c"]', ("additional_cleaning", {"add_regexs": ["a,b=c"]})),
+    ]
+)
+def test_parse_step(step, expected):
+    assert pyTCTK._parse_step(step) == expected
+
+
+@pytest.mark.parametrize("step", ["lowercase:x", ["lowercase"], 1])
+def test_parse_invalid_step(step):
+    with pytest.raises(ValueError):
+        pyTCTK._parse_step(step)
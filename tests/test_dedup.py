@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+@pytest.fixture
+def duplicated_corpus():
+    return pd.DataFrame({"Text": (TEXTS + [None]) * 5})
+
+
+@pytest.mark.parametrize("category", [False, True])
+def test_pipeline_with_dedup_matches_steps_one_by_one(duplicated_corpus, category):
+    if category == True:
+        pyTCTK.TextNet(duplicated_corpus, "Text").downcast(category=True)
+    else:
+        pass
+    
+    expected = run_steps(duplicated_corpus.copy(), "Text", RECIPE)
+    result = pyTCTK.Pipeline(steps=RECIPE, dedup=True).transform(duplicated_corpus, "Text")
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("net", "name", "parameters"),
+    [
+        (pyTCTK.TextNet, "remove_url", {}),
+        (pyTCTK.TextNet, "remove_plural", {}),
+        (pyTCTK.WordNet, "remove_stopword", {"language": "french"}),
+        (pyTCTK.WordNet, "lemmatize", {}),
+        (pyTCTK.Tokenize, "word_tokenize", {}),
+    ]
+)
+def test_method_with_dedup_matches_without(duplicated_corpus, net, name, parameters):
+    expected = getattr(net(duplicated_corpus.copy(), "Text"), name)(**parameters)
+    result = getattr(net(duplicated_corpus, "Text", dedup=True), name)(**parameters)
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_duplicated_rows_do_not_share_their_lists(duplicated_corpus):
+    result = pyTCTK.Tokenize(duplicated_corpus, "Text", dedup=True).word_tokenize()
+    result["Text"].iloc[0].append("changed")
+    
+    assert result["Text"].iloc[len(TEXTS) + 1][-1] != "changed"
+
+
+def test_empty_column_with_dedup():
+    data = pd.DataFrame({"Text": pd.Series([], dtype=object)})
+    result = pyTCTK.TextNet(data, "Text", dedup=True).lowercase()
+    
+    assert result.shape == (0, 1)
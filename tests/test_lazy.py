@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, run_steps
+
+
+PLANS = [
+    RECIPE,
+    [
+        "lowercase",
+        ("remove_stopword", {"language": "french"}),
+        "lowercase",
+        ("lemmatize", {"language": "french"}),
+        ("stemmatize", {"remove_accents": True}),
+    ],
+    ["remove_space", "remove_space", "remove_whitespace", "remove_digit", "remove_emoji"],
+    ["remove_mention", "remove_hastag", ("additional_cleaning", {"add_regexs": [r"\bok\b"]}), "remove_space"],
+    ["lowercase", "remove_url", ("word_count_filter", {"min_words": 3}), "remove_punctuation"],
+    [("word_count_filter", {"min_words": 2}), "remove_html", ("word_count_filter", {"min_words": 4})],
+    ["remove_punctuation", "word_tokenize"],
+]
+
+
+def lazy_plan(data, steps):
+    lazy = pyTCTK.LazyNet(data, "Text")
+    
+    for step in steps:
+        (name, parameters) = (step, {}) if isinstance(step, str) else step
+        getattr(lazy, name)(**parameters)
+    
+    return lazy
+
+
+@pytest.mark.parametrize("steps", PLANS)
+@pytest.mark.parametrize("optimize", [True, False])
+def test_collect_matches_steps_one_by_one(corpus, steps, optimize):
+    expected = run_steps(corpus.copy(), "Text", steps)
+    result = lazy_plan(corpus, steps).collect(optimize=optimize)
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_optimizer_removes_redundant_steps(corpus):
+    plan = lazy_plan(corpus, ["lowercase", "remove_space", "remove_space", "remove_stopword"])
+    
+    assert [name for (name, parameters) in plan.explain(optimize=False)] == [
+        "lowercase", "remove_space", "remove_space", "remove_stopword"
+    ]
+    assert [name for (name, parameters) in plan.explain()] == ["lowercase", "remove_space", "remove_stopword"]
+    assert plan.explain()[-1][1]["lowercased"] == True
+
+
+def test_word_count_filter_moves_before_the_steps_which_keep_the_spaces(corpus):
+    plan = lazy_plan(corpus, ["lowercase", "remove_url", ("word_count_filter", {"min_words": 3})])
+    
+    assert plan.explain()[0][0] == "word_count_filter"
+
+
+def test_nothing_runs_before_collect(corpus):
+    original = corpus.copy()
+    lazy = pyTCTK.TextNet(corpus, "Text").lazy().lowercase().remove_punctuation()
+    
+    pd.testing.assert_frame_equal(corpus, original)
+    
+    expected = run_steps(original, "Text", ["lowercase", "remove_punctuation"])
+    pd.testing.assert_frame_equal(lazy.collect(), expected)
+
+
+@pytest.mark.parametrize(
+    ("name", "parameters", "error"),
+    [
+        ("remove_stopword", {"language": "german"}, ValueError),
+        ("lemmatize", {"lowercase": "yes"}, TypeError),
+        ("word_count_filter", {"min_words": "2"}, TypeError),
+        ("lowercase", {"unknown": 1}, TypeError),
+    ]
+)
+def test_invalid_arguments_are_rejected_when_called(corpus, name, parameters, error):
+    with pytest.raises(error):
+        getattr(pyTCTK.LazyNet(corpus, "Text"), name)(**parameters)
@@ -0,0 +1,125 @@
+import os
+import struct
+import sys
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import TEXTS, run_steps
+
+
+@pytest.fixture(scope="module")
+def english_table(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tables") / "english.table")
+    
+    return pyTCTK.LemmaTable.build(
+        entries=os.path.join(pyTCTK.lexicons.path, "lemme", "english.txt"),
+        path=path,
+        encoding="cp1252"
+    )
+
+
+@pytest.fixture(scope="module")
+def french_table(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tables") / "french.table")
+    
+    return pyTCTK.LemmaTable.build(
+        entries=os.path.join(pyTCTK.lexicons.path, "lemme", "french.txt"),
+        path=path,
+        encoding="cp1252"
+    )
+
+
+@pytest.mark.parametrize("language", ["english", "french"])
+@pytest.mark.parametrize("lowercase", [True, False])
+def test_table_matches_the_bundled_lexicon(request, corpus, language, lowercase):
+    table = request.getfixturevalue(f"{language}_table")
+    expected = run_steps(corpus.copy(), "Text", [("lemmatize", {"language": language, "lowercase": lowercase})])
+    
+    for lexicon in [table, table.path]:
+        result = pyTCTK.WordNet(corpus.copy(), "Text").lemmatize(lowercase=lowercase, lexicon=lexicon)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_table_in_a_pipeline_with_processes_and_a_lazy_plan(tmp_path, english_table):
+    data = pd.DataFrame({"Text": [f"{text} {i}" for i in range(100) for text in TEXTS]})
+    steps = ["lowercase", ("lemmatize", {"lexicon": english_table.path}), "remove_punctuation"]
+    expected = run_steps(data.copy(), "Text", steps)
+    cache = pyTCTK.ResultCache(path=str(tmp_path / "cache.sqlite"))
+    
+    lazy = pyTCTK.LazyNet(data.copy(), "Text").lowercase().lemmatize(lexicon=english_table.path)
+    
+    pd.testing.assert_frame_equal(pyTCTK.Pipeline(steps=steps, n_jobs=2).transform(data.copy(), "Text"), expected)
+    pd.testing.assert_frame_equal(pyTCTK.Pipeline(steps=steps, cache=cache).transform(data.copy(), "Text"), expected)
+    pd.testing.assert_frame_equal(lazy.remove_punctuation().collect(), expected)
+    cache.close()
+
+
+def test_get_and_build_from_pairs(tmp_path):
+    table = pyTCTK.LemmaTable.build(
+        entries=[("Mice", "mouse"), ("mice", "other"), ("été", "être"), (r"\btook\b", "take")],
+        path=str(tmp_path / "small.table")
+    )
+    
+    assert len(table) == 3
+    assert (table.get("MICE"), table.get("Été"), table.get("took")) == ("mouse", "être", "take")
+    assert (table.get("unknown"), table.get("unknown", "x"), table.get("")) == (None, "x", None)
+    assert table.traits == (True, True)
+    assert table.lemmatize("The mice took it") == "The mouse take it"
+
+
+def test_rebuilt_file_is_mapped_again(tmp_path):
+    path = str(tmp_path / "small.table")
+    data = pd.DataFrame({"Text": ["mice"]})
+    
+    pyTCTK.LemmaTable.build(entries={"mice": "mouse"}, path=path)
+    assert pyTCTK.WordNet(data.copy(), "Text").lemmatize(lexicon=path)["Text"].tolist() == ["mouse"]
+    
+    pyTCTK.LemmaTable.build(entries={"mice": "souris", "x": "y"}, path=path)
+    assert pyTCTK.WordNet(data.copy(), "Text").lemmatize(lexicon=path)["Text"].tolist() == ["souris"]
+
+
+def header(magic=b"PYTCTKLT", version=1, flags=0, count=0, size=2):
+    return struct.pack("<8sIIQQ16s", magic, version, flags, count, size, bytes(16))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"PYTCTKLT",
+        header(magic=b"NOTTABLE"),
+        header(version=2),
+        header(flags=0 if sys.byteorder == "big" else 4),
+    ]
+)
+def test_malformed_header_is_rejected(tmp_path, content):
+    path = tmp_path / "bad.table"
+    path.write_bytes(content + bytes(64))
+    
+    with pytest.raises(ValueError):
+        pyTCTK.LemmaTable(path=str(path))
+
+
+def test_text_file_is_rejected():
+    with pytest.raises(ValueError):
+        pyTCTK.LemmaTable(path=os.path.join(pyTCTK.lexicons.path, "lemme", "english.txt"))
+
+
+@pytest.mark.parametrize(
+    ("entries", "error"),
+    [({"two words": "x"}, ValueError), ({"word": 1}, ValueError), (1, TypeError)]
+)
+def test_invalid_entries_are_rejected(tmp_path, entries, error):
+    with pytest.raises(error):
+        pyTCTK.LemmaTable.build(entries=entries, path=str(tmp_path / "bad.table"))
+
+
+@pytest.mark.parametrize(
+    ("parameters", "error"),
+    [({"lexicon": 1}, TypeError), ({"lexicon": ["x"]}, TypeError)]
+)
+def test_invalid_lexicon_is_rejected(corpus, parameters, error):
+    with pytest.raises(error):
+        pyTCTK.WordNet(corpus, "Text").lemmatize(**parameters)
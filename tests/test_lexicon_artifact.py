@@ -0,0 +1,114 @@
+import os
+import pickle
+import shutil
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import run_steps
+
+
+LEXICONS = [
+    ("accents", "accents"),
+    ("lemme", "english"),
+    ("lemme", "french"),
+    ("stemme", "english"),
+    ("stemme", "french"),
+    ("stopwords", "english"),
+    ("stopwords", "french"),
+]
+
+STEPS = [
+    [("lemmatize", {"language": "french", "remove_accents": True})],
+    [("lemmatize", {"language": "english", "lowercase": False})],
+    [("stemmatize", {"language": "french"})],
+    [("stemmatize", {"language": "english", "remove_accents": True})],
+    [("remove_stopword", {"language": "french", "remove_accents": True})],
+    [("remove_stopword", {"language": "english"})],
+    [("remove_accent", {"method": "translate"})],
+    [("remove_accent", {"method": "regex", "lowercase": False})],
+]
+
+
+@pytest.fixture
+def ressources(tmp_path):
+    path = str(tmp_path / "ressources")
+    shutil.copytree(pyTCTK.lexicons.path, path, ignore=shutil.ignore_patterns("*.pickle"))
+    pyTCTK.LexiconCache(path=path, allow_download=False, precompiled=False).compile()
+    
+    return path
+
+
+def test_compiled_lexicons_match_the_sources(ressources):
+    source = pyTCTK.LexiconCache(path=ressources, allow_download=False, precompiled=False)
+    compiled = pyTCTK.LexiconCache(path=ressources, allow_download=False)
+    
+    assert os.path.isfile(os.path.join(ressources, "lexicons.pickle"))
+    assert set(LEXICONS) <= set(compiled._artifact)
+    
+    for (kind, name) in LEXICONS:
+        assert compiled.get(kind=kind, name=name) == source.get(kind=kind, name=name)
+        assert compiled.version(kind=kind, name=name) == source.version(kind=kind, name=name)
+
+
+@pytest.mark.parametrize("steps", STEPS)
+def test_methods_with_the_compiled_lexicons_match(monkeypatch, corpus, ressources, steps):
+    expected = run_steps(corpus.copy(), "Text", steps)
+    monkeypatch.setattr(pyTCTK, "lexicons", pyTCTK.LexiconCache(path=ressources, allow_download=False))
+    
+    pd.testing.assert_frame_equal(run_steps(corpus, "Text", steps), expected)
+    assert pyTCTK.lexicons._compiled
+
+
+def test_stale_entries_are_ignored(monkeypatch, ressources):
+    with open(os.path.join(ressources, "lemme", "english.txt"), "a", newline="") as file:
+        file.write("\\bzzword\\b zzlemma\r\n")
+    
+    compiled = pyTCTK.LexiconCache(path=ressources, allow_download=False)
+    
+    assert ("lemme", "english") not in compiled._artifact
+    assert ("lemme", "french") in compiled._artifact
+    
+    monkeypatch.setattr(pyTCTK, "lexicons", compiled)
+    data = pyTCTK.WordNet(pd.DataFrame({"Text": ["zzword allowed"]}), "Text").lemmatize()
+    
+    assert data["Text"].tolist() == ["zzlemma allow"]
+
+
+def test_missing_source_keeps_the_entries(ressources):
+    expected = pyTCTK.lexicons.get(kind="lemme", name="french")
+    os.remove(os.path.join(ressources, "lemme", "french.txt"))
+    
+    compiled = pyTCTK.LexiconCache(path=ressources, allow_download=False)
+    
+    assert compiled.get(kind="lemme", name="french") == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not a pickle",
+        b"",
+        pickle.dumps({"version": 0, "sources": {}, "entries": {}}),
+        pickle.dumps({"version": 1, "sources": {}, "entries": {}, "code": os.system}),
+    ]
+)
+def test_invalid_file_is_not_loaded(ressources, content):
+    with open(os.path.join(ressources, "lexicons.pickle"), "wb") as file:
+        file.write(content)
+    
+    cache = pyTCTK.LexiconCache(path=ressources, allow_download=False)
+    
+    assert cache.load() == False
+    assert cache._artifact == {}
+    assert cache.get(kind="stopwords", name="english") == pyTCTK.lexicons.get(kind="stopwords", name="english")
+
+
+@pytest.mark.parametrize(
+    ("parameters", "error"),
+    [({"path": 1}, TypeError), ({"allow_download": "no"}, TypeError), ({"precompiled": 1}, TypeError)]
+)
+def test_invalid_parameters_are_rejected(parameters, error):
+    with pytest.raises(error):
+        pyTCTK.LexiconCache(**parameters)
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+@pytest.fixture
+def large_corpus():
+    return pd.DataFrame({"Text": [f"{text} {i}" for i in range(50) for text in TEXTS]})
+
+
+@pytest.mark.parametrize("max_memory", [1, 5000, 10 ** 9])
+def test_pipeline_under_a_budget_matches_steps_one_by_one(large_corpus, max_memory):
+    expected = run_steps(large_corpus.copy(), "Text", RECIPE)
+    pipeline = pyTCTK.Pipeline(steps=RECIPE, max_memory=max_memory)
+    
+    pd.testing.assert_frame_equal(pipeline.transform(large_corpus, "Text"), expected)
+    assert pipeline.memory_info()["chunk_rows"] * pipeline.memory_info()["chunks"] >= expected.shape[0]
+
+
+@pytest.mark.parametrize("name", ["lowercase", "word_count_filter"])
+def test_method_under_a_budget_runs_by_chunks(large_corpus, name):
+    expected = getattr(pyTCTK.TextNet(large_corpus.copy(), "Text"), name)()
+    net = pyTCTK.TextNet(large_corpus, "Text", max_memory=100)
+    
+    pd.testing.assert_frame_equal(getattr(net, name)(), expected)
+    assert net.memory_info()["chunks"] > 1
+
+
+def test_empty_column_under_a_budget():
+    net = pyTCTK.TextNet(pd.DataFrame({"Text": pd.Series([], dtype=object)}), "Text", max_memory=100)
+    
+    assert net.word_count_filter().shape == (0, 1)
+
+
+@pytest.mark.parametrize(("max_memory", "error"), [(0, ValueError), ("1", TypeError)])
+def test_invalid_max_memory_is_rejected(corpus, max_memory, error):
+    with pytest.raises(error):
+        pyTCTK.TextNet(corpus, "Text", max_memory=max_memory)
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+@pytest.fixture
+def large_corpus():
+    # more rows than _PARALLEL_MIN_ROWS, so that the pool is really used
+    texts = [f"{text} row {i}" for i in range(200) for text in TEXTS]
+    
+    return pd.DataFrame({"Text": texts}, index=range(len(texts) * 2, 0, -2))
+
+
+def test_pipeline_with_processes_matches_steps_one_by_one(large_corpus):
+    expected = run_steps(large_corpus.copy(), "Text", RECIPE)
+    result = pyTCTK.Pipeline(steps=RECIPE, n_jobs=2).transform(large_corpus, "Text")
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("net", "name", "parameters"),
+    [
+        (pyTCTK.TextNet, "remove_emoji", {}),
+        (pyTCTK.TextNet, "remove_accent", {"method": "unicode"}),
+        (pyTCTK.WordNet, "lemmatize", {"language": "french"}),
+        (pyTCTK.WordNet, "stemmatize", {"language": "english"}),
+        (pyTCTK.Tokenize, "word_tokenize", {}),
+    ]
+)
+def test_method_with_processes_matches_one_process(large_corpus, net, name, parameters):
+    expected = getattr(net(large_corpus.copy(), "Text"), name)(**parameters)
+    result = getattr(net(large_corpus, "Text", n_jobs=2), name)(**parameters)
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("n_jobs", "error"),
+    [(0, ValueError), (-2, ValueError), (1.5, TypeError), (True, TypeError)]
+)
+def test_invalid_n_jobs_is_rejected(corpus, n_jobs, error):
+    with pytest.raises(error):
+        pyTCTK.TextNet(corpus, "Text", n_jobs=n_jobs)
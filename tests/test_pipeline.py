@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        RECIPE,
+        ["lowercase", "remove_punctuation", "word_tokenize"],
+        ["word_tokenize", "word_detokenize", "remove_space"],
+        [("remove_stopword", {"language": "french"}), ("stemmatize", {"language": "french"})],
+        [("remove_accent", {"method": "regex"}), ("remove_plural", {"word_length": 4})],
+        [("additional_cleaning", {"add_regexs": [r"\bok\b"]}), "remove_whitespace"],
+    ]
+)
+def test_transform_matches_steps_one_by_one(corpus, steps):
+    expected = run_steps(corpus.copy(), "Text", steps)
+    result = pyTCTK.Pipeline(steps=steps).transform(corpus, "Text")
+    
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_transform_iter_matches_transform():
+    pipeline = pyTCTK.Pipeline(steps=RECIPE)
+    expected = pipeline.transform(pd.DataFrame({"Text": TEXTS}), "Text")["Text"].tolist()
+    
+    assert list(pipeline.transform_iter(TEXTS + [None])) == expected + [None]
+
+
+def test_transform_keeps_missing_values():
+    data = pd.DataFrame({"Text": ["Hello World", None, "Bye"]})
+    result = pyTCTK.Pipeline(steps=["lowercase", "remove_space"]).transform(data, "Text")
+    
+    assert result["Text"].tolist()[0] == "hello world"
+    assert pd.isna(result["Text"].iloc[1])
+
+
+def test_transform_inplace_false_keeps_the_input(corpus):
+    original = corpus.copy()
+    result = pyTCTK.Pipeline(steps=RECIPE).transform(corpus, "Text", inplace=False)
+    
+    pd.testing.assert_frame_equal(corpus, original)
+    pd.testing.assert_frame_equal(result, run_steps(original, "Text", RECIPE))
+
+
+def test_profile_report_has_one_row_per_step(corpus):
+    pipeline = pyTCTK.Pipeline(steps=RECIPE)
+    pipeline.transform(corpus, "Text", profile=True)
+    
+    assert pipeline.report()["Step"].tolist() == [
+        step if isinstance(step, str) else step[0] for step in RECIPE
+    ]
+
+
+@pytest.mark.parametrize(
+    ("steps", "error"),
+    [
+        ("lowercase", TypeError),
+        ([("lowercase", "x")], TypeError),
+        (["downcast"], ValueError),
+        (["unknown"], ValueError),
+        ([("remove_stopword", {"language": "german"})], ValueError),
+        ([("remove_stopword", {"lowercase": "yes"})], TypeError),
+        ([("lowercase", {"unknown": 1})], TypeError),
+    ]
+)
+def test_invalid_steps_are_rejected(steps, error):
+    with pytest.raises(error):
+        pyTCTK.Pipeline(steps=steps)
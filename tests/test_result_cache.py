@@ -0,0 +1,128 @@
+import pickle
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE, TEXTS, run_steps
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = pyTCTK.ResultCache(path=str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_cold_and_warm_runs_match_steps_one_by_one(corpus, cache):
+    expected = run_steps(corpus.copy(), "Text", RECIPE)
+    pipeline = pyTCTK.Pipeline(steps=RECIPE, cache=cache)
+    
+    cold = pipeline.transform(corpus.copy(), "Text")
+    misses = cache.info()["misses"]
+    warm = pipeline.transform(corpus.copy(), "Text")
+    
+    pd.testing.assert_frame_equal(cold, expected)
+    pd.testing.assert_frame_equal(warm, expected)
+    assert cache.info()["misses"] == misses
+    assert cache.info()["hits"] == len(set(TEXTS))
+
+
+def test_other_parameters_are_not_read_from_the_cache(cache):
+    data = pd.DataFrame({"Text": ["Les enfants étaient allés"]})
+    pyTCTK.WordNet(data.copy(), "Text", cache=cache).lemmatize(language="french")
+    
+    result = pyTCTK.WordNet(data.copy(), "Text", cache=cache).lemmatize(language="english")
+    
+    assert result["Text"].tolist() == pyTCTK.WordNet(data.copy(), "Text").lemmatize(language="english")["Text"].tolist()
+    assert cache.info()["hits"] == 0
+
+
+def test_cached_lists_are_not_shared(corpus, cache):
+    pyTCTK.Tokenize(corpus.copy(), "Text", cache=cache).word_tokenize()
+    result = pyTCTK.Tokenize(corpus.copy(), "Text", cache=cache).word_tokenize()
+    result["Text"].iloc[0].append("changed")
+    
+    assert result["Text"].iloc[len(TEXTS) - 1][-1] != "changed"
+
+
+def test_missing_values_are_kept(cache):
+    data = pd.DataFrame({"Text": ["Hello", None, "Hello"]})
+    pyTCTK.TextNet(data.copy(), "Text", cache=cache).lowercase()
+    
+    result = pyTCTK.TextNet(data, "Text", cache=cache).lowercase()
+    
+    assert result["Text"].tolist()[::2] == ["hello", "hello"]
+    assert pd.isna(result["Text"].iloc[1])
+
+
+@pytest.mark.parametrize("limit", [{"max_rows": 3}, {"max_bytes": 60}])
+def test_eviction_keeps_the_totals(tmp_path, corpus, limit):
+    path = str(tmp_path / "cache.sqlite")
+    cache = pyTCTK.ResultCache(path=path, **limit)
+    
+    for step in ["lowercase", "remove_url", "remove_punctuation"]:
+        pyTCTK.TextNet(corpus.copy(), "Text", cache=cache).__getattribute__(step)()
+    
+    info = cache.info()
+    cache.close()
+    (rows, size) = sqlite3.connect(path).execute("SELECT COUNT(*), SUM(size) FROM results").fetchone()
+    
+    assert (info["rows"], info["bytes"]) == (rows, size)
+    assert rows <= limit.get("max_rows", rows) and size <= limit.get("max_bytes", size)
+
+
+def test_read_sentences_are_evicted_last(cache):
+    cache.max_rows = 2
+    cache.put_many([(b"a" * 16, "a")])
+    cache.put_many([(b"b" * 16, "b")])
+    cache.get_many([b"a" * 16])
+    cache.put_many([(b"c" * 16, "c")])
+    
+    assert sorted(cache.get_many([b"a" * 16, b"b" * 16, b"c" * 16]).values()) == ["a", "c"]
+
+
+def test_file_of_a_previous_version_is_counted(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE results "
+        "(key BLOB PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+    )
+    connection.executemany(
+        "INSERT INTO results VALUES (?, ?, ?, ?)",
+        [(bytes([i]) * 16, "ab", 2, i) for i in range(10)]
+    )
+    connection.commit()
+    connection.close()
+    
+    cache = pyTCTK.ResultCache(path=path, max_rows=5)
+    assert (cache.info()["rows"], cache.info()["bytes"]) == (10, 20)
+    
+    cache.put_many([(b"z" * 16, "abc")])
+    assert (cache.info()["rows"], cache.info()["bytes"]) == (5, 11)
+    cache.close()
+
+
+def test_clear_and_pickle(corpus, cache):
+    pyTCTK.TextNet(corpus.copy(), "Text", cache=cache).lowercase()
+    
+    assert pickle.loads(pickle.dumps(cache)).info()["rows"] == len(set(TEXTS))
+    
+    cache.clear()
+    assert (cache.info()["rows"], cache.info()["bytes"], cache.info()["hits"]) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [{"path": 1}, {"path": "x.sqlite", "max_rows": 0}, {"path": "x.sqlite", "max_bytes": "1"}]
+)
+def test_invalid_parameters_are_rejected(parameters):
+    with pytest.raises(TypeError):
+        pyTCTK.ResultCache(**parameters)
+
+
+def test_cache_must_be_a_result_cache(corpus):
+    with pytest.raises(TypeError):
+        pyTCTK.TextNet(corpus, "Text", cache="cache.sqlite")
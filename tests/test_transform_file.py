@@ -0,0 +1,164 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import pyTCTK
+from conftest import RECIPE
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def write(data, path):
+    if path.endswith(".csv"):
+        data.to_csv(path, index=False)
+    elif path.endswith(".jsonl"):
+        data.to_json(path, orient="records", lines=True, force_ascii=False)
+    else:
+        data.to_parquet(path, index=False)
+
+
+def read(path):
+    if path.endswith(".csv"):
+        return pd.read_csv(path, dtype={"Text": str})
+    elif path.endswith(".jsonl"):
+        return pd.read_json(path, lines=True, dtype={"Text": object})
+    else:
+        return pd.read_parquet(path)
+
+
+@pytest.mark.parametrize("input_format", ["csv", "jsonl", "parquet"])
+@pytest.mark.parametrize("output_format", ["csv", "jsonl", "parquet"])
+def test_transform_file_matches_transform(tmp_path, corpus, input_format, output_format):
+    input_path = str(tmp_path / f"input.{input_format}")
+    output_path = str(tmp_path / f"output.{output_format}")
+    expected_path = str(tmp_path / f"expected.{output_format}")
+    write(corpus, input_path)
+    pipeline = pyTCTK.Pipeline(steps=RECIPE)
+    
+    rows = pipeline.transform_file(input_path, output_path, "Text", chunksize=3)
+    # a csv file does not tell an empty string from a missing value
+    write(pipeline.transform(read(input_path), "Text"), expected_path)
+    
+    assert rows == corpus.shape[0]
+    pd.testing.assert_frame_equal(read(output_path), read(expected_path))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_numeric_first_chunk_of_a_csv_file(tmp_path):
+    (tmp_path / "input.csv").write_text("Text,Id\n1,1\n2,2\nHello World!,3\n,4\n")
+    
+    pyTCTK.Pipeline(steps=["lowercase", "remove_punctuation"]).transform_file(
+        str(tmp_path / "input.csv"), str(tmp_path / "output.csv"), "Text", chunksize=2
+    )
+    
+    assert (tmp_path / "output.csv").read_text() == "Text,Id\n1,1\n2,2\nhello world,3\n,4\n"
+
+
+def test_numeric_values_of_a_jsonl_file_stay_integers(tmp_path):
+    (tmp_path / "input.jsonl").write_text('{"Text": 1}\n{"Text": null}\n{"Text": "A!"}\n{"Id": 4}\n')
+    
+    pyTCTK.Pipeline(steps=["lowercase", "remove_punctuation"]).transform_file(
+        str(tmp_path / "input.jsonl"), str(tmp_path / "output.jsonl"), "Text", chunksize=2
+    )
+    
+    lines = (tmp_path / "output.jsonl").read_text().splitlines()
+    assert [json.loads(line)["Text"] for line in lines] == ["1", None, "a", None]
+
+
+@pytest.mark.parametrize("steps", [["lowercase"], ["lowercase", "word_tokenize"]])
+def test_null_first_chunk_of_a_parquet_file(tmp_path, steps):
+    table = pa.table({"Text": pa.array([None, None, "A b!", "C"], pa.string()), "Id": [1, 2, 3, 4]})
+    pq.write_table(table, str(tmp_path / "input.parquet"), row_group_size=2)
+    pipeline = pyTCTK.Pipeline(steps=steps)
+    
+    pipeline.transform_file(
+        str(tmp_path / "input.parquet"), str(tmp_path / "output.parquet"), "Text", chunksize=2
+    )
+    
+    result = pq.read_table(str(tmp_path / "output.parquet"))
+    expected = pipeline.transform_iter([None, None, "A b!", "C"])
+    assert result.column("Text").to_pylist() == list(expected)
+    assert result.column("Id").to_pylist() == [1, 2, 3, 4]
+
+
+def test_integer_column_of_a_parquet_file(tmp_path):
+    pq.write_table(pa.table({"Text": pa.array([1, None, 3])}), str(tmp_path / "input.parquet"))
+    
+    pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+        str(tmp_path / "input.parquet"), str(tmp_path / "output.parquet"), "Text"
+    )
+    
+    assert pq.read_table(str(tmp_path / "output.parquet")).column("Text").to_pylist() == ["1", None, "3"]
+
+
+@pytest.mark.parametrize(
+    ("output_format", "expected"),
+    [("csv", "Text,Id\n"), ("jsonl", ""), ("parquet", None)]
+)
+def test_empty_parquet_file_replaces_the_output(tmp_path, output_format, expected):
+    table = pa.table({"Text": pa.array([], pa.string()), "Id": pa.array([], pa.int64())})
+    pq.write_table(table, str(tmp_path / "input.parquet"))
+    output_path = tmp_path / f"output.{output_format}"
+    output_path.write_text("stale")
+    
+    rows = pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+        str(tmp_path / "input.parquet"), str(output_path), "Text"
+    )
+    
+    assert rows == 0
+    if expected is None:
+        schema = pq.read_schema(str(output_path))
+        assert (schema.names, schema.field("Text").type) == (["Text", "Id"], pa.string())
+    else:
+        assert output_path.read_text() == expected
+
+
+def test_empty_jsonl_file_writes_an_empty_parquet_file(tmp_path):
+    (tmp_path / "input.jsonl").write_text("")
+    
+    rows = pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+        str(tmp_path / "input.jsonl"), str(tmp_path / "output.parquet"), "Text"
+    )
+    
+    assert rows == 0
+    assert pq.read_table(str(tmp_path / "output.parquet")).num_rows == 0
+
+
+def test_header_only_csv_file(tmp_path):
+    (tmp_path / "input.csv").write_text("Text,Id\n")
+    
+    rows = pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+        str(tmp_path / "input.csv"), str(tmp_path / "output.csv"), "Text"
+    )
+    
+    assert rows == 0
+    assert (tmp_path / "output.csv").read_text() == "Text,Id\n"
+
+
+def test_failure_keeps_the_output(tmp_path, corpus):
+    write(corpus, str(tmp_path / "input.csv"))
+    (tmp_path / "output.csv").write_text("previous")
+    
+    with pytest.raises(ValueError):
+        pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+            str(tmp_path / "input.csv"), str(tmp_path / "output.csv"), "Missing"
+        )
+    
+    assert (tmp_path / "output.csv").read_text() == "previous"
+    assert sorted(os.listdir(tmp_path)) == ["input.csv", "output.csv"]
+
+
+@pytest.mark.parametrize(
+    ("parameters", "error"),
+    [({"chunksize": 0}, TypeError), ({"input_format": "xml"}, ValueError), ({"profile": 1}, TypeError)]
+)
+def test_invalid_parameters_are_rejected(tmp_path, corpus, parameters, error):
+    write(corpus, str(tmp_path / "input.csv"))
+    
+    with pytest.raises(error):
+        pyTCTK.Pipeline(steps=["lowercase"]).transform_file(
+            str(tmp_path / "input.csv"), str(tmp_path / "output.csv"), "Text", **parameters
+        )